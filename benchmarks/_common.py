@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import timeit
+import typing as t
+
+REPEAT = 5
+
+
+def measure(
+    func: t.Callable[[], object],
+    *,
+    number: t.Optional[int] = None,
+    repeat: int = REPEAT,
+) -> float:
+    """Return the best time of a single ``func`` call in nanoseconds."""
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def report(title: str, results: t.Mapping[str, float]) -> None:
+    """Print measurements (nanoseconds) as aligned table."""
+    width = max(map(len, results), default=0)
+    print(title)
+    for name, ns in results.items():
+        print(f"  {name:<{width}}  {ns:>14,.1f} ns")
@@ -0,0 +1,84 @@
+"""Synthetic error hierarchies (e.g. like ones generated from API specs)."""
+
+from __future__ import annotations
+
+import dataclasses
+import typing as t
+
+from izulu import _reraise
+from izulu import root
+
+
+@dataclasses.dataclass(frozen=True)
+class Shape:
+    width: int = 10  # subclasses of every non-leaf class
+    depth: int = 3  # levels below the root class
+    fields: int = 2  # annotated fields declared by every class
+    placeholders: int = 2  # template placeholders (own fields first)
+    complex_template: bool = False  # conversions and format specs
+    rules: int = 0  # reraising rules of every class
+
+    @property
+    def size(self) -> int:
+        """Number of generated classes (excluding root)."""
+        return sum(self.width**level for level in range(1, self.depth + 1))
+
+
+class Hierarchy(t.NamedTuple):
+    root: t.Type[root.Error]
+    classes: t.List[type]  # strong refs: bases keep subclasses weakly
+
+
+def _template(names: t.Sequence[str], *, complex_template: bool) -> str:
+    if complex_template:
+        parts = (f"{{{name}!r:>16}}" for name in names)
+    else:
+        parts = (f"{{{name}}}" for name in names)
+    return "Synthetic error: " + ", ".join(parts)
+
+
+def generate(shape: Shape, *, reraising: bool = True) -> Hierarchy:
+    """
+    Create hierarchy of ``shape`` breadth-first.
+
+    Args:
+        shape: hierarchy parameters
+        reraising: derive classes from ``ReraisingMixin`` too
+
+    Returns:
+        root class and all generated classes
+
+    """
+    bases: t.Tuple[type, ...] = (root.Error,)
+    if reraising:
+        bases = (_reraise.ReraisingMixin, root.Error)
+    excs = [
+        type(f"Synthetic{i}", (Exception,), {}) for i in range(shape.rules)
+    ]
+    rules = tuple((exc, _reraise.t_ext.Self) for exc in excs) or False
+
+    base = type("SyntheticError", bases, {"__reraising__": rules})
+    classes: t.List[type] = []
+    level = [(base, ())]
+    for depth in range(shape.depth):
+        next_level = []
+        for parent, inherited in level:
+            for _ in range(shape.width):
+                name = f"Synthetic{depth}x{len(classes)}Error"
+                own = tuple(
+                    f"f{len(classes)}_{j}" for j in range(shape.fields)
+                )
+                names = (*own, *inherited)[: shape.placeholders]
+                namespace = {
+                    "__annotations__": dict.fromkeys(own, int),
+                    "__template__": _template(
+                        names,
+                        complex_template=shape.complex_template,
+                    ),
+                    "__reraising__": rules,
+                }
+                kls = type(name, (parent,), namespace)
+                classes.append(kls)
+                next_level.append((kls, (*own, *inherited)))
+        level = next_level
+    return Hierarchy(base, classes)
@@ -0,0 +1,35 @@
+"""
+Cost of recording single occurrence with ``tools.Aggregator``.
+
+Run: ``python -m benchmarks.bench_aggregator``
+"""
+
+from __future__ import annotations
+
+from benchmarks import _common
+from izulu import tools
+from tests import errors
+
+_ERR = errors.MixedError(name="John", age=42, note="...")
+_EXC = ValueError("bad value")
+_PLAIN = tools.Aggregator()
+_FIELDS = tools.Aggregator(fields=("name", "age"))
+_COUNTING = tools.Aggregator(samples=0)
+
+
+def main() -> None:
+    _common.report(
+        "record single occurrence",
+        {
+            "builtin": _common.measure(lambda: _PLAIN.record(_EXC)),
+            "izulu": _common.measure(lambda: _PLAIN.record(_ERR)),
+            "izulu + 2 fields": _common.measure(lambda: _FIELDS.record(_ERR)),
+            "izulu, no samples": _common.measure(
+                lambda: _COUNTING.record(_ERR),
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
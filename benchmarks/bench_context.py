@@ -0,0 +1,55 @@
+"""
+Overhead of ``contextvars`` snapshot captured on error initialization.
+
+Run: ``python -m benchmarks.bench_context``
+"""
+
+from __future__ import annotations
+
+import contextvars
+
+from benchmarks import _common
+from tests import errors
+
+REQUEST_ID: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+class _CapturingError(errors.MixedError):
+    __contextvars__ = (REQUEST_ID,)
+
+
+def _raise(kls: type[errors.MixedError]) -> None:
+    raise kls(name="John", age=42, note="...")
+
+
+def _plain() -> object:
+    try:
+        _raise(errors.MixedError)
+    except errors.MixedError as e:
+        return e
+    raise AssertionError
+
+
+def _capturing() -> object:
+    try:
+        _raise(_CapturingError)
+    except errors.MixedError as e:
+        return e
+    raise AssertionError
+
+
+def main() -> None:
+    REQUEST_ID.set("request")
+    for _ in range(50):  # populated context
+        contextvars.ContextVar("var").set(None)
+    _common.report(
+        "raise and catch single error",
+        {
+            "plain": _common.measure(_plain),
+            "capturing": _common.measure(_capturing),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Deferred error records vs eager exception construction.
+
+Run: ``python -m benchmarks.bench_defer``
+"""
+
+from __future__ import annotations
+
+from benchmarks import _common
+from tests import errors
+
+_BATCH = 1000
+
+
+def _eager_one() -> object:
+    return errors.MixedError(name="John", age=42, note="...")
+
+
+def _deferred_one() -> object:
+    return errors.MixedError.defer(name="John", age=42, note="...")
+
+
+def _eager_batch() -> object:
+    failures = [
+        errors.MixedError(name="John", age=i, note="...")
+        for i in range(_BATCH)
+    ]
+    return failures[0]
+
+
+def _deferred_batch() -> object:
+    failures = [
+        errors.MixedError.defer(name="John", age=i, note="...")
+        for i in range(_BATCH)
+    ]
+    return failures[0].materialize()
+
+
+def main() -> None:
+    _common.report(
+        "single error",
+        {
+            "eager": _common.measure(_eager_one),
+            "deferred": _common.measure(_deferred_one),
+        },
+    )
+    _common.report(
+        f"collect {_BATCH} errors, materialize first",
+        {
+            "eager": _common.measure(_eager_batch),
+            "deferred": _common.measure(_deferred_batch),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Full ``tools.dump`` vs compiled dump profiles (dump + JSON serialization).
+
+Run: ``python -m benchmarks.bench_dump``
+"""
+
+from __future__ import annotations
+
+import json
+
+from benchmarks import _common
+from izulu import root
+from izulu import tools
+from tests import errors
+
+_ERR = errors.DerivedError(
+    name="John",
+    surname="Smith",
+    note="x" * 10_000,
+    box={str(i): i for i in range(1000)},
+)
+_COMPACT = tools.DumpProfile(
+    "compact",
+    exclude=frozenset({"timestamp", "updated_at"}),
+    redact=frozenset({"full_name"}),
+    limits=root.Limits(field=64, message=256),
+)
+
+
+def _full() -> str:
+    return json.dumps(tools.dump(_ERR), default=str)
+
+
+def _compact() -> str:
+    return json.dumps(tools.dump(_ERR, profile=_COMPACT), default=str)
+
+
+def main() -> None:
+    _common.report(
+        "dump and serialize single error",
+        {
+            "full": _common.measure(_full),
+            "profile": _common.measure(_compact),
+        },
+    )
+    print("serialized size (bytes)")
+    for name, func in (("full", _full), ("profile", _compact)):
+        print(f"  {name:<7}  {len(func()):>14,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Round-trip cost of remapped errors from thread and process pool workers.
+
+Compares:
+
+- ``baseline``: worker raises izulu error, which is pickled with
+  ``Error.__reduce__`` (the parent reconstructs it with validation)
+  or, for thread pools, worker raises original exception
+  and the parent remaps it
+- ``wrapper``: ``executors.RemappingExecutor`` remapping in the worker
+  and transferring compact state
+
+Run: ``python -m benchmarks.bench_executors``
+"""
+
+from __future__ import annotations
+
+import concurrent.futures as cf
+import contextlib
+import pickle  # noqa: S403
+import time
+import typing as t
+
+from benchmarks import _common
+from izulu import _reraise
+from izulu import executors
+from tests import errors
+
+_TASKS = 2000
+
+
+class TaskError(_reraise.ReraisingMixin, errors.DerivedError):
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+
+_KWARGS = dict(name="John", surname="Smith", note="...", box={})
+
+
+def _fail() -> None:
+    raise ValueError("boom")
+
+
+def _fail_remapped() -> None:
+    try:
+        _fail()
+    except ValueError as e:
+        raise TaskError(**_KWARGS) from e
+
+
+def _per_task(executor: cf.Executor, func: t.Callable[[], None]) -> float:
+    start = time.perf_counter_ns()
+    futures = [executor.submit(func) for _ in range(_TASKS)]
+    for future in futures:
+        with contextlib.suppress(TaskError):
+            future.result()
+    return (time.perf_counter_ns() - start) / _TASKS
+
+
+def _remapped_in_parent(executor: cf.Executor) -> float:
+    start = time.perf_counter_ns()
+    futures = [executor.submit(_fail) for _ in range(_TASKS)]
+    for future in futures:
+        exc = future.exception()
+        TaskError.remap(exc, remap_kwargs=_KWARGS)  # type: ignore[arg-type]
+    return (time.perf_counter_ns() - start) / _TASKS
+
+
+def _serialization() -> t.Dict[str, float]:
+    err = TaskError(**_KWARGS)
+    transport = executors._Remapped(err)  # noqa: SLF001
+    return {
+        "Error.__reduce__": _common.measure(
+            lambda: pickle.loads(pickle.dumps(err)),  # noqa: S301
+        ),
+        "compact transport": _common.measure(
+            lambda: pickle.loads(pickle.dumps(transport)),  # noqa: S301
+        ),
+    }
+
+
+def _round_trips(pool: t.Type[cf.Executor]) -> t.Dict[str, float]:
+    with pool(max_workers=2) as executor:
+        if pool is cf.ThreadPoolExecutor:
+            baseline = _remapped_in_parent(executor)
+        else:
+            baseline = _per_task(executor, _fail_remapped)
+    with executors.RemappingExecutor(
+        pool(max_workers=2),
+        TaskError,
+        remap_kwargs=_KWARGS,
+    ) as executor:
+        wrapper = _per_task(executor, _fail)
+    return {"baseline": baseline, "wrapper": wrapper}
+
+
+def main() -> None:
+    _common.report("pickle round-trip of remapped error", _serialization())
+    _common.report(
+        f"thread pool, per failed task ({_TASKS} tasks)",
+        _round_trips(cf.ThreadPoolExecutor),
+    )
+    _common.report(
+        f"process pool, per failed task ({_TASKS} tasks)",
+        _round_trips(cf.ProcessPoolExecutor),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Cost of logging error in request thread: synchronous vs ``izulu.logs``.
+
+Run: ``python -m benchmarks.bench_logs``
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+
+from benchmarks import _common
+from izulu import logs
+from izulu import tools
+from tests import errors
+
+_ERR = errors.MixedError(name="John", age=42, note="...")
+
+
+class _SyncDumpHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.stream = io.StringIO()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        data = dict(message=record.getMessage(), error=tools.dump(_ERR))
+        self.stream.write(json.dumps(data, default=str) + "\n")
+
+
+def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def main() -> None:
+    sync = _logger("bench.sync", _SyncDumpHandler())
+    # writer is not started during measurement: the request thread cost only
+    writer = logs.ErrorWriter(lambda _: None, maxsize=0, policy="block")
+    queued = _logger("bench.queued", logs.ErrorHandler(writer))
+    _common.report(
+        "log single error (request thread)",
+        {
+            "sync dump": _common.measure(
+                lambda: sync.error("failed %s", 1, exc_info=_ERR),
+            ),
+            "queued": _common.measure(
+                lambda: queued.error("failed %s", 1, exc_info=_ERR),
+            ),
+        },
+    )
+    with writer:  # drain
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Memory footprint of errors: per instance (by shape) and per class.
+
+Per instance numbers are measured with ``tracemalloc`` (retained bytes of
+many instances) and split into parts with ``tools.deep_sizeof``.
+Per class numbers include ``Store`` (with its ``MappingProxyType``s) and
+compiled reraising rules.
+
+Run: ``python -m benchmarks.bench_memory``
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+import typing as t
+
+from izulu import _reraise
+from izulu import root
+from izulu import tools
+from tests import errors
+
+_INSTANCES = 1000
+_CLASSES = 100
+_RULES = (0, 10, 100)
+_PARTS = ("object", "kwargs", "attributes", "factories", "args", "traceback")
+
+_SHAPES: t.Dict[str, t.Callable[[], root.Error]] = {
+    "RootError": errors.RootError,
+    "TemplateOnlyError": lambda: errors.TemplateOnlyError(name="John", age=42),
+    "AttributesOnlyError": lambda: errors.AttributesOnlyError(
+        name="John",
+        age=42,
+    ),
+    "AttributesWithStaticDefaultsError": lambda: (
+        errors.AttributesWithStaticDefaultsError(name="John")
+    ),
+    "AttributesWithDynamicDefaultsError": lambda: (
+        errors.AttributesWithDynamicDefaultsError(name="John")
+    ),
+    "ClassVarsError": errors.ClassVarsError,
+    "MixedError": lambda: errors.MixedError(name="John", note="..."),
+    "DerivedError": lambda: errors.DerivedError(
+        name="John",
+        surname="Smith",
+        note="...",
+        box={},
+    ),
+}
+
+
+def _retained_bytes(func: t.Callable[[], object], n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    retained = [func() for _ in range(n)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return current / n
+
+
+def _fail() -> None:
+    raise ValueError("original")
+
+
+# error raised from another one (with traceback and cause)
+def _raised(func: t.Callable[[], root.Error]) -> root.Error:
+    try:
+        try:
+            _fail()
+        except ValueError as e:
+            raise func() from e
+    except root.Error as e:
+        return e
+    raise AssertionError
+
+
+def _print_instances() -> None:
+    print(f"bytes per instance ({_INSTANCES} retained, tracemalloc)")
+    width = max(map(len, _SHAPES))
+    print(f"  {'':<{width}}{'new':>10}{'raised':>10}")
+    for name, func in _SHAPES.items():
+        new = _retained_bytes(func, _INSTANCES)
+        raised = _retained_bytes(lambda f=func: _raised(f), _INSTANCES)
+        print(f"  {name:<{width}}{new:>10,.0f}{raised:>10,.0f}")
+
+    print("tools.deep_sizeof() of raised instance")
+    header = "".join(f"{part:>11}" for part in (*_PARTS, "chain", "total"))
+    print(f"  {'':<{width}}{header}")
+    for name, func in _SHAPES.items():
+        size = tools.deep_sizeof(_raised(func))
+        values = (size[part] for part in (*_PARTS, "chain", "total"))  # type: ignore[literal-required]
+        print(f"  {name:<{width}}{''.join(f'{v:>11,}' for v in values)}")
+
+
+def _make_class(rules: _reraise._T_RULES) -> type:
+    return type(
+        "ClassError",
+        (_reraise.ReraisingMixin, errors.DerivedError),
+        {"__reraising__": rules},
+    )
+
+
+def _print_classes() -> None:
+    print(f"bytes per class ({_CLASSES} retained, tracemalloc)")
+    for n_rules in _RULES:
+        excs = tuple(type(f"Exc{i}", (Exception,), {}) for i in range(n_rules))
+        rules = tuple((e, _reraise.t_ext.Self) for e in excs)
+        kls = _make_class(rules)
+        store = kls._Error__cls_store  # type: ignore[attr-defined]  # noqa: SLF001
+        total = _retained_bytes(lambda r=rules: _make_class(r), _CLASSES)
+        compiled = _retained_bytes(
+            lambda r=rules, k=kls: k._ReraisingMixin__compile_rules(r),  # type: ignore[attr-defined]  # noqa: SLF001
+            _CLASSES,
+        )
+        print(
+            f"  {n_rules:>4} rules: class {total:>10,.0f}"
+            f"  store (deep) {tools._deep_size(store, set()):>8,}"  # noqa: SLF001
+            f"  compiled rules {compiled:>10,.0f}",
+        )
+
+
+def main() -> None:
+    _print_instances()
+    _print_classes()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Error construction cost with ``izulu.metrics`` disabled and enabled.
+
+Run: ``python -m benchmarks.bench_metrics``
+"""
+
+from __future__ import annotations
+
+from benchmarks import _common
+from izulu import metrics
+from tests import errors
+
+
+def _construct() -> object:
+    return errors.MixedError(name="John", age=42, note="...")
+
+
+def main() -> None:
+    results = {"disabled": _common.measure(_construct)}
+    metrics.enable()
+    results["counters"] = _common.measure(_construct)
+    metrics.enable(timings=True)
+    results["counters + timings"] = _common.measure(_construct)
+    metrics.disable()
+    _common.report("construct single error", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Per-phase construction and remap timings of error shapes.
+
+Run: ``python -m benchmarks.bench_profiling``
+"""
+
+from __future__ import annotations
+
+from izulu import _reraise
+from izulu import profiling
+from izulu import root
+from tests import errors
+
+_ROUNDS = 10_000
+
+
+class _RemapError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+
+def main() -> None:
+    profiling.enable()
+    try:
+        for _ in range(_ROUNDS):
+            errors.TemplateOnlyError(name="John", age=42)
+            errors.AttributesWithDynamicDefaultsError(name="John")
+            errors.MixedError(name="John", age=42, note="...")
+            _RemapError.remap(ValueError())
+    finally:
+        profiling.disable()
+    print(profiling.render_report())
+    for row in profiling.report():
+        phases = ", ".join(
+            f"{k}={v / row['count']:,.0f}" for k, v in row["phases"].items()
+        )
+        print(f"{row['kind']} {row['type']}: {phases} (ns)")
+
+
+if __name__ == "__main__":
+    main()
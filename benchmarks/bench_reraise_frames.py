@@ -0,0 +1,118 @@
+"""
+Traceback depth of remapped exceptions: formatting cost and retained memory.
+
+Compares ``contextlib``-based reraising (former implementation),
+class-based ``reraise`` and ``reraise(strip_frames=True)``.
+
+Run: ``python -m benchmarks.bench_reraise_frames``
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import traceback
+import tracemalloc
+import typing as t
+
+from benchmarks import _common
+from izulu import _reraise
+from izulu import root
+from izulu import tools
+
+_LAYERS = 3
+_ERRORS = 1000
+
+
+class LayerError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = True
+
+
+def _contextlib_reraise(kls: type[LayerError]) -> t.Any:  # noqa: ANN401
+    @contextlib.contextmanager
+    def reraise() -> t.Generator[None, None, None]:
+        try:
+            yield
+        except Exception as e:
+            exc = kls.remap(e)
+            if exc is None:
+                raise
+            raise exc from e
+
+    return reraise()
+
+
+def _make_layers(
+    factory: t.Callable[[type[LayerError]], t.Any],
+) -> t.Callable[[], None]:
+    def fail() -> None:
+        raise ValueError("boom")
+
+    func = fail
+    for i in range(_LAYERS):
+        kls = type(f"Layer{i}Error", (LayerError,), {"__reraising__": True})
+        func = factory(kls)(func)
+    return func
+
+
+_FUNCS = {
+    "contextlib": _make_layers(_contextlib_reraise),
+    "reraise": _make_layers(lambda kls: kls.reraise()),
+    "strip_frames": _make_layers(lambda kls: kls.reraise(strip_frames=True)),
+}
+
+
+def _catch(func: t.Callable[[], None]) -> BaseException:
+    try:
+        func()
+    except LayerError as e:
+        return e
+    raise AssertionError
+
+
+def _depth(exc: BaseException) -> int:
+    return sum(
+        len(list(traceback.walk_tb(e.__traceback__)))
+        for e in tools.error_chain(exc)
+    )
+
+
+def _retained_bytes(func: t.Callable[[], None]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    retained = [_catch(func) for _ in range(_ERRORS)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return current
+
+
+def main() -> None:
+    excs = {name: _catch(func) for name, func in _FUNCS.items()}
+    print("traceback entries in chain")
+    for name, exc in excs.items():
+        print(f"  {name:<14}{_depth(exc):>6}")
+
+    _common.report(
+        "traceback.format_exception()",
+        {
+            name: _common.measure(lambda e=exc: traceback.format_exception(e))
+            for name, exc in excs.items()
+        },
+    )
+    _common.report(
+        "raise & catch",
+        {
+            name: _common.measure(lambda f=func: _catch(f))
+            for name, func in _FUNCS.items()
+        },
+    )
+
+    print(f"retained memory for {_ERRORS} errors")
+    for name, func in _FUNCS.items():
+        print(f"  {name:<14}{_retained_bytes(func):>14,} B")
+
+
+if __name__ == "__main__":
+    main()
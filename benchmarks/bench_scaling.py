@@ -0,0 +1,134 @@
+"""
+Scaling of class creation and subtree traversal with hierarchy size.
+
+Reports time and retained memory of ``Error.__init_subclass__`` (plain
+errors) and ``ReraisingMixin.__init_subclass__`` (reraising errors) along
+with ``_utils.traverse_tree`` and ``chain.from_subtree`` over the whole
+hierarchy.  Per-class columns should stay flat as hierarchy grows; growing
+values mean superlinear behaviour.  Note that traversal of hierarchies
+with more than ~10^4 classes gets memory-bound (cache misses on class
+objects), so some per-class growth there is expected for any classes.
+
+Run: ``python -m benchmarks.bench_scaling [--fields N] [--rules N] ...``
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+import typing as t
+
+from benchmarks import _common
+from benchmarks import _hierarchy
+from izulu import _reraise
+from izulu import _utils
+
+# (width, depth): from 10 to ~10^5 classes
+_SHAPES = ((10, 1), (10, 2), (10, 3), (30, 3), (10, 4), (10, 5))
+_SLOWDOWN = 2.0  # per-class cost growth considered superlinear
+_SINGLE_RUN_SIZE = 10_000  # measure traversal of bigger trees once
+
+
+def _creation_ns(shape: _hierarchy.Shape, *, reraising: bool) -> float:
+    gc.collect()
+    start = time.perf_counter_ns()
+    _hierarchy.generate(shape, reraising=reraising)
+    return time.perf_counter_ns() - start
+
+
+def _retained_bytes(shape: _hierarchy.Shape, *, reraising: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    hierarchy = _hierarchy.generate(shape, reraising=reraising)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hierarchy
+    return current
+
+
+def _row(shape: _hierarchy.Shape, *, reraising: bool) -> t.Dict[str, float]:
+    size = shape.size
+    row = dict(
+        create=_creation_ns(shape, reraising=reraising) / size,
+        memory=_retained_bytes(shape, reraising=reraising) / size,
+    )
+    if reraising:
+        hierarchy = _hierarchy.generate(shape)
+        number = 1 if size > _SINGLE_RUN_SIZE else None
+        row["traverse"] = (
+            _common.measure(
+                lambda: list(_utils.traverse_tree(hierarchy.root)),
+                number=number,
+                repeat=3,
+            )
+            / size
+        )
+        row["chain"] = (
+            _common.measure(
+                lambda: _reraise.chain.from_subtree(hierarchy.root),  # type: ignore[arg-type]
+                number=number,
+                repeat=3,
+            )
+            / size
+        )
+    return row
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_scaling")
+    parser.add_argument("--fields", type=int, default=2)
+    parser.add_argument("--placeholders", type=int, default=2)
+    parser.add_argument("--complex", action="store_true")
+    parser.add_argument("--rules", type=int, default=0)
+    parser.add_argument("--max-size", type=int, default=200_000)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    template = _hierarchy.Shape(
+        fields=args.fields,
+        placeholders=args.placeholders,
+        complex_template=args.complex,
+        rules=args.rules,
+    )
+    shapes = [
+        dataclasses.replace(template, width=width, depth=depth)
+        for width, depth in _SHAPES
+    ]
+    shapes = [shape for shape in shapes if shape.size <= args.max_size]
+    print(f"per class values, {template}")
+
+    for reraising in (False, True):
+        title = "Error + ReraisingMixin" if reraising else "Error"
+        print(title)
+        print(
+            f"  {'width':>6}{'depth':>6}{'classes':>10}{'create':>14}"
+            f"{'memory':>12}{'traverse':>12}{'chain':>12}",
+        )
+        first: t.Optional[t.Dict[str, float]] = None
+        for shape in shapes:
+            row = _row(shape, reraising=reraising)
+            first = first or row
+            line = (
+                f"  {shape.width:>6}{shape.depth:>6}{shape.size:>10,}"
+                f"{row['create']:>11,.0f} ns{row['memory']:>10,.0f} B"
+            )
+            if reraising:
+                line += f"{row['traverse']:>9,.1f} ns{row['chain']:>9,.1f} ns"
+            print(line, flush=True)
+            slow = [
+                name
+                for name, value in row.items()
+                if name != "memory" and value > first[name] * _SLOWDOWN
+            ]
+            if slow:
+                print(f"    superlinear: {', '.join(slow)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Cost of suppressing exceptions in tight loop with ``tools.suppress``.
+
+Run: ``python -m benchmarks.bench_suppress``
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+
+from benchmarks import _common
+from izulu import tools
+
+_BATCH = 1000
+
+
+def _bad_record(i: int) -> None:
+    raise ValueError(i)
+
+
+def _loop(guard: tools.suppress) -> None:
+    for i in range(_BATCH):
+        with guard:
+            _bad_record(i)
+
+
+def _decorated_loop(func: object) -> None:
+    for i in range(_BATCH):
+        func(i)  # type: ignore[operator]
+
+
+def main() -> None:
+    logging.basicConfig(
+        handlers=[logging.NullHandler()],
+        level=logging.ERROR,
+        force=True,
+    )
+    sampled = tools.suppress(first=10, every=10_000)
+    counted = tools.suppress(sink=collections.Counter())
+    _common.report(
+        f"suppress {_BATCH} exceptions",
+        {
+            "log every": _common.measure(lambda: _loop(tools.suppress())),
+            "sampled": _common.measure(lambda: _loop(sampled)),
+            "counter sink": _common.measure(lambda: _loop(counted)),
+            "decorator": _common.measure(
+                lambda: _decorated_loop(sampled(_bad_record)),
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
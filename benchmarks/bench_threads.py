@@ -0,0 +1,86 @@
+"""
+Throughput of construction, remap and dump with growing number of threads.
+
+On free-threaded builds (e.g. ``python3.13t``) throughput should grow with
+threads up to number of cores; with the GIL it stays flat.
+Metrics are measured too: their per-thread shards must not contend.
+
+Run: ``python -m benchmarks.bench_threads``
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import typing as t
+
+from izulu import _reraise
+from izulu import metrics
+from izulu import root
+from izulu import tools
+from tests import errors
+
+_OPS = 20_000  # per thread
+_THREADS = (1, 2, 4, 8)
+
+
+class RemapError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+
+_ERR = errors.MixedError(name="John", note="...")
+_EXC = ValueError()
+_CASES: t.Dict[str, t.Callable[[], object]] = {
+    "construct": lambda: errors.MixedError(name="John", note="..."),
+    "remap": lambda: RemapError.remap(_EXC),
+    "dump": lambda: tools.dump(_ERR),
+}
+
+
+def _throughput(func: t.Callable[[], object], n_threads: int) -> float:
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(_OPS):
+            func()
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return n_threads * _OPS / (time.perf_counter() - start)
+
+
+def _report(title: str) -> None:
+    print(title)
+    print(f"  {'':<10}" + "".join(f"{n:>12} thr" for n in _THREADS))
+    for name, func in _CASES.items():
+        single = _throughput(func, 1)
+        line = f"  {name:<10}"
+        for n_threads in _THREADS:
+            ops = _throughput(func, n_threads)
+            line += f"{ops / 1000:>9,.0f}k x{ops / single:<4.1f}"
+        print(line, flush=True)
+
+
+def main() -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(f"GIL enabled: {is_gil_enabled()}, cores: {os.cpu_count()}")
+    print("ops/s (and speedup over single thread)")
+    _report("plain")
+    metrics.enable(timings=True)
+    try:
+        _report("metrics enabled")
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Memory retained by errors with live tracebacks vs detached snapshots.
+
+Run: ``python -m benchmarks.bench_traceback``
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+
+from tests import errors
+
+_ERRORS = 200
+_DEPTH = 10
+_PAYLOAD = 64 * 1024
+
+
+def _fail(depth: int) -> None:
+    payload = bytearray(_PAYLOAD)  # noqa: F841 (kept alive by frame)
+    if depth:
+        _fail(depth - 1)
+    raise errors.TemplateOnlyError(name="John", age=depth)
+
+
+def _catch() -> errors.TemplateOnlyError:
+    try:
+        _fail(_DEPTH)
+    except errors.TemplateOnlyError as e:
+        return e
+    raise AssertionError
+
+
+def _make_errors() -> list[errors.TemplateOnlyError]:
+    return [_catch() for _ in range(_ERRORS)]
+
+
+def _retained_bytes(*, detach: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    retained = _make_errors()
+    if detach:
+        for err in retained:
+            err.detach_traceback()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return current
+
+
+def main() -> None:
+    live = _retained_bytes(detach=False)
+    detached = _retained_bytes(detach=True)
+    print(f"retained memory for {_ERRORS} errors")
+    print(f"  live tracebacks  {live:>14,} B")
+    print(f"  detached         {detached:>14,} B")
+
+    retained = _make_errors()
+    start = time.perf_counter_ns()
+    for err in retained:
+        err.detach_traceback()
+    elapsed = (time.perf_counter_ns() - start) / _ERRORS
+    print(f"detach_traceback() cost (depth={_DEPTH})")
+    print(f"  detach           {elapsed:>14,.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
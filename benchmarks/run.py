@@ -0,0 +1,96 @@
+"""
+Run benchmark suite and compare results against stored baseline.
+
+Run::
+
+    python -m benchmarks.run --save baseline.json   # store baseline
+    python -m benchmarks.run --compare baseline.json  # detect regressions
+    python -m benchmarks.run -k remap  # only matching cases
+
+Exit code is ``1`` if any case is slower than baseline more than threshold.
+Baselines are machine-specific: compare results of the same box only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import platform
+import sys
+import typing as t
+
+from benchmarks import _common
+from benchmarks import suite
+
+
+def _parse_args(argv: t.Optional[t.Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("-k", dest="pattern", help="run only matching cases")
+    parser.add_argument("--save", type=pathlib.Path, help="store results")
+    parser.add_argument("--compare", type=pathlib.Path, help="baseline file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown ratio (default: 0.1, i.e. 10%%)",
+    )
+    parser.add_argument("--repeat", type=int, default=_common.REPEAT)
+    return parser.parse_args(argv)
+
+
+def _load(path: pathlib.Path) -> t.Dict[str, float]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("python") != platform.python_version():
+        print(
+            f"WARNING: baseline was made with Python {data.get('python')}",
+            file=sys.stderr,
+        )
+    return t.cast("t.Dict[str, float]", data["results"])
+
+
+def _save(path: pathlib.Path, results: t.Dict[str, float]) -> None:
+    data = dict(python=platform.python_version(), results=results)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    results: t.Mapping[str, float],
+    baseline: t.Mapping[str, float],
+    threshold: float,
+) -> t.List[str]:
+    """Return names of cases slower than baseline more than threshold."""
+    return [
+        name
+        for name, ns in results.items()
+        if name in baseline and ns > baseline[name] * (1 + threshold)
+    ]
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    baseline = _load(args.compare) if args.compare else {}
+
+    results: t.Dict[str, float] = {}
+    for name, case in suite.cases().items():
+        if args.pattern and args.pattern not in name:
+            continue
+        results[name] = ns = _common.measure(case, repeat=args.repeat)
+        line = f"{name:<32}{ns:>14,.1f} ns"
+        if name in baseline:
+            ratio = ns / baseline[name]
+            line += f"{baseline[name]:>14,.1f} ns  x{ratio:.2f}"
+        print(line, flush=True)
+
+    if args.save:
+        _save(args.save, results)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressions (>{args.threshold:.0%}): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Benchmark cases of izulu hot paths (see ``benchmarks.run``).
+
+Every case is a callable without arguments, fixtures are built once
+by ``cases()``.
+"""
+
+from __future__ import annotations
+
+import copy
+import datetime as dtm
+import pickle  # noqa: S403
+import typing as t
+
+from izulu import _reraise
+from izulu import _utils
+from izulu import root
+from izulu import tools
+from tests import errors
+
+_T_CASES = t.Dict[str, t.Callable[[], object]]
+
+RULE_COUNTS = (1, 10, 100)
+SUBTREE_SIZES = (10, 100, 1000)
+
+
+class FrozenError(errors.MixedError):
+    __frozen__ = True
+
+
+def _construction() -> _T_CASES:
+    derived_kwargs = dict(name="John", surname="Smith", note="...", box={})
+    return {
+        "init/template-only": lambda: errors.TemplateOnlyError(
+            name="John",
+            age=42,
+        ),
+        "init/attributes": lambda: errors.AttributesOnlyError(
+            name="John",
+            age=42,
+        ),
+        "init/static-defaults": lambda: (
+            errors.AttributesWithStaticDefaultsError(name="John")
+        ),
+        "init/dynamic-defaults": lambda: (
+            errors.AttributesWithDynamicDefaultsError(name="John")
+        ),
+        "init/classvars": errors.ClassVarsError,
+        "init/mixed": lambda: errors.MixedError(name="John", note="..."),
+        "init/derived": lambda: errors.DerivedError(**derived_kwargs),
+        "init/frozen": lambda: FrozenError(name="John", note="..."),
+    }
+
+
+def _rendering() -> _T_CASES:
+    kwargs = dict(name="John", age=42, note="...", ENTITY="The Entity")
+    complex_kwargs = dict(
+        name="John", age=42, ts=dtm.datetime.now(tz=dtm.timezone.utc)
+    )
+    return {
+        "render/template": lambda: _utils.format_template(
+            errors.MixedError.__template__,
+            kwargs,
+        ),
+        "render/complex-template": lambda: _utils.format_template(
+            errors.ComplexTemplateOnlyError.__template__,
+            complex_kwargs,
+        ),
+    }
+
+
+def _representation() -> _T_CASES:
+    err = errors.DerivedError(
+        name="John",
+        surname="Smith",
+        note="...",
+        box=dict(a=1),
+    )
+    frozen = FrozenError(name="John", note="...")
+    return {
+        "repr/as_dict": err.as_dict,
+        "repr/as_dict-wide": lambda: err.as_dict(wide=True),
+        "repr/as_kwargs": err.as_kwargs,
+        "repr/repr": lambda: repr(err),
+        "repr/dump": lambda: tools.dump(err),
+        "repr/pickle": lambda: pickle.loads(pickle.dumps(err)),  # noqa: S301
+        "repr/copy": lambda: copy.copy(err),
+        "repr/deepcopy": lambda: copy.deepcopy(err),
+        "repr/frozen-kwargs_view": frozen.kwargs_view,
+        "repr/frozen-copy": lambda: copy.copy(frozen),
+        "repr/frozen-deepcopy": lambda: copy.deepcopy(frozen),
+        "repr/frozen-hash": lambda: hash(frozen),
+    }
+
+
+def _remap_class(n_rules: int) -> t.Tuple[type, Exception]:
+    """Return class with ``n_rules`` rules, only the last one matches."""
+    excs = [type(f"Exc{i}", (Exception,), {}) for i in range(n_rules)]
+    kls = type(
+        f"Remap{n_rules}Error",
+        (_reraise.ReraisingMixin, root.Error),
+        {"__reraising__": tuple((e, _reraise.t_ext.Self) for e in excs)},
+    )
+    return kls, excs[-1]()
+
+
+def _remapping() -> _T_CASES:
+    cases: _T_CASES = {}
+    for n_rules in RULE_COUNTS:
+        kls, exc = _remap_class(n_rules)
+        cases[f"remap/{n_rules}-rules"] = lambda k=kls, e=exc: k.remap(e)
+    return cases
+
+
+# subclasses are weakly referenced by their bases, so keep them alive
+_KEEPALIVE: t.List[type] = []
+
+
+def _subtree(size: int) -> t.Type[_reraise.ReraisingMixin]:
+    base = type(
+        f"Subtree{size}Error",
+        (_reraise.ReraisingMixin, root.Error),
+        {"__reraising__": False},
+    )
+    _KEEPALIVE.extend(
+        type(f"Subtree{size}Error{i}", (base,), {"__reraising__": False})
+        for i in range(size)
+    )
+    return base
+
+
+def _chaining() -> _T_CASES:
+    cases: _T_CASES = {}
+    exc = ValueError()
+    for size in SUBTREE_SIZES:
+        base = _subtree(size)
+        chained = _reraise.chain.from_subtree(base)
+        cases[f"chain/from-subtree-{size}"] = lambda b=base: (
+            _reraise.chain.from_subtree(b)
+        )
+        cases[f"chain/miss-{size}"] = (
+            lambda c=chained, b=base: c(b, exc)  # type: ignore[misc]
+        )
+    return cases
+
+
+class _ReraiseError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+
+def _reraise_success() -> None:
+    with _ReraiseError.reraise():
+        pass
+
+
+def _raise_value_error() -> None:
+    raise ValueError
+
+
+def _reraise_failure() -> None:
+    try:
+        with _ReraiseError.reraise():
+            _raise_value_error()
+    except _ReraiseError:
+        pass
+
+
+def _reraising() -> _T_CASES:
+    return {
+        "reraise/success": _reraise_success,
+        "reraise/failure": _reraise_failure,
+    }
+
+
+def cases() -> _T_CASES:
+    """Return all benchmark cases by name."""
+    return {
+        **_construction(),
+        **_rendering(),
+        **_representation(),
+        **_remapping(),
+        **_chaining(),
+        **_reraising(),
+    }
@@ -0,0 +1,202 @@
+"""
+Benchmark error hierarchy of provided module.
+
+Run::
+
+    python -m izulu app.errors > izulu-perf.json
+
+Every ``root.Error`` subclass defined in the module (or its submodules)
+is constructed with sample kwargs generated from its annotations.
+Reported (JSON) per class: construction and template rendering time,
+time of every ``factory`` default and size of reraising rule table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import datetime as dtm
+import decimal
+import functools
+import importlib
+import json
+import pathlib
+import platform
+import sys
+import timeit
+import typing as t
+import uuid
+
+from izulu import _reraise
+from izulu import _utils
+from izulu import root
+
+_SAMPLES: t.Dict[t.Any, t.Any] = {
+    int: 1,
+    float: 1.0,
+    complex: 1j,
+    bool: True,
+    str: "sample",
+    bytes: b"sample",
+    list: [],
+    tuple: (),
+    dict: {},
+    set: set(),
+    frozenset: frozenset(),
+    decimal.Decimal: decimal.Decimal(1),
+    uuid.UUID: uuid.UUID(int=0),
+    dtm.datetime: dtm.datetime(2000, 1, 1, tzinfo=dtm.timezone.utc),
+    dtm.date: dtm.date(2000, 1, 1),
+    dtm.timedelta: dtm.timedelta(seconds=1),
+}
+# annotations may be strings (``from __future__ import annotations``)
+_SAMPLES.update({kls.__name__: value for kls, value in _SAMPLES.items()})
+
+
+class ClassReportDict(t.TypedDict):
+    type: str
+    init_ns: t.Optional[float]
+    render_ns: t.Optional[float]
+    factories: t.Dict[str, float]  # ns per factory default
+    rules: t.Union[int, bool, None]  # None for non-reraising errors
+    error: t.Optional[str]  # why class can't be measured
+
+
+def _sample(hint: t.Any) -> t.Any:  # noqa: ANN401
+    if isinstance(hint, str):
+        hint = hint.partition("[")[0].rpartition(".")[2]
+    hint = t.get_origin(hint) or hint
+    return copy.copy(_SAMPLES.get(hint, "sample"))
+
+
+def sample_kwargs(kls: t.Type[root.Error]) -> t.Dict[str, t.Any]:
+    """Return sample kwargs for all required fields of error class."""
+    store: _utils.Store = kls._Error__cls_store  # type: ignore[attr-defined]  # noqa: SLF001
+    required = (store.fields | set(store.inst_hints)).difference(
+        store.const_hints,
+        store.defaults,
+    )
+    return {
+        name: _sample(store.inst_hints.get(name)) for name in sorted(required)
+    }
+
+
+def _measure(func: t.Callable[[], object], number: int, repeat: int) -> float:
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def _rules(kls: type) -> t.Union[int, bool, None]:
+    if not issubclass(kls, _reraise.ReraisingMixin):
+        return None
+    rules = kls._ReraisingMixin__reraising  # type: ignore[attr-defined]  # noqa: SLF001
+    return rules if isinstance(rules, bool) else len(rules)
+
+
+def profile_class(
+    kls: t.Type[root.Error],
+    *,
+    number: int = 100,
+    repeat: int = 3,
+) -> ClassReportDict:
+    """
+    Benchmark construction of error class with sample kwargs.
+
+    Args:
+        kls: error class
+        number: calls per measurement
+        repeat: measurements (the best one is reported)
+
+    Returns:
+        report of class (``error`` is set if class can't be constructed)
+
+    """
+    report: ClassReportDict = dict(
+        type=f"{kls.__module__}.{kls.__qualname__}",
+        init_ns=None,
+        render_ns=None,
+        factories={},
+        rules=_rules(kls),
+        error=None,
+    )
+    kwargs = sample_kwargs(kls)
+    try:
+        err = kls(**kwargs)
+    except Exception as e:  # noqa: BLE001
+        report["error"] = f"{e.__class__.__name__}: {e}"
+        return report
+
+    store: _utils.Store = kls._Error__cls_store  # type: ignore[attr-defined]  # noqa: SLF001
+    data = dict(store.consts, **err.as_dict())
+    report["init_ns"] = _measure(lambda: kls(**kwargs), number, repeat)
+    report["render_ns"] = _measure(
+        lambda: _utils.format_template(kls.__template__, data, kls.__limits__),
+        number,
+        repeat,
+    )
+    for name in sorted(store.inst_hints):
+        attr = getattr(kls, name, None)
+        if isinstance(attr, _utils.Factory):
+            report["factories"][name] = _measure(
+                functools.partial(attr.func, err),
+                number,
+                repeat,
+            )
+    return report
+
+
+def discover(module: str) -> t.List[t.Type[root.Error]]:
+    """Return error classes defined in module (and its submodules)."""
+    prefix = f"{module}."
+    return sorted(
+        (
+            kls
+            for kls in _utils.traverse_tree(root.Error)
+            if kls.__module__ == module or kls.__module__.startswith(prefix)
+        ),
+        key=lambda kls: (kls.__module__, kls.__qualname__),
+    )
+
+
+def _parse_args(argv: t.Optional[t.Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m izulu",
+        description="Benchmark error hierarchy of provided module.",
+    )
+    parser.add_argument("module", help="module with error classes")
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", type=pathlib.Path)
+    parser.add_argument("--indent", type=int, default=None)
+    args = parser.parse_args(argv)
+    try:
+        importlib.import_module(args.module)
+    except ImportError as e:
+        parser.error(f"can't import module '{args.module}': {e}")
+    return args
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    classes = [
+        profile_class(kls, number=args.number, repeat=args.repeat)
+        for kls in discover(args.module)
+    ]
+    classes.sort(key=lambda row: -(row["init_ns"] or -1.0))
+    result = dict(
+        python=platform.python_version(),
+        module=args.module,
+        number=args.number,
+        repeat=args.repeat,
+        classes=classes,
+    )
+    text = json.dumps(result, indent=args.indent)
+    if args.output is None:
+        sys.stdout.write(text + "\n")
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
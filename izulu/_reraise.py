@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import contextlib
+import functools
+import inspect
 import logging
+import operator
 import typing as t
 
 from izulu import _utils
+from izulu import tools
 
 _IMPORT_ERROR_TEXTS = (
     "",
@@ -52,6 +55,16 @@ _T_COMPILED_RULES = t.Union[
     t.Tuple[t.Tuple[_T_EXC_CLASS_OR_TUPLE, _T_COMPILED_ACTION], ...],
 ]
 
+_T_RESOLVE_CACHE = t.Dict[
+    t.Type[BaseException],
+    t.Optional[_T_COMPILED_ACTION],
+]
+
+if t.TYPE_CHECKING:
+    import types
+
+    _T_GROUP = BaseExceptionGroup[BaseException]  # noqa: F821
+
 _MISSING = object()
 
 DecParam = t_ext.ParamSpec("DecParam")
@@ -76,11 +89,13 @@ class ReraisingMixin:
     __reraising__: _T_RULES = False
 
     __reraising: _T_COMPILED_RULES
+    __greedy: _T_COMPILED_ACTION
 
     def __init_subclass__(cls, **kwargs: t.Any) -> None:  # noqa: ANN401
         super().__init_subclass__(**kwargs)
         rules = cls.__dict__.get("__reraising__", False)
         cls.__reraising = cls.__compile_rules(rules)
+        cls.__greedy = cls.__compile_action(t_ext.Self)  # type: ignore[arg-type]
 
     @classmethod
     def __compile_rules(cls, rules: _T_RULES) -> _T_COMPILED_RULES:
@@ -150,13 +165,15 @@ class ReraisingMixin:
         return compiled_action
 
     @classmethod
-    def remap(
+    def remap(  # noqa: PLR0913
         cls,
         exc: Exception,
         *,
         reraising: _T_RERAISING = None,
         remap_kwargs: t.Optional[_T_KWARGS] = None,
         original_over_none: bool = False,
+        compact: t.Optional[int] = None,
+        detach: bool = False,
     ) -> t.Union[Exception, None]:
         """
         Return remapped exception instance.
@@ -184,99 +201,399 @@ class ReraisingMixin:
             remap_kwargs: provide kwargs for reraise exception
             original_over_none: if ``True`` return original
                                 exception instead of ``None``
+            compact: if provided, chain of remapped original exception is
+                     compacted to this length (see ``tools.compact_chain``)
+            detach: if ``True`` tracebacks of remapped original exception
+                    chain are replaced with snapshots
+                    (see ``tools.detach_traceback``)
 
         Returns:
             reraising context manager
 
         """
+        # every phase is a separate step (timed by ``izulu.profiling``)
+        action = cls.__match(exc, reraising)
+        e = None if action is None else action(exc, remap_kwargs or {})
+        if e is None:
+            return exc if original_over_none else None
+
+        cls.__finalize(exc, e, compact=compact, detach=detach)
+        return e
+
+    @classmethod
+    def __match(
+        cls,
+        exc: Exception,
+        reraising: _T_RERAISING,
+    ) -> t.Optional[_T_COMPILED_ACTION]:
         reraising_ = cls.__reraising
         if reraising is not None:
             reraising_ = cls.__compile_rules(reraising)
+        return cls.__resolve(reraising_, exc.__class__)
 
+    @staticmethod
+    def __finalize(
+        exc: Exception,
+        remapped: Exception,
+        *,
+        compact: t.Optional[int],
+        detach: bool,
+    ) -> None:
+        if compact is not None:
+            tools.compact_chain(exc, max_length=compact)
+        if detach:
+            tools.detach_traceback(exc)
+        # errors capture context on init, instances built otherwise may not
         if (
-            isinstance(exc, cls)
-            or not reraising_
-            or FatalMixin in exc.__class__.__bases__
+            getattr(remapped, "__contextvars__", None) is not None
+            and tools.captured_context(remapped) is None
         ):
-            if original_over_none:
-                return exc
-            return None
+            tools.capture_context(remapped)
+
+    @classmethod
+    def remap_many(
+        cls,
+        items: t.Iterable[t.Any],
+        *,
+        reraising: _T_RERAISING = None,
+        remap_kwargs: t.Optional[_T_KWARGS] = None,
+    ) -> t.List[t.Any]:
+        """
+        Return list of items with exceptions remapped.
+
+        Designed for ``asyncio.gather(..., return_exceptions=True)`` results:
+        non-exception items are left untouched, exception groups are rebuilt
+        with remapped leaves (see ``remap_group``). Rules are resolved once
+        per exception type for the whole batch.
 
+        Remapped exceptions get original exception as ``__cause__``
+        (the same way ``reraise`` does).
+
+        Args:
+            items: iterable of results and exceptions
+            reraising: manual overriding reraising rules
+            remap_kwargs: provide kwargs for reraise exception
+
+        """
+        reraising_ = cls.__reraising
+        if reraising is not None:
+            reraising_ = cls.__compile_rules(reraising)
         remap_kwargs = remap_kwargs or {}
+        cache: _T_RESOLVE_CACHE = {}
+
+        return [
+            cls.__remap_item(item, reraising_, remap_kwargs, cache)
+            if isinstance(item, Exception)
+            else item
+            for item in items
+        ]
+
+    @classmethod
+    def remap_group(
+        cls,
+        group: _T_GROUP,
+        *,
+        reraising: _T_RERAISING = None,
+        remap_kwargs: t.Optional[_T_KWARGS] = None,
+    ) -> _T_GROUP:
+        """
+        Return exception group rebuilt with remapped leaves.
+
+        Nested groups are processed recursively. Original group is returned
+        if nothing was remapped. Remapped leaves get original exception
+        as ``__cause__``.
+
+        Args:
+            group: exception group
+            reraising: manual overriding reraising rules
+            remap_kwargs: provide kwargs for reraise exception
+
+        """
+        reraising_ = cls.__reraising
+        if reraising is not None:
+            reraising_ = cls.__compile_rules(reraising)
+
+        return cls.__remap_group(group, reraising_, remap_kwargs or {}, {})
+
+    @classmethod
+    def __resolve(
+        cls,
+        reraising: _T_COMPILED_RULES,
+        exc_type: t.Type[BaseException],
+    ) -> t.Optional[_T_COMPILED_ACTION]:
+        # early-return rules
+        if (
+            issubclass(exc_type, cls)
+            or not reraising
+            or FatalMixin in exc_type.__bases__
+        ):
+            return None
 
         # greedy remapping (any occurred exception)
-        if reraising_ is True:
-            kls = t.cast("t.Type[Exception]", cls)
-            return kls(**remap_kwargs)
+        if reraising is True:
+            return cls.__greedy
 
-        reraising__ = t.cast(
+        reraising_ = t.cast(
             "t.Tuple[t.Tuple[_T_EXC_CLASS_OR_TUPLE, _T_COMPILED_ACTION], ...]",
-            reraising_,
+            reraising,
         )
+        for match, action in reraising_:
+            if issubclass(exc_type, match):
+                return action
 
-        for match, rule in reraising__:
-            if not isinstance(exc, match):
-                continue
-
-            e = rule(exc, remap_kwargs)
-            if e is None:
-                break
+        return None
 
-            return e
+    @classmethod
+    def __remap_item(
+        cls,
+        exc: Exception,
+        reraising: _T_COMPILED_RULES,
+        remap_kwargs: _T_KWARGS,
+        cache: _T_RESOLVE_CACHE,
+    ) -> Exception:
+        if _utils.EXCEPTION_GROUP and isinstance(exc, _utils.EXCEPTION_GROUP):
+            group = t.cast("_T_GROUP", exc)
+            return t.cast(
+                "Exception",
+                cls.__remap_group(group, reraising, remap_kwargs, cache),
+            )
+
+        exc_type = exc.__class__
+        if exc_type in cache:
+            action = cache[exc_type]
+        else:
+            action = cache[exc_type] = cls.__resolve(reraising, exc_type)
+        if action is None:
+            return exc
 
-        if original_over_none:
+        e = action(exc, remap_kwargs)
+        if e is None:
             return exc
-        return None
+        e.__cause__ = exc
+        return e
+
+    @classmethod
+    def __remap_group(
+        cls,
+        group: _T_GROUP,
+        reraising: _T_COMPILED_RULES,
+        remap_kwargs: _T_KWARGS,
+        cache: _T_RESOLVE_CACHE,
+    ) -> _T_GROUP:
+        leaves = [
+            cls.__remap_item(exc, reraising, remap_kwargs, cache)
+            if isinstance(exc, Exception)
+            else exc
+            for exc in group.exceptions
+        ]
+        if all(map(operator.is_, leaves, group.exceptions)):
+            return group
+
+        new = group.derive(leaves)
+        new.__cause__ = group.__cause__
+        new.__context__ = group.__context__
+        new.__traceback__ = group.__traceback__
+        if hasattr(group, "__notes__"):
+            new.__notes__ = list(group.__notes__)
+        return new
 
     @classmethod
-    @contextlib.contextmanager
-    def reraise(  # type: ignore[no-untyped-def] # noqa: ANN206
+    def reraise(
         cls,
         reraising: _T_RERAISING = None,
         remap_kwargs: t.Optional[_T_KWARGS] = None,
-    ):
+        *,
+        compact: t.Optional[int] = None,
+        detach: bool = False,
+        strip_frames: bool = False,
+    ) -> _Reraise:
         """
         Context Manager & Decorator to raise class exception over original.
 
         Args:
             reraising: manual overriding reraising rules
             remap_kwargs: provide kwargs for reraise exception
+            compact: compact chain of remapped original exception
+                     to this length (see ``tools.compact_chain``)
+            detach: replace tracebacks of remapped original exception chain
+                    with snapshots (see ``tools.detach_traceback``)
+            strip_frames: drop ``izulu`` frames from tracebacks of remapped
+                          exception and its chain
+                          (see ``tools.strip_frames``)
 
         """
-        try:
-            yield
-        except Exception as e:  # noqa: BLE001
-            orig = e
-        else:
-            return
-
-        exc = cls.remap(
-            exc=orig,
-            reraising=reraising,
-            remap_kwargs=remap_kwargs,
+        return _Reraise(
+            cls,
+            dict(
+                reraising=reraising,
+                remap_kwargs=remap_kwargs,
+                compact=compact,
+                detach=detach,
+            ),
+            strip_frames=strip_frames,
         )
-        if exc is None:
-            raise  # noqa: PLE0704
-
-        raise exc from orig
 
     @classmethod
-    @contextlib.asynccontextmanager
-    async def async_reraise(  # type: ignore[no-untyped-def] # noqa: ANN206
+    def async_reraise(
         cls,
         reraising: _T_RERAISING = None,
         remap_kwargs: t.Optional[_T_KWARGS] = None,
-    ):
+        *,
+        compact: t.Optional[int] = None,
+        detach: bool = False,
+        strip_frames: bool = False,
+    ) -> _Reraise:
         """
         Async version of `reraise`.
 
         Args:
             reraising: manual overriding reraising rules
             remap_kwargs: provide kwargs for reraise exception
+            compact: compact chain of remapped original exception
+                     to this length (see ``tools.compact_chain``)
+            detach: replace tracebacks of remapped original exception chain
+                    with snapshots (see ``tools.detach_traceback``)
+            strip_frames: drop ``izulu`` frames from tracebacks of remapped
+                          exception and its chain
+                          (see ``tools.strip_frames``)
 
         """
-        with cls.reraise(reraising=reraising, remap_kwargs=remap_kwargs):
-            yield
+        return cls.reraise(
+            reraising=reraising,
+            remap_kwargs=remap_kwargs,
+            compact=compact,
+            detach=detach,
+            strip_frames=strip_frames,
+        )
+
+
+class _Reraise:
+    """
+    Context Manager & Decorator behind ``ReraisingMixin.reraise``.
+
+    Class-based implementation doesn't add ``contextlib`` and generator
+    frames to tracebacks: exceptions left as is pass through untouched and
+    remapped exceptions get the only frame of the place they are raised at.
+    """
+
+    __slots__ = ("_kls", "_remap_kwargs", "_strip_frames")
+
+    def __init__(
+        self,
+        kls: t.Type[ReraisingMixin],
+        remap_kwargs: t.Dict[str, t.Any],
+        *,
+        strip_frames: bool,
+    ) -> None:
+        self._kls = kls
+        self._remap_kwargs = remap_kwargs
+        self._strip_frames = strip_frames
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: t.Optional[t.Type[BaseException]],
+        exc: t.Optional[BaseException],
+        tb: t.Optional[types.TracebackType],
+    ) -> t.Literal[False]:
+        if not isinstance(exc, Exception):
+            return False
+
+        remapped = self._remap(exc)
+        if remapped is None:
+            return False
+
+        # frame raising remapped exception is stripped after the raise,
+        # bare ``raise`` doesn't add it again
+        try:
+            raise remapped from exc  # noqa: TRY301
+        except Exception:
+            self._strip(remapped)
+            raise
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(
+        self,
+        exc_type: t.Optional[t.Type[BaseException]],
+        exc: t.Optional[BaseException],
+        tb: t.Optional[types.TracebackType],
+    ) -> t.Literal[False]:
+        if not isinstance(exc, Exception):
+            return False
+
+        remapped = self._remap(exc)
+        if remapped is None:
+            return False
+
+        try:
+            raise remapped from exc  # noqa: TRY301
+        except Exception:
+            self._strip(remapped)
+            raise
+
+    def __call__(
+        self,
+        func: t.Callable[DecParam, DecReturnType],
+    ) -> t.Callable[DecParam, DecReturnType]:
+        if inspect.iscoroutinefunction(func):
+            return self.__wrap_coroutine_function(func)
+
+        @functools.wraps(func)
+        def wrapper(
+            *args: DecParam.args,
+            **kwargs: DecParam.kwargs,
+        ) -> DecReturnType:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                remapped = self._remap(e)
+                if remapped is None:
+                    raise
+                try:
+                    raise remapped from e  # noqa: TRY301
+                except Exception:
+                    self._strip(remapped)
+                    raise
+
+        return wrapper
+
+    def __wrap_coroutine_function(
+        self,
+        func: t.Callable[DecParam, t.Any],
+    ) -> t.Callable[DecParam, t.Any]:
+        # exceptions of coroutine functions are raised on awaiting
+        @functools.wraps(func)
+        async def wrapper(
+            *args: DecParam.args,
+            **kwargs: DecParam.kwargs,
+        ) -> t.Any:  # noqa: ANN401
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                remapped = self._remap(e)
+                if remapped is None:
+                    raise
+                try:
+                    raise remapped from e  # noqa: TRY301
+                except Exception:
+                    self._strip(remapped)
+                    raise
+
+        return wrapper
+
+    def _remap(self, exc: Exception) -> t.Optional[Exception]:
+        remapped = self._kls.remap(exc, **self._remap_kwargs)
+        if remapped is not None and self._strip_frames:
+            tools.strip_frames(exc)
+        return remapped
+
+    def _strip(self, remapped: Exception) -> None:
+        if self._strip_frames:
+            tools.strip_frames(remapped, chain=False)
 
 
 def skip(target: t.Type[Exception]) -> _T_RULE:
@@ -1,21 +1,39 @@
 from __future__ import annotations
 
 import _string  # type: ignore[import-not-found]  # noqa: PLC2701
+import builtins
+import collections
 import dataclasses
 import string
+import threading
+import types
 import typing as t
 
 if t.TYPE_CHECKING:
-    import types
+    from izulu import root
 
 _IZULU_ATTRS = {
     "__template__",
     "__toggles__",
+    "__limits__",
+    "__contextvars__",
+    "__frozen__",
     "_Error__cls_store",
     "__reraising__",
     "_ReraisingMixin__reraising",
+    "_ReraisingMixin__greedy",
 }
 _FORMATTER = string.Formatter()
+_ELLIPSIS = "..."
+# types having ``str()`` the same as ``repr()``
+_STR_AS_REPR = (list, tuple, dict, set, frozenset, collections.deque)
+
+# ``None`` for Python < 3.11
+EXCEPTION_GROUP: t.Optional[type] = getattr(
+    builtins,
+    "BaseExceptionGroup",
+    None,
+)
 
 
 def collect_annotations(cls: type) -> dict[str, t.Any]:
@@ -26,6 +44,110 @@ def collect_annotations(cls: type) -> dict[str, t.Any]:
     return merged
 
 
+class FieldRef:
+    """
+    Base descriptor for fields stored in a form different from the value.
+
+    ``pack`` converts provided value into stored form (in ``kwargs`` and
+    instance attributes), ``unpack`` converts it back on access.
+    """
+
+    __slots__ = ("_name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(
+        self,
+        instance: t.Optional[object],
+        owner: t.Optional[type] = None,
+    ) -> t.Any:  # noqa: ANN401
+        if instance is None:
+            return self
+        try:
+            value = instance.__dict__[self._name]
+        except KeyError:
+            raise AttributeError(self._name) from None
+        return self.unpack(value)
+
+    def __set__(self, instance: object, value: t.Any) -> None:  # noqa: ANN401
+        instance.__dict__[self._name] = value
+
+    def pack(self, value: t.Any) -> t.Any:  # noqa: ANN401
+        raise NotImplementedError
+
+    def unpack(self, value: t.Any) -> t.Any:  # noqa: ANN401, PLR6301
+        return value
+
+
+class _FactoryLock:
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.users = 0
+
+
+# instance locks of running factory evaluations (by instance id)
+_FACTORY_LOCKS: t.Dict[int, _FactoryLock] = {}
+_FACTORY_LOCKS_GUARD = threading.Lock()
+
+
+class Factory:
+    """
+    Descriptor evaluating dynamic default once per instance.
+
+    Evaluated value is stored into instance ``__dict__`` taking precedence
+    over this (non-data) descriptor, so subsequent reads never reach it.
+    The first evaluation runs under the lock of the instance: concurrent
+    readers of the same instance get the same value, while other instances
+    never wait. The lock is reentrant, so factories may read other factory
+    fields of the instance. It exists only while evaluation is running and
+    is never stored into the instance.
+    """
+
+    __slots__ = ("attrname", "func")
+
+    def __init__(self, func: t.Callable[[t.Any], t.Any]) -> None:
+        self.func = func
+        self.attrname: t.Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    def __get__(
+        self,
+        instance: t.Optional[object],
+        owner: t.Optional[type] = None,
+    ) -> t.Any:  # noqa: ANN401
+        if instance is None:
+            return self
+        if self.attrname is None:
+            raise TypeError("Factory is used without __set_name__() call")
+        cache = instance.__dict__
+        key = id(instance)  # unique while instance is alive (during call)
+        with _FACTORY_LOCKS_GUARD:
+            entry = _FACTORY_LOCKS.get(key)
+            if entry is None:
+                entry = _FACTORY_LOCKS[key] = _FactoryLock()
+            entry.users += 1
+        try:
+            with entry.lock:
+                if self.attrname not in cache:
+                    cache[self.attrname] = self.func(instance)
+                return cache[self.attrname]
+        finally:
+            with _FACTORY_LOCKS_GUARD:
+                entry.users -= 1
+                if not entry.users:
+                    del _FACTORY_LOCKS[key]
+
+
+_EMPTY_REFS: types.MappingProxyType[str, FieldRef] = types.MappingProxyType(
+    {},
+)
+
+
 # TODO(d.burmistrov): dataclass options
 @dataclasses.dataclass
 class Store:
@@ -34,6 +156,9 @@ class Store:
     inst_hints: types.MappingProxyType[str, type]
     consts: types.MappingProxyType[str, t.Any]
     defaults: t.FrozenSet[str]
+    refs: types.MappingProxyType[str, FieldRef] = dataclasses.field(
+        default_factory=lambda: _EMPTY_REFS,
+    )
 
     registered: t.FrozenSet[str] = dataclasses.field(init=False)
 
@@ -75,20 +200,98 @@ def check_unannotated_fields(store: Store) -> None:
         raise ValueError(msg)
 
 
+def is_immutable(value: t.Any) -> bool:  # noqa: ANN401
+    # value-based ``__hash__`` is taken as the sign of immutable type
+    if value is None:
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(is_immutable, value))
+    hash_: t.Any = type(value).__hash__
+    return hash_ is not None and hash_ is not object.__hash__
+
+
 def join_items(items: t.Iterable[str]) -> str:
     return ", ".join(map("'{}'".format, items))
 
 
-def join_kwargs(**kwargs: t.Any) -> str:  # noqa: ANN401
-    return ", ".join(f"{k!s}={v!r}" for k, v in kwargs.items())
+def join_kwargs(
+    limits: t.Optional[root.Limits] = None,
+    /,
+    **kwargs: t.Any,  # noqa: ANN401
+) -> str:
+    if limits is None:
+        return ", ".join(f"{k!s}={v!r}" for k, v in kwargs.items())
+    return ", ".join(
+        f"{k!s}={bounded_repr(v, limits)}" for k, v in kwargs.items()
+    )
 
 
-def format_template(template: str, kwargs: t.Dict[str, t.Any]) -> str:
+def format_template(
+    template: str,
+    kwargs: t.Dict[str, t.Any],
+    limits: t.Optional[root.Limits] = None,
+) -> str:
     try:
-        return template.format_map(kwargs)
+        if limits is None:
+            return template.format_map(kwargs)
+        bounded = {k: _Bounded(v, limits) for k, v in kwargs.items()}
+        return truncate(template.format_map(bounded), limits.message)
     except Exception as e:
         msg_part = "Failed to format template with provided kwargs: "
-        raise ValueError(msg_part + join_kwargs(**kwargs)) from e
+        raise ValueError(msg_part + join_kwargs(limits, **kwargs)) from e
+
+
+def truncate(text: str, size: t.Optional[int]) -> str:
+    if size is None or len(text) <= size:
+        return text
+    if size <= len(_ELLIPSIS):
+        return text[:size]
+    return text[: size - len(_ELLIPSIS)] + _ELLIPSIS
+
+
+def bounded_repr(value: t.Any, limits: root.Limits) -> str:  # noqa: ANN401
+    return truncate(limits.repr_.repr(value), limits.field)
+
+
+def bounded_str(value: t.Any, limits: root.Limits) -> str:  # noqa: ANN401
+    if isinstance(value, str):
+        return truncate(value, limits.field)
+    if isinstance(value, _STR_AS_REPR):
+        return bounded_repr(value, limits)
+    return truncate(str(value), limits.field)
+
+
+class _Bounded:
+    """Template value proxy rendering the value within limits."""
+
+    __slots__ = ("_limits", "_value")
+
+    def __init__(self, value: t.Any, limits: root.Limits) -> None:  # noqa: ANN401
+        self._value = value
+        self._limits = limits
+
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec or isinstance(self._value, str):
+            # bound the value itself, padding is not counted against limits
+            return format(bounded_str(self._value, self._limits), format_spec)
+        formatted = format(self._value, format_spec)
+        content = formatted.strip()
+        bounded = truncate(content, self._limits.field)
+        if bounded is content:
+            return formatted
+        return formatted.replace(content, bounded, 1)
+
+    def __str__(self) -> str:
+        return bounded_str(self._value, self._limits)
+
+    def __repr__(self) -> str:
+        return bounded_repr(self._value, self._limits)
+
+    def __getattr__(self, name: str) -> _Bounded:
+        return _Bounded(getattr(self._value, name), self._limits)
+
+    def __getitem__(self, key: t.Any) -> _Bounded:  # noqa: ANN401
+        return _Bounded(self._value[key], self._limits)
 
 
 def iter_fields(template: str) -> t.Generator[str, None, None]:
@@ -122,6 +325,18 @@ def get_cls_defaults(
     return {attr: getattr(cls, attr) for attr in attrs if hasattr(cls, attr)}
 
 
+def get_cls_refs(
+    cls: type,
+    attrs: t.Iterable[str],
+) -> t.Dict[str, FieldRef]:
+    refs = {}
+    for attr in attrs:
+        value = getattr(cls, attr, None)
+        if isinstance(value, FieldRef):
+            refs[attr] = value
+    return refs
+
+
 def traverse_tree(cls: type) -> t.Generator[type, None, None]:
     workload = cls.__subclasses__()
     discovered = []
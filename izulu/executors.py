@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import concurrent.futures as cf
+import typing as t
+
+from izulu import _reraise
+from izulu import tools
+
+_T_REMAPPER = t.Union[t.Type[_reraise.ReraisingMixin], _reraise.chain]
+_T_RESULT = t.TypeVar("_T_RESULT")
+
+
+class _Remapped(Exception):  # noqa: N818
+    """
+    Transport of error remapped in worker.
+
+    Pickled compactly: izulu errors are rebuilt from their state without
+    ``__init__`` (no validation, factories or template formatting),
+    other exceptions are pickled as usual.
+    """
+
+    def __init__(self, error: Exception) -> None:
+        super().__init__()
+        self.error = error
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        error = self.error
+        store = getattr(error, "_Error__cls_store", None)
+        if store is None or store.refs:  # weak refs can't be transferred
+            return _Remapped, (error,)
+        state = error.__dict__.copy()
+        state.pop(tools._CONTEXT_ATTR, None)  # noqa: SLF001
+        state.pop("_Error__hash", None)  # hash is process specific
+        return _restore, (type(error), error.args, state)
+
+    def unwrap(self) -> Exception:
+        """Return remapped error caused by original (or remote traceback)."""
+        error = self.error
+        if error.__cause__ is None:
+            error.__cause__ = self.__cause__
+            error.__suppress_context__ = True
+        return error
+
+
+def _restore(
+    kls: t.Type[Exception],
+    args: t.Tuple[t.Any, ...],
+    state: t.Dict[str, t.Any],
+) -> _Remapped:
+    error = kls.__new__(kls)
+    error.args = args
+    error.__dict__.update(state)
+    return _Remapped(error)
+
+
+def _remap(
+    remapper: _T_REMAPPER,
+    exc: Exception,
+    remap_kwargs: t.Optional[_reraise._T_KWARGS],
+) -> t.Optional[Exception]:
+    if isinstance(remapper, _reraise.chain):
+        return remapper(type(exc), exc, remap_kwargs=remap_kwargs)
+    return remapper.remap(exc, remap_kwargs=remap_kwargs)
+
+
+def _call(
+    remapper: _T_REMAPPER,
+    remap_kwargs: t.Optional[_reraise._T_KWARGS],
+    fn: t.Callable[..., _T_RESULT],
+    /,
+    *args: t.Any,  # noqa: ANN401
+    **kwargs: t.Any,  # noqa: ANN401
+) -> _T_RESULT:
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        remapped = _remap(remapper, e, remap_kwargs)
+        if remapped is None:
+            raise
+        raise _Remapped(remapped) from e
+
+
+class _Future(cf.Future[t.Any]):
+    """Future resolved by worker future with unwrapped remapped errors."""
+
+    def __init__(self, inner: cf.Future[t.Any]) -> None:
+        super().__init__()
+        self._inner = inner
+        inner.add_done_callback(self.__resolve)
+
+    def __resolve(self, inner: cf.Future[t.Any]) -> None:
+        if inner.cancelled():
+            super().cancel()
+            self.set_running_or_notify_cancel()  # wake up waiters
+            return
+        exc = inner.exception()
+        if isinstance(exc, _Remapped):
+            self.set_exception(exc.unwrap())
+        elif exc is not None:
+            self.set_exception(exc)
+        else:
+            self.set_result(inner.result())
+
+    def cancel(self) -> bool:
+        return self._inner.cancel()
+
+    def running(self) -> bool:
+        return self._inner.running()
+
+
+class RemappingExecutor(cf.Executor):
+    """
+    Executor wrapper remapping exceptions of submitted calls in workers.
+
+    Exceptions are remapped inside the worker (with ``ReraisingMixin``
+    class or ``chain``), so only remapped errors are sent back. For process
+    pools izulu errors are transferred as compact state and rebuilt in the
+    parent without validation, factories and template formatting.
+    Remapped errors get original exception as ``__cause__`` (thread pools)
+    or remote traceback (process pools).
+
+    Example::
+
+        with RemappingExecutor(ProcessPoolExecutor(), AppError) as executor:
+            future = executor.submit(func, 42)
+
+    Args:
+        executor: wrapped executor (shut down by the wrapper)
+        remapper: ``ReraisingMixin`` class or ``chain`` remapping exceptions
+        remap_kwargs: provide kwargs for remapped exceptions
+
+    """
+
+    def __init__(
+        self,
+        executor: cf.Executor,
+        remapper: _T_REMAPPER,
+        *,
+        remap_kwargs: t.Optional[_reraise._T_KWARGS] = None,
+    ) -> None:
+        self._executor = executor
+        self._remapper = remapper
+        self._remap_kwargs = remap_kwargs
+
+    def submit(
+        self,
+        fn: t.Callable[..., _T_RESULT],
+        /,
+        *args: t.Any,  # noqa: ANN401
+        **kwargs: t.Any,  # noqa: ANN401
+    ) -> cf.Future[_T_RESULT]:
+        inner = self._executor.submit(
+            _call,
+            self._remapper,
+            self._remap_kwargs,
+            fn,
+            *args,
+            **kwargs,
+        )
+        return _Future(inner)
+
+    def shutdown(
+        self,
+        wait: bool = True,  # noqa: FBT001, FBT002
+        *,
+        cancel_futures: bool = False,
+    ) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+import traceback
+import typing as t
+
+from izulu import tools
+
+if t.TYPE_CHECKING:
+    import types
+
+_T_SINK = t.Union[t.Callable[[t.List[str]], None], t.TextIO]
+_T_POLICY = t.Literal["drop", "block", "sample"]
+_POLICIES = ("drop", "block", "sample")
+_STOP = object()
+
+
+class LogEntry(t.NamedTuple):
+    """Compact log record: only references, nothing is formatted."""
+
+    created: float
+    level: str
+    logger: str
+    msg: t.Any
+    args: t.Any
+    exc: t.Optional[BaseException]
+
+    @classmethod
+    def from_record(cls, record: logging.LogRecord) -> LogEntry:
+        """Capture log record (without formatting message)."""
+        return cls(
+            created=record.created,
+            level=record.levelname,
+            logger=record.name,
+            msg=record.msg,
+            args=record.args,
+            exc=error_of(record),
+        )
+
+    @property
+    def message(self) -> str:
+        """Formatted message (the same way ``LogRecord.getMessage`` does)."""
+        msg = str(self.msg)
+        if self.args:
+            msg %= self.args
+        return msg
+
+
+def error_of(record: logging.LogRecord) -> t.Optional[BaseException]:
+    """Return exception of log record (``exc_info`` or logged exception)."""
+    if record.exc_info and record.exc_info[1] is not None:
+        return record.exc_info[1]
+    if isinstance(record.msg, BaseException):
+        return record.msg
+    return None
+
+
+class ErrorFilter(logging.Filter):
+    """
+    Pass only log records carrying exceptions.
+
+    Args:
+        name: logger name filter (see ``logging.Filter``)
+        izulu_only: pass only records carrying ``izulu`` errors
+
+    """
+
+    def __init__(self, name: str = "", *, izulu_only: bool = True) -> None:
+        super().__init__(name)
+        self._izulu_only = izulu_only
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return ``True`` if record should be passed."""
+        if not super().filter(record):
+            return False
+        exc = error_of(record)
+        if exc is None:
+            return False
+        return not self._izulu_only or hasattr(exc, "_Error__cls_store")
+
+
+class ErrorHandler(logging.Handler):
+    """
+    Handler passing compact records to ``ErrorWriter``.
+
+    Only references are captured in the logging thread: message formatting,
+    ``tools.dump`` and serialization happen in writer's thread.
+
+    Args:
+        writer: background writer
+        level: handler level
+
+    """
+
+    def __init__(
+        self,
+        writer: ErrorWriter,
+        level: int = logging.NOTSET,
+    ) -> None:
+        super().__init__(level)
+        self.writer = writer
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Submit compact record to writer."""
+        try:
+            self.writer.submit(LogEntry.from_record(record))
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+
+class ErrorWriter:
+    """
+    Background thread dumping and serializing log entries in batches.
+
+    Entries are written as JSON lines with ``time``, ``level``, ``logger``,
+    ``message`` and ``error`` (``tools.dump`` of exception) keys.
+
+    Queue is bounded, policies for full queue:
+
+    * ``"drop"`` - drop new entries
+    * ``"block"`` - block logging thread until there is free space
+    * ``"sample"`` - drop new entries except every ``sample_every``-th
+      (it blocks)
+
+    Args:
+        sink: text stream or callable receiving batch of serialized lines
+        maxsize: max queue size
+        policy: full queue policy
+        sample_every: sampling rate of ``"sample"`` policy
+        batch_size: max number of entries written at once
+        interval: max seconds to wait for batch to be filled
+        profile: ``tools.DumpProfile`` (or its name) to dump errors with
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        sink: _T_SINK,
+        *,
+        maxsize: int = 10_000,
+        policy: _T_POLICY = "drop",
+        sample_every: int = 100,
+        batch_size: int = 100,
+        interval: float = 1.0,
+        profile: t.Union[str, tools.DumpProfile, None] = None,
+    ) -> None:
+        if policy not in _POLICIES:
+            raise ValueError(f"Unsupported policy: {policy!r}")
+        self._sink = sink
+        self._policy = policy
+        self._sample_every = sample_every
+        self._batch_size = batch_size
+        self._interval = interval
+        self._profile = profile
+        self._queue: queue.Queue[t.Any] = queue.Queue(maxsize)
+        self._thread: t.Optional[threading.Thread] = None
+        self.dropped = 0
+        self.failed = 0
+
+    def submit(self, entry: LogEntry) -> bool:
+        """Enqueue entry (according to policy), return ``False`` if dropped."""
+        if self._policy == "block":
+            self._queue.put(entry)
+            return True
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            if self._policy == "drop" or self.dropped % self._sample_every:
+                return False
+            self._queue.put(entry)
+        return True
+
+    def start(self) -> None:
+        """Start background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self.__run,
+            name="izulu-log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write the rest of entries and stop background thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> ErrorWriter:  # noqa: PYI034
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: t.Optional[t.Type[BaseException]],
+        exc_value: t.Optional[BaseException],
+        exc_tb: t.Optional[types.TracebackType],
+    ) -> None:
+        self.stop()
+
+    def __run(self) -> None:
+        stopped = False
+        while not stopped:
+            batch, stopped = self.__collect()
+            if batch:
+                self.__write(batch)
+
+    def __collect(self) -> t.Tuple[t.List[LogEntry], bool]:
+        batch: t.List[LogEntry] = []
+        try:
+            item = self._queue.get(timeout=self._interval)
+        except queue.Empty:
+            return batch, False
+        deadline = time.monotonic() + self._interval
+        while item is not _STOP:
+            batch.append(item)
+            timeout = deadline - time.monotonic()
+            if len(batch) >= self._batch_size or timeout <= 0:
+                return batch, False
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def __write(self, batch: t.List[LogEntry]) -> None:
+        try:
+            lines = [json.dumps(self.render(e), default=str) for e in batch]
+            self.__emit(lines)
+        except Exception:  # noqa: BLE001
+            # logging here may get back into the writer
+            self.failed += len(batch)
+            traceback.print_exc(file=sys.stderr)
+
+    def __emit(self, lines: t.List[str]) -> None:
+        if callable(self._sink):
+            self._sink(lines)
+        else:
+            self._sink.write("".join(line + "\n" for line in lines))
+            self._sink.flush()
+
+    def render(self, entry: LogEntry) -> t.Dict[str, t.Any]:
+        """Return serializable representation of log entry."""
+        data: t.Dict[str, t.Any] = dict(
+            time=entry.created,
+            level=entry.level,
+            logger=entry.logger,
+            message=entry.message,
+        )
+        if entry.exc is not None:
+            data["error"] = tools.dump(entry.exc, profile=self._profile)
+        return data
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import math
+import os
+import pathlib
+import threading
+import time
+import typing as t
+
+from izulu import _reraise
+from izulu import profiling
+from izulu import root
+from izulu import tools
+
+# seconds
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 1e-3, math.inf)
+
+_T_KEY = t.Tuple[str, ...]
+
+
+class HistogramDumpDict(t.TypedDict):
+    buckets: t.Dict[float, int]  # cumulative, Prometheus-style
+    sum: float
+    count: int
+
+
+class MetricsDumpDict(t.TypedDict):
+    errors: t.Dict[str, int]
+    remaps: t.Dict[t.Tuple[str, str], int]
+    suppressed: t.Dict[str, int]
+    init_seconds: t.Dict[str, HistogramDumpDict]
+    remap_seconds: t.Dict[t.Tuple[str, str], HistogramDumpDict]
+
+
+class _Histogram:
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(BUCKETS)
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+
+    def merge(self, other: _Histogram) -> None:
+        for i, n in enumerate(list(other.counts)):
+            self.counts[i] += n
+        self.total += other.total
+
+    def dump(self) -> HistogramDumpDict:
+        cumulative: t.Dict[float, int] = {}
+        count = 0
+        for bound, n in zip(BUCKETS, self.counts):
+            count += n
+            cumulative[bound] = count
+        return dict(buckets=cumulative, sum=self.total, count=count)
+
+
+class _Shard:
+    """Metrics of single thread (written only by the owner thread)."""
+
+    __slots__ = ("counters", "dropped", "histograms", "owner")
+
+    def __init__(self, owner: t.Optional[threading.Thread] = None) -> None:
+        self.owner = owner
+        self.dropped = False
+        self.counters: t.Dict[str, t.Dict[t.Any, int]] = dict(
+            errors={},
+            remaps={},
+            suppressed={},
+        )
+        self.histograms: t.Dict[str, t.Dict[t.Any, _Histogram]] = dict(
+            init_seconds={},
+            remap_seconds={},
+        )
+
+    def merge(self, other: _Shard) -> None:
+        for metric, counter in self.counters.items():
+            for key, value in other.counters[metric].copy().items():
+                counter[key] = counter.get(key, 0) + value
+        for metric, histograms in self.histograms.items():
+            for key, source in other.histograms[metric].copy().items():
+                histogram = histograms.get(key)
+                if histogram is None:
+                    histogram = histograms[key] = _Histogram()
+                histogram.merge(source)
+
+
+class _Registry:
+    """
+    Per-thread sharded metrics.
+
+    Hot paths write into shard of the current thread without locking
+    (so instrumented threads never contend), the lock is taken only
+    to register new shard and to merge shards on ``snapshot``.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.timings = False
+        self.originals: t.Dict[str, t.Any] = {}
+        self.local = threading.local()
+        self.shards: t.List[_Shard] = []
+        self.retired = _Shard()  # merged shards of finished threads
+
+    def reset(self) -> None:
+        with self.lock:
+            for shard in self.shards:
+                shard.dropped = True
+            self.shards = []
+            self.retired = _Shard()
+
+    def shard(self) -> _Shard:
+        shard: t.Optional[_Shard] = getattr(self.local, "shard", None)
+        if shard is None or shard.dropped:
+            shard = self.local.shard = _Shard(threading.current_thread())
+            with self.lock:
+                self.shards.append(shard)
+        return shard
+
+    def count(self, metric: str, key: t.Any) -> None:  # noqa: ANN401
+        counter = self.shard().counters[metric]
+        counter[key] = counter.get(key, 0) + 1
+
+    def observe(self, metric: str, key: t.Any, ns: int) -> None:  # noqa: ANN401
+        histograms = self.shard().histograms[metric]
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = _Histogram()
+        histogram.observe(ns / 1e9)
+
+    def merged(self) -> _Shard:
+        result = _Shard()
+        with self.lock:
+            alive = []
+            for shard in self.shards:
+                if shard.owner is not None and shard.owner.is_alive():
+                    alive.append(shard)
+                else:  # nobody writes it anymore
+                    self.retired.merge(shard)
+            self.shards = alive
+            for shard in (self.retired, *alive):
+                result.merge(shard)
+        return result
+
+
+_REGISTRY = _Registry()
+
+
+def _name(kls: type) -> str:
+    return f"{kls.__module__}.{kls.__qualname__}"
+
+
+def _instrument_init(
+    init: t.Callable[..., None],
+) -> t.Callable[..., None]:
+    @functools.wraps(init)
+    def __init__(self: root.Error, **kwargs: t.Any) -> None:  # noqa: ANN401, N807
+        if not _REGISTRY.timings:
+            init(self, **kwargs)
+        else:
+            start = time.perf_counter_ns()
+            init(self, **kwargs)
+            elapsed = time.perf_counter_ns() - start
+            _REGISTRY.observe("init_seconds", type(self), elapsed)
+        _REGISTRY.count("errors", type(self))
+
+    return __init__
+
+
+def _instrument_remap(
+    remap: t.Callable[..., t.Optional[Exception]],
+) -> t.Callable[..., t.Optional[Exception]]:
+    @functools.wraps(remap)
+    def wrapper(
+        cls: t.Type[_reraise.ReraisingMixin],
+        exc: Exception,
+        **kwargs: t.Any,  # noqa: ANN401
+    ) -> t.Optional[Exception]:
+        start = time.perf_counter_ns()
+        remapped = remap(cls, exc, **kwargs)
+        elapsed = time.perf_counter_ns() - start
+        if remapped is not None and remapped is not exc:
+            key = (type(exc), type(remapped))
+            _REGISTRY.count("remaps", key)
+            if _REGISTRY.timings:
+                _REGISTRY.observe("remap_seconds", key, elapsed)
+        return remapped
+
+    return wrapper
+
+
+def _instrument_suppressed(
+    suppressed: t.Callable[[tools.suppress, BaseException], None],
+) -> t.Callable[[tools.suppress, BaseException], None]:
+    @functools.wraps(suppressed)
+    def wrapper(self: tools.suppress, exc: BaseException) -> None:
+        _REGISTRY.count("suppressed", type(exc))
+        suppressed(self, exc)
+
+    return wrapper
+
+
+def enable(*, timings: bool = False) -> None:
+    """
+    Install instrumentation (it costs nothing until enabled).
+
+    Counted are: constructed errors per class, remaps per source and target
+    classes (``ReraisingMixin.remap``, so ``reraise`` too) and exceptions
+    suppressed by ``tools.suppress`` per class.
+
+    Args:
+        timings: also collect histograms of construction and remap time
+
+    Raises:
+        RuntimeError: profiling is enabled (instrumentations can't be combined)
+
+    """
+    if profiling.is_enabled():
+        raise RuntimeError("Metrics can't be combined with profiling")
+    with _REGISTRY.lock:
+        _REGISTRY.timings = timings
+        if _REGISTRY.originals:
+            return
+        mixin = _reraise.ReraisingMixin
+        _REGISTRY.originals = dict(
+            init=root.Error.__init__,
+            remap=mixin.__dict__["remap"],
+            suppressed=tools.suppress._suppressed,  # noqa: SLF001
+        )
+        root.Error.__init__ = _instrument_init(root.Error.__init__)  # type: ignore[method-assign]
+        mixin.remap = classmethod(  # type: ignore[method-assign, assignment]
+            _instrument_remap(mixin.__dict__["remap"].__func__),
+        )
+        tools.suppress._suppressed = _instrument_suppressed(  # type: ignore[method-assign, assignment]  # noqa: SLF001
+            tools.suppress._suppressed,  # noqa: SLF001
+        )
+
+
+def disable() -> None:
+    """Uninstall instrumentation (collected metrics are kept)."""
+    with _REGISTRY.lock:
+        originals, _REGISTRY.originals = _REGISTRY.originals, {}
+        if not originals:
+            return
+        root.Error.__init__ = originals["init"]  # type: ignore[method-assign]
+        _reraise.ReraisingMixin.remap = originals["remap"]  # type: ignore[method-assign]
+        tools.suppress._suppressed = originals["suppressed"]  # type: ignore[method-assign]  # noqa: SLF001
+
+
+def is_enabled() -> bool:
+    """Return ``True`` if instrumentation is installed."""
+    return bool(_REGISTRY.originals)
+
+
+def reset() -> None:
+    """Drop collected metrics."""
+    _REGISTRY.reset()
+
+
+def snapshot() -> MetricsDumpDict:
+    """Return copy of collected metrics (classes are referred by name)."""
+    merged = _REGISTRY.merged()
+    counters = merged.counters
+    histograms = merged.histograms
+    return dict(
+        errors=_sum_by_name(counters["errors"]),
+        remaps=_sum_by_name(counters["remaps"]),
+        suppressed=_sum_by_name(counters["suppressed"]),
+        init_seconds={
+            _name(k): v.dump() for k, v in histograms["init_seconds"].items()
+        },
+        remap_seconds={
+            (_name(src), _name(dst)): v.dump()
+            for (src, dst), v in histograms["remap_seconds"].items()
+        },
+    )
+
+
+def _sum_by_name(counter: t.Dict[t.Any, int]) -> t.Dict[t.Any, int]:
+    # different classes may share the name (e.g. dynamically created)
+    result: t.Dict[t.Any, int] = {}
+    for key, value in counter.items():
+        name = tuple(map(_name, key)) if isinstance(key, tuple) else _name(key)
+        result[name] = result.get(name, 0) + value
+    return result
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(names: _T_KEY, values: _T_KEY) -> str:
+    pairs = (f'{k}="{_escape(v)}"' for k, v in zip(names, values))
+    return "{" + ",".join(pairs) + "}"
+
+
+def _render_counter(
+    name: str,
+    help_: str,
+    labels: _T_KEY,
+    values: t.Mapping[t.Any, int],
+) -> t.List[str]:
+    lines = [f"# HELP {name} {help_}", f"# TYPE {name} counter"]
+    for key, value in values.items():
+        key_ = key if isinstance(key, tuple) else (key,)
+        lines.append(f"{name}{_labels(labels, key_)} {value}")
+    return lines
+
+
+def _render_histogram(
+    name: str,
+    help_: str,
+    labels: _T_KEY,
+    values: t.Mapping[t.Any, HistogramDumpDict],
+) -> t.List[str]:
+    lines = [f"# HELP {name} {help_}", f"# TYPE {name} histogram"]
+    for key, value in values.items():
+        key_ = key if isinstance(key, tuple) else (key,)
+        for bound, count in value["buckets"].items():
+            le = "+Inf" if bound == math.inf else repr(bound)
+            bucket_labels = _labels((*labels, "le"), (*key_, le))
+            lines.append(f"{name}_bucket{bucket_labels} {count}")
+        lines.extend(
+            (
+                f"{name}_sum{_labels(labels, key_)} {value['sum']!r}",
+                f"{name}_count{_labels(labels, key_)} {value['count']}",
+            )
+        )
+    return lines
+
+
+def render_prometheus(
+    path: t.Union[str, os.PathLike[str], None] = None,
+) -> str:
+    """
+    Render metrics in Prometheus text exposition format.
+
+    Args:
+        path: if provided, rendered metrics are also written to this file
+            (e.g. for node exporter textfile collector) atomically
+
+    Returns:
+        rendered metrics
+
+    """
+    data = snapshot()
+    lines = [
+        *_render_counter(
+            "izulu_errors_total",
+            "Constructed errors.",
+            ("class",),
+            data["errors"],
+        ),
+        *_render_counter(
+            "izulu_remaps_total",
+            "Remapped exceptions.",
+            ("source", "target"),
+            data["remaps"],
+        ),
+        *_render_counter(
+            "izulu_suppressed_total",
+            "Exceptions suppressed by tools.suppress.",
+            ("class",),
+            data["suppressed"],
+        ),
+    ]
+    if data["init_seconds"] or data["remap_seconds"]:
+        lines.extend(
+            _render_histogram(
+                "izulu_init_seconds",
+                "Error construction time.",
+                ("class",),
+                data["init_seconds"],
+            ),
+        )
+        lines.extend(
+            _render_histogram(
+                "izulu_remap_seconds",
+                "Exception remapping time.",
+                ("source", "target"),
+                data["remap_seconds"],
+            ),
+        )
+    text = "\n".join(lines) + "\n"
+    if path is not None:
+        # atomic replace, so scrapers never read partially written file
+        tmp = pathlib.Path(f"{os.fspath(path)}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+    return text
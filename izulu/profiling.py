@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import functools
+import operator
+import threading
+import time
+import typing as t
+
+from izulu import _reraise
+from izulu import metrics
+from izulu import root
+
+_ns = time.perf_counter_ns
+
+INIT_PHASES = (
+    "pack",
+    "validate",
+    "populate",
+    "defaults",
+    "template",
+    "override",
+    "finalize",
+)
+REMAP_PHASES = ("match", "action", "construct", "finalize")
+
+
+class ProfileDumpDict(t.TypedDict):
+    kind: str  # "init" or "remap"
+    type: str
+    count: int
+    total_ns: int
+    mean_ns: float
+    phases: t.Dict[str, int]  # total ns per phase
+
+
+class _Stats:
+    __slots__ = ("count", "phases")
+
+    def __init__(self, phases: t.Tuple[str, ...]) -> None:
+        self.count = 0
+        self.phases = dict.fromkeys(phases, 0)
+
+
+class _Frame:
+    __slots__ = ("marks", "nested")
+
+    def __init__(self) -> None:
+        self.marks = [_ns()]  # start and ends of phases
+        self.nested = 0  # construction time nested into remap action
+
+
+class _Profiler(threading.local):
+    # per-thread stack of frames of timed ``__init__`` and ``remap`` calls
+    def __init__(self) -> None:
+        self.frames: t.List[_Frame] = []
+
+
+_PROFILER = _Profiler()
+_LOCK = threading.Lock()
+_ORIGINALS: t.Dict[t.Tuple[type, str], t.Any] = {}
+_STATS: t.Dict[t.Tuple[str, type], _Stats] = {}
+
+# phase steps of ``Error.__init__`` and ``ReraisingMixin.remap``
+# (the last one is marked on start too: ``override`` and ``action``
+# phases run between steps)
+_INIT_STEPS = (
+    "_Error__process_kwargs",
+    "_Error__process_toggles",
+    "_Error__populate_attrs",
+    "_Error__process_defaults",
+    "_Error__process_template",
+    "_Error__finalize",
+)
+_REMAP_STEPS = ("_ReraisingMixin__match", "_ReraisingMixin__finalize")
+
+
+def _record(kind: str, kls: type, *durations: int) -> None:
+    phases = INIT_PHASES if kind == "init" else REMAP_PHASES
+    with _LOCK:
+        stats = _STATS.get((kind, kls))
+        if stats is None:
+            stats = _STATS[kind, kls] = _Stats(phases)
+        stats.count += 1
+        for phase, duration in zip(phases, durations):
+            stats.phases[phase] += duration
+
+
+def _mark() -> None:
+    frames = _PROFILER.frames
+    if frames:
+        frames[-1].marks.append(_ns())
+
+
+def _marked(
+    func: t.Callable[..., t.Any],
+    *,
+    start: bool = False,
+) -> t.Callable[..., t.Any]:
+    @functools.wraps(func)
+    def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:  # noqa: ANN401
+        if start:
+            _mark()
+        result = func(*args, **kwargs)
+        _mark()
+        return result
+
+    return wrapper
+
+
+def _init_durations(frame: _Frame, end: int) -> t.List[int]:
+    marks = [*frame.marks[:-1], end]  # ``finalize`` lasts until the end
+    return [b - a for a, b in zip(marks, marks[1:])]
+
+
+def _remap_durations(frame: _Frame, end: int) -> t.List[int]:
+    t0, matched, *finalize = frame.marks
+    acted = finalize[0] if finalize else end  # nothing to finalize
+    return [
+        matched - t0,
+        acted - matched - frame.nested,
+        frame.nested,
+        end - acted,
+    ]
+
+
+def _timed(
+    func: t.Callable[..., t.Any],
+    kind: str,
+    durations: t.Callable[[_Frame, int], t.List[int]],
+) -> t.Callable[..., t.Any]:
+    @functools.wraps(func)
+    def wrapper(target: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Any:  # noqa: ANN401
+        frames = _PROFILER.frames
+        frame = _Frame()
+        frames.append(frame)
+        try:
+            result = func(target, *args, **kwargs)
+        finally:
+            frames.pop()
+        end = _ns()
+        kls = type(target) if kind == "init" else target
+        _record(kind, kls, *durations(frame, end))
+        if frames:
+            # including own overhead, so it's not attributed to remap action
+            frames[-1].nested += _ns() - frame.marks[0]
+        return result
+
+    return wrapper
+
+
+def _install(
+    owner: type,
+    name: str,
+    wrap: t.Callable[[t.Callable[..., t.Any]], t.Callable[..., t.Any]],
+) -> None:
+    original = owner.__dict__[name]
+    _ORIGINALS[owner, name] = original
+    if isinstance(original, (classmethod, staticmethod)):
+        setattr(owner, name, type(original)(wrap(original.__func__)))
+    else:
+        setattr(owner, name, wrap(original))
+
+
+def enable() -> None:
+    """
+    Install instrumented ``Error.__init__`` and ``ReraisingMixin.remap``.
+
+    Phases of construction and remapping are timed and aggregated per class.
+    Nothing is installed (and timed) until enabled.
+
+    Raises:
+        RuntimeError: metrics are enabled (instrumentations can't be combined)
+
+    """
+    if metrics.is_enabled():
+        raise RuntimeError("Profiling can't be combined with metrics")
+    with _LOCK:
+        if _ORIGINALS:
+            return
+        mixin = _reraise.ReraisingMixin
+        _install(
+            root.Error,
+            "__init__",
+            functools.partial(_timed, kind="init", durations=_init_durations),
+        )
+        _install(
+            mixin,
+            "remap",
+            functools.partial(
+                _timed, kind="remap", durations=_remap_durations
+            ),
+        )
+        for owner, steps in ((root.Error, _INIT_STEPS), (mixin, _REMAP_STEPS)):
+            *phases, last = steps
+            for name in phases:
+                _install(owner, name, _marked)
+            _install(owner, last, functools.partial(_marked, start=True))
+
+
+def disable() -> None:
+    """Uninstall instrumentation (collected timings are kept)."""
+    with _LOCK:
+        for (owner, name), original in _ORIGINALS.items():
+            setattr(owner, name, original)
+        _ORIGINALS.clear()
+
+
+def is_enabled() -> bool:
+    """Return ``True`` if instrumentation is installed."""
+    return bool(_ORIGINALS)
+
+
+def reset() -> None:
+    """Drop collected timings."""
+    with _LOCK:
+        _STATS.clear()
+
+
+def report(limit: t.Optional[int] = None) -> t.List[ProfileDumpDict]:
+    """
+    Return timings per class (and kind) sorted by total time (slowest first).
+
+    Args:
+        limit: max number of returned rows
+
+    Returns:
+        rows of timings
+
+    """
+    with _LOCK:
+        rows: t.List[ProfileDumpDict] = []
+        for (kind, kls), stats in _STATS.items():
+            total = sum(stats.phases.values())
+            rows.append(
+                dict(
+                    kind=kind,
+                    type=f"{kls.__module__}.{kls.__qualname__}",
+                    count=stats.count,
+                    total_ns=total,
+                    mean_ns=total / stats.count,
+                    phases=stats.phases.copy(),
+                ),
+            )
+    rows.sort(key=operator.itemgetter("total_ns"), reverse=True)
+    return rows[:limit]
+
+
+def render_report(limit: t.Optional[int] = 10) -> str:
+    """Return report as text table with the slowest phase of each row."""
+    lines = []
+    for row in report(limit):
+        phase, ns = max(row["phases"].items(), key=operator.itemgetter(1))
+        share = ns / row["total_ns"] if row["total_ns"] else 0.0
+        lines.append(
+            f"{row['kind']:<6}{row['type']:<50}"
+            f"{row['count']:>10,}{row['mean_ns']:>14,.1f} ns"
+            f"  slowest: {phase} ({share:.0%})",
+        )
+    return "\n".join(lines)
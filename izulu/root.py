@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
 import enum
 import functools
 import logging
+import reprlib
+import sys
 import types
 import typing as t
+import weakref
 
 from izulu import _utils
 from izulu import tools
 
+if t.TYPE_CHECKING:
+    import contextvars
+
 _IMPORT_ERROR_TEXTS = (
     "",
     "You have early version of Python.",
@@ -32,6 +39,20 @@ else:
 
 FactoryReturnType = t.TypeVar("FactoryReturnType")
 
+# attributes of frozen errors still managed by Python and izulu machinery
+_UNFROZEN_ATTRS = frozenset(
+    (
+        "__cause__",
+        "__context__",
+        "__suppress_context__",
+        "__traceback__",
+        "__notes__",
+        tools._SNAPSHOT_ATTR,  # noqa: SLF001
+        tools._DETAILS_ATTR,  # noqa: SLF001
+        tools._CONTEXT_ATTR,  # noqa: SLF001
+    )
+)
+
 
 @t.overload
 def factory(
@@ -66,7 +87,123 @@ def factory(
 
     """
     target = default_factory if self else (lambda _: default_factory())
-    return functools.cached_property(target)
+    return _utils.Factory(target)
+
+
+class Summary(str):  # noqa: FURB189
+    """Stored summary of field value (see ``summary`` and ``weak``)."""
+
+    __slots__ = ()
+
+
+DEAD_REFERENCE = Summary("<dead reference>")
+
+
+class _WeakRef(_utils.FieldRef):
+    __slots__ = ("_fallback",)
+
+    def __init__(self, fallback: t.Optional[t.Callable[[t.Any], str]]) -> None:
+        self._fallback = fallback
+
+    def pack(self, value: t.Any) -> t.Any:  # noqa: ANN401
+        if isinstance(value, Summary):
+            return value
+        try:
+            return weakref.ref(value)
+        except TypeError:
+            if self._fallback is None:
+                return value
+            return Summary(self._fallback(value))
+
+    def unpack(self, value: t.Any) -> t.Any:  # noqa: ANN401, PLR6301
+        if isinstance(value, weakref.ref):
+            obj = value()
+            return DEAD_REFERENCE if obj is None else obj
+        return value
+
+
+class _Summarized(_utils.FieldRef):
+    __slots__ = ("_func",)
+
+    def __init__(self, func: t.Callable[[t.Any], str]) -> None:
+        self._func = func
+
+    def pack(self, value: t.Any) -> Summary:  # noqa: ANN401
+        if isinstance(value, Summary):
+            return value
+        return Summary(self._func(value))
+
+
+def weak(
+    *,
+    fallback: t.Optional[t.Callable[[t.Any], str]] = None,
+) -> t.Any:  # noqa: ANN401
+    """
+    Declare field storing weak reference to the provided value.
+
+    Error doesn't keep the value alive. After the value is garbage collected
+    field (and ``as_dict()``, ``repr()``, ``tools.dump()``) returns
+    ``DEAD_REFERENCE`` placeholder.
+
+    Args:
+        fallback: callable producing string summary for values not supporting
+            weak references (e.g. ``reprlib.repr``); by default such values
+            are stored as is
+
+    """
+    return _WeakRef(fallback)
+
+
+def summary(func: t.Callable[[t.Any], str] = reprlib.repr) -> t.Any:  # noqa: ANN401
+    """
+    Declare field storing eagerly computed summary instead of the value.
+
+    The summary (``Summary`` string) is computed on error initialization
+    and the value itself is not retained.
+
+    Args:
+        func: callable producing bounded string summary of the value
+
+    """
+    return _Summarized(func)
+
+
+@dataclasses.dataclass(frozen=True)
+class Limits:
+    """
+    Size limits for rendering error message and ``repr``.
+
+    Containers are truncated ``reprlib``-style, so huge values are never
+    rendered completely.
+
+    Args:
+        field: max number of characters per field value
+        message: max length of error message
+        items: max number of rendered container items
+        level: max rendered depth of nested containers
+
+    """
+
+    field: t.Optional[int] = None
+    message: t.Optional[int] = None
+    items: int = 6
+    level: int = 6
+
+    repr_: reprlib.Repr = dataclasses.field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        repr_ = reprlib.Repr()
+        repr_.maxlevel = self.level
+        repr_.maxdict = self.items
+        repr_.maxlist = repr_.maxtuple = repr_.maxarray = self.items
+        repr_.maxset = repr_.maxfrozenset = repr_.maxdeque = self.items
+        size = sys.maxsize if self.field is None else self.field
+        repr_.maxstring = repr_.maxlong = repr_.maxother = size
+        object.__setattr__(self, "repr_", repr_)
 
 
 class Toggles(enum.Flag):
@@ -91,7 +228,7 @@ class Toggles(enum.Flag):
     order_default=False,
     kw_only_default=True,
     frozen_default=False,
-    field_specifiers=(factory,),
+    field_specifiers=(factory, weak, summary),
 )
 class Error(Exception):
     """
@@ -128,10 +265,19 @@ class Error(Exception):
     * Out-of-box validation for provided ``kwargs``
       (individually enable/disable checks with ``__toggles__`` attribute)
 
+    Set ``__frozen__ = True`` to make instances immutable after
+    initialization: such errors can be shared across consumers and threads
+    without copying and used as dict keys.
+
     """
 
     __template__: t.ClassVar[str] = "Unspecified error"
     __toggles__: t.ClassVar[Toggles] = Toggles.DEFAULT
+    __limits__: t.ClassVar[t.Optional[Limits]] = None
+    __contextvars__: t.ClassVar[
+        t.Optional[t.Tuple[contextvars.ContextVar[t.Any], ...]]
+    ] = None
+    __frozen__: t.ClassVar[bool] = False
 
     __cls_store: t.ClassVar[_utils.Store] = _utils.Store(
         fields=frozenset(),
@@ -147,39 +293,121 @@ class Error(Exception):
         const_hints, inst_hints = _utils.split_cls_hints(cls)
         consts = _utils.get_cls_defaults(cls, const_hints)
         defaults = _utils.get_cls_defaults(cls, inst_hints)
+        refs = _utils.get_cls_refs(cls, inst_hints)
         cls.__cls_store = _utils.Store(
             fields=fields,
             const_hints=types.MappingProxyType(const_hints),
             inst_hints=types.MappingProxyType(inst_hints),
             consts=types.MappingProxyType(consts),
-            defaults=frozenset(defaults),
+            defaults=frozenset(defaults).difference(refs),
+            refs=types.MappingProxyType(refs),
         )
         if Toggles.FORBID_NON_NAMED_FIELDS in cls.__toggles__:
             _utils.check_non_named_fields(cls.__cls_store)
         if Toggles.FORBID_UNANNOTATED_FIELDS in cls.__toggles__:
             _utils.check_unannotated_fields(cls.__cls_store)
+        if cls.__frozen__:
+            cls.__install_frozen()
+
+    @classmethod
+    def __install_frozen(cls) -> None:
+        # installed only on frozen classes,
+        # so regular errors keep builtin attribute access, ``==`` and hash
+        methods = dict(
+            __setattr__=Error.__frozen_setattr,
+            __delattr__=Error.__frozen_delattr,
+            __eq__=Error.__frozen_eq,
+            __hash__=Error.__frozen_hash,
+        )
+        for name, method in methods.items():
+            if name not in cls.__dict__:
+                setattr(cls, name, method)
 
     def __init__(self, **kwargs: t.Any) -> None:  # noqa: ANN401
-        self.__iter = None
-        self.__kwargs = kwargs.copy()
+        # every phase is a separate step (timed by ``izulu.profiling``)
+        self.__process_kwargs(kwargs)
         self.__process_toggles()
         self.__populate_attrs()
-        msg = self.__process_template(self.as_dict())
+        msg = self.__process_template(self.__process_defaults())
         msg = self._override_message(self.__cls_store, kwargs, msg)
-        super().__init__(msg)
+        self.__finalize(msg)
+
+    def __is_sealed(self, name: str) -> bool:
+        return (
+            self.__frozen__
+            and "_Error__sealed" in self.__dict__
+            and name not in _UNFROZEN_ATTRS
+        )
+
+    def __frozen_setattr(self, name: str, value: t.Any) -> None:  # noqa: ANN401
+        if self.__is_sealed(name):
+            msg = f"cannot assign to field {name!r} of frozen error"
+            raise dataclasses.FrozenInstanceError(msg)
+        super().__setattr__(name, value)
+
+    def __frozen_delattr(self, name: str) -> None:
+        if self.__is_sealed(name):
+            msg = f"cannot delete field {name!r} of frozen error"
+            raise dataclasses.FrozenInstanceError(msg)
+        super().__delattr__(name)
+
+    def __fields(self) -> t.Dict[str, t.Any]:
+        """Return stored (packed) values of all fields."""
+        data = self.__kwargs.copy()
+        for field in self.__cls_store.defaults:
+            data.setdefault(field, getattr(self, field))
+        return data
+
+    def __frozen_eq(self, other: object) -> bool:
+        if not self.__frozen__:
+            return super().__eq__(other)
+        if type(other) is not type(self):
+            return NotImplemented  # type: ignore[no-any-return]
+        if self is other:
+            return True
+        hashes = (
+            self.__dict__.get("_Error__hash"),
+            other.__dict__.get("_Error__hash"),
+        )
+        if None not in hashes and hashes[0] != hashes[1]:
+            return False
+        return self.__fields() == other.__fields()  # noqa: SLF001
+
+    def __frozen_hash(self) -> int:
+        if not self.__frozen__:
+            return super().__hash__()
+        cached = self.__dict__.get("_Error__hash")
+        if cached is None:
+            key = (type(self), frozenset(self.__fields().items()))
+            cached = self.__dict__["_Error__hash"] = hash(key)
+        return t.cast("int", cached)
+
+    def __shareable(self) -> bool:
+        """Return whether frozen error may be shared instead of copied."""
+        return self.__frozen__ and all(
+            map(_utils.is_immutable, self.__fields().values()),
+        )
 
     def __iter__(self) -> t.Iterator[BaseException]:
         """Return iterator over the whole exception chain."""
         return tools.error_chain(self)
 
     def __reduce__(self) -> t.Tuple[t.Any, ...]:
-        return functools.partial(self.__class__, **self.as_dict()), tuple()
+        reconstructor = functools.partial(self.__class__, **self.as_dict())
+        snapshot = tools.traceback_snapshot(self)
+        if snapshot:
+            return reconstructor, tuple(), {tools._SNAPSHOT_ATTR: snapshot}  # noqa: SLF001
+        return reconstructor, tuple()
 
     def __copy__(self) -> Error:
+        if self.__shareable():
+            return self
         return type(self)(**self.as_dict())
 
     def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> Error:
         id_ = id(self)
+        if id_ not in memo and self.__shareable():
+            memo[id_] = self
         if id_ not in memo:
             kwargs = {
                 k: copy.deepcopy(v, memo) for k, v in self.as_dict().items()
@@ -190,34 +418,74 @@ class Error(Exception):
         return t.cast("Error", memo[id_])
 
     def __repr__(self) -> str:
-        kwargs = _utils.join_kwargs(**self.as_dict())
+        kwargs = _utils.join_kwargs(self.__limits__, **self.as_dict())
         return f"{self.__module__}.{self.__class__.__qualname__}({kwargs})"
 
-    def __process_toggles(self) -> None:
-        """Trigger toggles."""
-        store = self.__cls_store
-        kws = frozenset(self.__kwargs)
+    @classmethod
+    def defer(cls, **kwargs: t.Any) -> ErrorSpec:  # noqa: ANN401
+        """
+        Return lightweight deferred record of the error.
+
+        Provided ``kwargs`` are validated against class specification
+        (according to ``__toggles__``), but no exception is constructed:
+        no attributes, factories or message formatting are involved until
+        ``.materialize()`` or ``.raise_()`` are called on the record.
+        """
+        cls.__check_kwargs(frozenset(kwargs))
+        return ErrorSpec(cls, kwargs)
 
-        if Toggles.FORBID_MISSING_FIELDS in self.__toggles__:
+    @classmethod
+    def __check_kwargs(cls, kws: t.FrozenSet[str]) -> None:
+        store = cls.__cls_store
+
+        if Toggles.FORBID_MISSING_FIELDS in cls.__toggles__:
             _utils.check_missing_fields(store, kws)
 
-        if Toggles.FORBID_UNDECLARED_FIELDS in self.__toggles__:
+        if Toggles.FORBID_UNDECLARED_FIELDS in cls.__toggles__:
             _utils.check_undeclared_fields(store, kws)
 
-        if Toggles.FORBID_KWARG_CONSTS in self.__toggles__:
+        if Toggles.FORBID_KWARG_CONSTS in cls.__toggles__:
             _utils.check_kwarg_consts(store, kws)
 
+    def __process_kwargs(self, kwargs: t.Dict[str, t.Any]) -> None:
+        """Store provided kwargs (packing referenced fields)."""
+        self.__iter = None
+        self.__kwargs = kwargs.copy()
+        for field, ref in self.__cls_store.refs.items():
+            if field in kwargs:
+                self.__kwargs[field] = ref.pack(kwargs[field])
+
+    def __process_toggles(self) -> None:
+        """Trigger toggles."""
+        self.__check_kwargs(frozenset(self.__kwargs))
+
     def __populate_attrs(self) -> None:
         """Set hinted kwargs as exception attributes."""
         for k, v in self.__kwargs.items():
             if k in self.__cls_store.inst_hints:
                 setattr(self, k, v)
 
+    def __process_defaults(self) -> t.Dict[str, t.Any]:
+        """Return complete data with defaults (evaluating factories)."""
+        return self.as_dict()
+
     def __process_template(self, data: t.Dict[str, t.Any]) -> str:
         """Format the error template from provided data (kwargs & defaults)."""
         kwargs = self.__cls_store.consts.copy()
         kwargs.update(data)
-        return _utils.format_template(self.__template__, kwargs)
+        return _utils.format_template(
+            self.__template__,
+            kwargs,
+            self.__limits__,
+        )
+
+    def __finalize(self, msg: str) -> None:
+        """Initialize exception with the message and capture context."""
+        super().__init__(msg)
+        if self.__contextvars__ is not None:
+            tools.capture_context(self)
+        if self.__frozen__:
+            self.__dict__["_Error__sealed"] = True
 
     def _override_message(  # noqa: PLR6301
         self,
@@ -245,13 +513,50 @@ class Error(Exception):
         """
         return msg
 
+    def detach_traceback(
+        self,
+        *,
+        chain: bool = True,
+    ) -> t.Tuple[tools.FrameSnapshot, ...]:
+        """
+        Replace live traceback with compact immutable snapshot.
+
+        Frames (and their locals) referenced by traceback are released.
+        Snapshot survives pickling and is included into ``tools.dump``.
+
+        Args:
+            chain: also detach tracebacks of the whole exception chain
+
+        Returns:
+            snapshot of error traceback
+
+        """
+        return tools.detach_traceback(self, chain=chain)
+
     def as_str(self) -> str:
         """Represent error as an exception type with message."""
         return f"{self.__class__.__qualname__}: {self}"
 
     def as_kwargs(self) -> t.Dict[str, t.Any]:
         """Return the copy of original kwargs used to initialize the error."""
-        return self.__kwargs.copy()
+        return self.__unpack(self.__kwargs.copy())
+
+    def kwargs_view(self) -> t.Mapping[str, t.Any]:
+        """
+        Return immutable view of original kwargs used to initialize the error.
+
+        Unlike ``as_kwargs()`` kwargs are not copied (unless some fields
+        are stored as references), which suits frozen errors.
+        """
+        if self.__cls_store.refs:
+            return types.MappingProxyType(self.__unpack(self.__kwargs.copy()))
+        return types.MappingProxyType(self.__kwargs)
+
+    def __unpack(self, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        for field, ref in self.__cls_store.refs.items():
+            if field in data:
+                data[field] = ref.unpack(data[field])
+        return data
 
     def as_dict(self, *, wide: bool = False) -> t.Dict[str, t.Any]:
         """
@@ -263,10 +568,30 @@ class Error(Exception):
             wide: if ``True`` *class* defaults will be included in result
 
         """
-        d = self.__kwargs.copy()
+        d = self.__unpack(self.__kwargs.copy())
         for field in self.__cls_store.defaults:
             d.setdefault(field, getattr(self, field))
         if wide:
             for field, const in self.__cls_store.consts.items():
                 d.setdefault(field, const)
         return d
+
+
+class ErrorSpec(t.NamedTuple):
+    """
+    Deferred error record (see ``Error.defer()``).
+
+    Holds only error class and raw ``kwargs``, so it's cheap to create,
+    collect and drop. The real exception is built on demand.
+    """
+
+    kls: t.Type[Error]
+    kwargs: t.Dict[str, t.Any]
+
+    def materialize(self) -> Error:
+        """Construct the exception instance from the record."""
+        return self.kls(**self.kwargs)
+
+    def raise_(self) -> t.NoReturn:
+        """Construct and raise the exception."""
+        raise self.materialize()
@@ -1,11 +1,66 @@
 from __future__ import annotations
 
+import collections
 import contextlib
+import contextvars
+import dataclasses
+import functools
+import inspect
+import itertools
+import json
 import logging
+import math
+import operator
+import random
+import sys
+import threading
+import time
+import types
 import typing as t
 
+from izulu import _reraise
+from izulu import _utils
+
+if t.TYPE_CHECKING:
+    import os
+
+    from izulu import root
+
+    _T_GROUP = BaseExceptionGroup[BaseException]  # noqa: F821
+
 _LOG = logging.getLogger(__name__)
 
+_T_RECORD = t.Union[BaseException, "root.ErrorSpec"]
+_T_EXC = t.TypeVar("_T_EXC", bound=BaseException)
+_T_PROVIDER = t.Callable[[BaseException], t.Mapping[str, t.Any]]
+_T_RESULT = t.TypeVar("_T_RESULT")
+_T_EXC_TYPES = t.Union[
+    t.Type[BaseException],
+    t.Tuple[t.Type[BaseException], ...],
+]
+
+_MIN_CHAIN_LENGTH = 3
+# max length of repeated sequence of links collapsed by ``compact_chain``
+_MAX_COLLAPSE_PERIOD = 8
+_SNAPSHOT_ATTR = "__izulu_traceback__"
+_DETAILS_ATTR = "__izulu_details__"
+_CONTEXT_ATTR = "__izulu_context__"
+_SCALARS = (int, float, bool, type(None))
+# shared with the whole program, so never accounted
+_SHARED = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+)
+_KEEP, _REDACT, _BOUND = range(3)
+_DEDUP_KEYS = (None, "type", "fingerprint")
+
+REDACTED = "<redacted>"
+
 
 class ErrorDumpDict(t.TypedDict):
     type: str
@@ -14,30 +69,895 @@ class ErrorDumpDict(t.TypedDict):
     details: t.Dict[t.Any, t.Any]
 
 
-@contextlib.contextmanager
-def suppress(
-    *excs: t.Type[Exception],
-    exclude: t.Optional[t.Type[Exception]] = None,
-) -> t.Generator[None, None, None]:
-    exc_targets = excs or Exception
+class CollectedDumpDict(t.TypedDict):
+    count: int
+    omitted: int
+    errors: t.List[ErrorDumpDict]
+
+
+class AggregatedDumpDict(t.TypedDict):
+    fingerprint: str
+    type: str
+    count: int
+    first_seen: float
+    last_seen: float
+    samples: t.List[ErrorDumpDict]
+
+
+class SizeDumpDict(t.TypedDict):
+    total: int
+    object: int  # exception object and its ``__dict__``
+    kwargs: int
+    attributes: int
+    factories: int  # cached values of ``factory`` defaults
+    extra: int  # other attached data (traceback snapshot, details, etc.)
+    args: int
+    traceback: int  # traceback entries and their frames (without locals)
+    chain: int  # linked causes and contexts
+
+
+class FrameSnapshot(t.NamedTuple):
+    """Immutable summary of single traceback entry."""
+
+    name: str
+    filename: str
+    lineno: int
+
+
+class CompactedLinks(Exception):  # noqa: N818
+    """
+    Placeholder for exception chain links dropped by ``compact_chain``.
+
+    Keeps only counters of dropped exception types (not exceptions).
+    """
+
+    def __init__(self, links: t.Iterable[BaseException]) -> None:
+        self.count = 0
+        self.types: t.Dict[str, int] = {}
+        for link in links:
+            if isinstance(link, CompactedLinks):
+                self.count += link.count
+                for name, count in link.types.items():
+                    self.types[name] = self.types.get(name, 0) + count
+            else:
+                self.count += 1
+                name = link.__class__.__qualname__
+                self.types[name] = self.types.get(name, 0) + 1
+
+        types = ", ".join(f"{k} x{v}" for k, v in self.types.items())
+        super().__init__(f"{self.count} chain link(s) compacted: {types}")
+
+
+class OmittedErrors(Exception):  # noqa: N818
+    """
+    Placeholder for ``Collector`` records dropped due to caps.
+
+    Keeps only error class and counter of dropped records.
+    """
+
+    def __init__(self, kls: type, count: int) -> None:
+        self.kls = kls
+        self.count = count
+        super().__init__(f"{count} {kls.__qualname__} error(s) omitted")
+
+
+class _DumpPlan(t.NamedTuple):
+    # (name, ref, action) for instance fields
+    fields: t.Tuple[t.Tuple[str, t.Optional[_utils.FieldRef], int], ...]
+    # pre-rendered class constants
+    consts: t.Dict[str, t.Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class DumpProfile:
+    """
+    Projection of ``dump`` output: which fields and how they are rendered.
+
+    Profile is compiled against ``Store`` once per error class, so applying
+    it requires no per-error key filtering. Constants are pre-rendered.
+
+    Args:
+        name: profile name (see ``register_profile``)
+        include: dump only these fields (all fields by default)
+        exclude: never dump these fields
+        redact: replace values of these fields (and details keys)
+            with ``REDACTED``
+        limits: bound rendered field values (``field``) and reason
+            (``message``); strings and non-scalar values are rendered
+            to bounded strings, numbers, booleans and ``None`` are kept
+        details: callable providing extra ``details`` for exception
+
+    """
+
+    name: str
+    include: t.Optional[t.FrozenSet[str]] = None
+    exclude: t.FrozenSet[str] = frozenset()
+    redact: t.FrozenSet[str] = frozenset()
+    limits: t.Optional[root.Limits] = None
+    details: t.Optional[t.Callable[[BaseException], t.Mapping[str, t.Any]]] = (
+        None
+    )
+
+    _plans: t.Dict[type, _DumpPlan] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.include is not None:
+            object.__setattr__(self, "include", frozenset(self.include))
+        object.__setattr__(self, "exclude", frozenset(self.exclude))
+        object.__setattr__(self, "redact", frozenset(self.redact))
+
+    def compile(self, kls: t.Type[root.Error]) -> _DumpPlan:
+        """Return dump plan of the error class (compiled once per class)."""
+        plan = self._plans.get(kls)
+        if plan is None:
+            plan = self._plans[kls] = self.__compile(kls)
+        return plan
+
+    def __compile(self, kls: t.Type[root.Error]) -> _DumpPlan:
+        store: _utils.Store = kls._Error__cls_store  # type: ignore[attr-defined]  # noqa: SLF001
+        names = dict.fromkeys([*store.inst_hints, *sorted(store.fields)])
+        fields = tuple(
+            (name, store.refs.get(name), self.__action(name))
+            for name in names
+            if self.__selected(name) and name not in store.consts
+        )
+        consts = {
+            name: self.render(value, self.__action(name))
+            for name, value in store.consts.items()
+            if self.__selected(name)
+        }
+        return _DumpPlan(fields=fields, consts=consts)
+
+    def __selected(self, name: str) -> bool:
+        if name in self.exclude:
+            return False
+        return self.include is None or name in self.include
+
+    def __action(self, name: str) -> int:
+        if name in self.redact:
+            return _REDACT
+        if self.limits is not None:
+            return _BOUND
+        return _KEEP
+
+    def render(self, value: t.Any, action: int) -> t.Any:  # noqa: ANN401
+        """Render field value according to action of compiled plan."""
+        if action == _REDACT:
+            return REDACTED
+        if action == _KEEP or isinstance(value, _SCALARS):
+            return value
+        limits = t.cast("root.Limits", self.limits)
+        if isinstance(value, str):
+            return _utils.truncate(value, limits.field)
+        return _utils.bounded_repr(value, limits)
+
+    def fields(self, exc: root.Error) -> t.Dict[str, t.Any]:
+        """Return projected fields of the error."""
+        plan = self.compile(type(exc))
+        kwargs = exc._Error__kwargs  # type: ignore[attr-defined]  # noqa: SLF001
+        defaults = exc._Error__cls_store.defaults  # type: ignore[attr-defined]  # noqa: SLF001
+        fields = {}
+        for name, ref, action in plan.fields:
+            if name in kwargs:
+                value = kwargs[name]
+                if ref is not None:
+                    value = ref.unpack(value)
+            elif name in defaults:
+                value = getattr(exc, name)
+            else:
+                continue
+            fields[name] = self.render(value, action)
+        fields.update(plan.consts)
+        return fields
+
+    def reason(self, exc: BaseException) -> str:
+        """Return bounded string representation of exception."""
+        reason = str(exc)
+        if self.limits is None:
+            return reason
+        return _utils.truncate(reason, self.limits.message)
+
+    def provide_details(self, exc: BaseException) -> t.Dict[str, t.Any]:
+        """Return registered and profile details (redacted)."""
+        details = collect_details(exc)
+        if self.details is not None:
+            details.update(self.details(exc))
+        for key in self.redact.intersection(details):
+            details[key] = REDACTED
+        return details
+
+
+_PROFILES: t.Dict[str, DumpProfile] = {}
+# registry is copy-on-write: readers never lock, writers hold the lock
+_PROVIDERS: t.Dict[type, t.Tuple[_T_PROVIDER, ...]] = {}
+_RESOLVED_PROVIDERS: t.Dict[type, t.Tuple[_T_PROVIDER, ...]] = {}
+_PROVIDERS_LOCK = threading.Lock()
+
+
+def register_profile(profile: DumpProfile) -> DumpProfile:
+    """Register profile to be used by name with ``dump``."""
+    _PROFILES[profile.name] = profile
+    return profile
+
+
+def get_profile(name: str) -> DumpProfile:
+    """
+    Return registered dump profile.
+
+    Raises:
+        ValueError: profile is not registered
+
+    """
     try:
-        yield
-    except exc_targets as e:
-        if exclude and isinstance(e, exclude):
-            raise
-        _LOG.error("Error suppressed: %s", e)
-
-
-def error_chain(exc: BaseException) -> t.Generator[BaseException, None, None]:
-    """Return generator over the whole exception chain."""
-    yield exc
-    while exc.__cause__ is not None:
-        exc = exc.__cause__
+        return _PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown dump profile: {name!r}") from None
+
+
+def register_details(kls: type, provider: _T_PROVIDER) -> _T_PROVIDER:
+    """
+    Register lazy ``details`` provider for exception class and subclasses.
+
+    Providers are called only on ``dump`` (once per exception instance,
+    results are cached on the instance). Providers of base classes run
+    first, so subclass providers override their keys.
+
+    Args:
+        kls: exception class
+        provider: callable returning mapping of details for exception
+
+    Returns:
+        the same provider
+
+    """
+    with _PROVIDERS_LOCK:
+        _PROVIDERS[kls] = (*_PROVIDERS.get(kls, ()), provider)
+        _RESOLVED_PROVIDERS.clear()
+    return provider
+
+
+def unregister_details(kls: type, provider: _T_PROVIDER) -> None:
+    """Remove ``details`` provider registered for exception class."""
+    with _PROVIDERS_LOCK:
+        providers = list(_PROVIDERS.get(kls, ()))
+        if provider in providers:
+            providers.remove(provider)
+            _PROVIDERS[kls] = tuple(providers)
+            _RESOLVED_PROVIDERS.clear()
+
+
+def _resolve_providers(kls: type) -> t.Tuple[_T_PROVIDER, ...]:
+    providers = _RESOLVED_PROVIDERS.get(kls)
+    if providers is None:
+        # resolved under the lock, so concurrent (un)registering
+        # never leaves stale entry in the cache
+        with _PROVIDERS_LOCK:
+            providers = tuple(
+                provider
+                for base in reversed(kls.__mro__)
+                for provider in _PROVIDERS.get(base, ())
+            )
+            _RESOLVED_PROVIDERS[kls] = providers
+    return providers
+
+
+def collect_details(exc: BaseException) -> t.Dict[str, t.Any]:
+    """Return (copy of) details of registered providers for exception."""
+    cached = exc.__dict__.get(_DETAILS_ATTR)
+    if cached is None:
+        providers = _resolve_providers(type(exc))
+        if not providers:  # nothing to cache
+            return {}
+        details: t.Dict[str, t.Any] = {}
+        for provider in providers:
+            details.update(provider(exc))
+        # concurrent callers agree on the first stored result
+        cached = exc.__dict__.setdefault(_DETAILS_ATTR, details)
+    return dict(cached)
+
+
+class suppress:  # noqa: N801
+    """
+    Suppress exceptions and log them (with sampling and deduplication).
+
+    Usable as context manager (reusable, e.g. created once outside of loop)
+    and as decorator of functions and coroutine functions (decorated
+    function returns ``None`` on suppression).
+
+    Occurrences are counted per key (see ``dedup``). When sampling skips
+    logging of occurrences, their counters are logged as summary lines
+    not more often than every ``interval`` seconds (and on ``flush()``).
+
+    Args:
+        excs: exception types to be suppressed (``Exception`` by default)
+        exclude: exception types never suppressed
+        first: log only first N occurrences per key (all by default,
+            none if ``every`` is provided)
+        every: after the first N occurrences log only every M-th one
+        dedup: sampling key: ``"type"`` (exception class),
+            ``"fingerprint"`` (class and message) or ``None``
+            (all occurrences share the key)
+        interval: min seconds between summary lines
+        sink: mapping to count occurrences per key instead of logging
+            (e.g. ``collections.Counter``); keys are class names
+            if ``dedup`` is not set
+
+    """
+
+    __slots__ = (
+        "_counts",
+        "_dedup",
+        "_every",
+        "_exclude",
+        "_first",
+        "_interval",
+        "_lock",
+        "_sink",
+        "_skipped",
+        "_summarized_at",
+        "_targets",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *excs: t.Type[Exception],
+        exclude: t.Optional[_T_EXC_TYPES] = None,
+        first: t.Optional[int] = None,
+        every: t.Optional[int] = None,
+        dedup: t.Optional[t.Literal["type", "fingerprint"]] = None,
+        interval: float = 60.0,
+        sink: t.Optional[t.MutableMapping[str, int]] = None,
+    ) -> None:
+        if dedup not in _DEDUP_KEYS:
+            raise ValueError(f"Unsupported dedup: {dedup!r}")
+        self._targets: _T_EXC_TYPES = excs or Exception
+        self._exclude = exclude
+        if first is None and every is not None:
+            first = 0
+        self._first = first
+        self._every = every
+        self._dedup = dedup
+        self._interval = interval
+        self._sink = sink
+        self._counts: t.Dict[str, int] = {}
+        self._skipped: t.Dict[str, int] = {}
+        self._summarized_at = time.monotonic()
+        # counters are shared by threads using the same instance
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: t.Optional[t.Type[BaseException]],
+        exc_value: t.Optional[BaseException],
+        traceback: t.Optional[types.TracebackType],
+    ) -> bool:
+        if exc_value is None or not isinstance(exc_value, self._targets):
+            return False
+        if self._exclude and isinstance(exc_value, self._exclude):
+            return False
+        self._suppressed(exc_value)
+        return True
+
+    def __call__(
+        self,
+        func: t.Callable[..., _T_RESULT],
+    ) -> t.Callable[..., t.Optional[_T_RESULT]]:
+        if inspect.iscoroutinefunction(func):
+            return self.__wrap_coroutine_function(func)
+
+        @functools.wraps(func)
+        def wrapper(
+            *args: t.Any,  # noqa: ANN401
+            **kwargs: t.Any,  # noqa: ANN401
+        ) -> t.Optional[_T_RESULT]:
+            try:
+                return func(*args, **kwargs)
+            except self._targets as e:
+                if self._exclude and isinstance(e, self._exclude):
+                    raise
+                self._suppressed(e)
+                return None
+
+        return wrapper
+
+    def __wrap_coroutine_function(
+        self,
+        func: t.Callable[..., t.Any],
+    ) -> t.Callable[..., t.Any]:
+        # exceptions of coroutine functions are raised on awaiting
+        @functools.wraps(func)
+        async def wrapper(
+            *args: t.Any,  # noqa: ANN401
+            **kwargs: t.Any,  # noqa: ANN401
+        ) -> t.Any:  # noqa: ANN401
+            try:
+                return await func(*args, **kwargs)
+            except self._targets as e:
+                if self._exclude and isinstance(e, self._exclude):
+                    raise
+                self._suppressed(e)
+                return None
+
+        return wrapper
+
+    @property
+    def counts(self) -> t.Dict[str, int]:
+        """Counters of suppressed occurrences per key."""
+        return self._counts.copy()
+
+    def __key(self, exc: BaseException) -> str:
+        if self._dedup is None:
+            return ""
+        if self._dedup == "type":
+            return exc.__class__.__qualname__
+        return f"{exc.__class__.__qualname__}: {exc}"
+
+    def _suppressed(self, exc: BaseException) -> None:
+        key = self.__key(exc)
+        if self._sink is not None:
+            key = key or exc.__class__.__qualname__
+            with self._lock:
+                self._sink[key] = self._sink.get(key, 0) + 1
+            return
+
+        with self._lock:
+            n = self._counts[key] = self._counts.get(key, 0) + 1
+        if self._first is None or n <= self._first:
+            _LOG.error("Error suppressed: %s", exc)
+        elif self._every is not None and (n - self._first) % self._every == 0:
+            _LOG.error("Error suppressed (occurrence #%d): %s", n, exc)
+        else:
+            with self._lock:
+                self._skipped[key] = self._skipped.get(key, 0) + 1
+            now = time.monotonic()
+            if now - self._summarized_at >= self._interval:
+                self.flush()
+
+    def flush(self) -> None:
+        """Log summary lines of occurrences suppressed without logging."""
+        with self._lock:
+            skipped, self._skipped = self._skipped, {}
+            self._summarized_at = time.monotonic()
+        for key, count in skipped.items():
+            _LOG.error(
+                "Errors suppressed without logging: %d (%s)",
+                count,
+                key or "all",
+            )
+
+
+def error_chain(
+    exc: BaseException,
+    *,
+    context: bool = False,
+    groups: bool = False,
+    max_depth: t.Optional[int] = None,
+) -> t.Generator[BaseException, None, None]:
+    """
+    Return generator over the whole exception chain.
+
+    By default only explicit ``__cause__`` links are followed.
+    Every exception is yielded once (cycles are detected by identity).
+
+    Args:
+        exc: exception to start traversal from
+        context: follow implicit ``__context__`` if there is no
+            ``__cause__`` and context is not suppressed
+            (the same way Python prints tracebacks)
+        groups: descend into exception groups members (depth-first)
+        max_depth: stop traversal deeper than provided number of links
+            (``0`` yields only ``exc`` itself)
+
+    """
+    seen: t.Set[int] = set()
+    stack: t.List[t.Tuple[BaseException, int]] = [(exc, 0)]
+    while stack:
+        exc, depth = stack.pop()
+        if id(exc) in seen:
+            continue
+        seen.add(id(exc))
         yield exc
 
+        if max_depth is not None and depth >= max_depth:
+            continue
+        depth += 1
+
+        if (
+            groups
+            and _utils.EXCEPTION_GROUP
+            and isinstance(exc, _utils.EXCEPTION_GROUP)
+        ):
+            group = t.cast("_T_GROUP", exc)
+            stack.extend((e, depth) for e in reversed(group.exceptions))
+
+        nxt = _next_link(exc, context=context)
+        if nxt is not None:
+            stack.append((nxt, depth))
+
+
+def root_cause(
+    exc: BaseException,
+    *,
+    context: bool = False,
+    max_depth: t.Optional[int] = None,
+) -> BaseException:
+    """
+    Return the last exception of the chain (``exc`` itself if no causes).
+
+    Args:
+        exc: exception to start traversal from
+        context: follow implicit ``__context__`` (see ``error_chain``)
+        max_depth: stop traversal deeper than provided number of links
+
+    """
+    last = exc
+    for last in error_chain(exc, context=context, max_depth=max_depth):  # noqa: B007
+        pass
+    return last
+
+
+def find_cause(
+    exc: BaseException,
+    kls: t.Union[t.Type[_T_EXC], t.Tuple[t.Type[_T_EXC], ...]],
+    *,
+    context: bool = False,
+    groups: bool = False,
+    max_depth: t.Optional[int] = None,
+) -> t.Optional[_T_EXC]:
+    """
+    Return the first exception of the chain matching ``kls``.
+
+    Traversal stops on the first match (see ``error_chain`` for options).
+    """
+    chain = error_chain(
+        exc,
+        context=context,
+        groups=groups,
+        max_depth=max_depth,
+    )
+    for e in chain:
+        if isinstance(e, kls):
+            return e
+    return None
+
+
+def _next_link(
+    exc: BaseException,
+    *,
+    context: bool,
+) -> t.Optional[BaseException]:
+    if exc.__cause__ is not None:
+        return exc.__cause__
+    if context and not exc.__suppress_context__:
+        return exc.__context__
+    return None
+
+
+def compact_chain(
+    exc: BaseException,
+    *,
+    max_length: t.Optional[int] = None,
+    collapse: bool = True,
+) -> BaseException:
+    """
+    Compact ``__cause__`` chain of exception in-place to bound memory.
+
+    Dropped links are replaced with ``CompactedLinks`` placeholders,
+    so they (with their tracebacks and frames) can be garbage collected.
+    The exception itself (the most recent link) and the chain root
+    are always kept.
+
+    Args:
+        exc: exception to compact the chain of
+        max_length: max number of chain links (including ``exc`` itself
+            and placeholders); at least 3
+        collapse: collapse repeated sequences of identical links (same
+            type and ``args``), e.g. alternating remapped and original
+            exceptions of retries, into the first sequence followed
+            by placeholder
+
+    Returns:
+        the same exception
+
+    Raises:
+        ValueError: too short ``max_length``
+
+    """
+    if max_length is not None and max_length < _MIN_CHAIN_LENGTH:
+        msg = f"Chain can't be compacted to less than {_MIN_CHAIN_LENGTH}"
+        raise ValueError(msg)
+
+    links = list(error_chain(exc))
+    if collapse:
+        links = _collapse_links(links)
+    if max_length is not None and len(links) > max_length:
+        head, tail = links[: max_length - 2], links[-1]
+        links = [*head, CompactedLinks(links[len(head) : -1]), tail]
+
+    for link, cause in zip(links, links[1:]):
+        if link.__cause__ is cause:
+            continue
+        if link.__context__ is link.__cause__:
+            link.__context__ = cause
+        link.__cause__ = cause
+
+    return exc
+
+
+def _collapse_links(links: t.List[BaseException]) -> t.List[BaseException]:
+    result: t.List[BaseException] = []
+    idx, last = 0, len(links) - 1
+    while idx <= last:
+        # the longest run repeating links sequence of some period
+        # (the chain root is never collapsed)
+        period, repeated = 1, 0
+        for size in range(1, _MAX_COLLAPSE_PERIOD + 1):
+            end = idx + size
+            while end < last and _are_identical(links[end - size], links[end]):
+                end += 1
+            if end - idx - size >= size and end - idx - size > repeated:
+                period, repeated = size, end - idx - size
+        result.extend(links[idx : idx + period])
+        idx += period
+        if repeated:
+            result.append(CompactedLinks(links[idx : idx + repeated]))
+            idx += repeated
+    return result
+
+
+def _are_identical(left: BaseException, right: BaseException) -> bool:
+    return left.__class__ is right.__class__ and left.args == right.args
+
+
+def detach_traceback(
+    exc: BaseException,
+    *,
+    chain: bool = True,
+) -> t.Tuple[FrameSnapshot, ...]:
+    """
+    Replace live traceback of exception with compact immutable snapshot.
+
+    Traceback keeps frames (and all their locals) alive for as long as
+    exception is retained. Snapshot keeps only code names, filenames and
+    line numbers (see ``traceback_snapshot``).
+
+    Args:
+        exc: exception to detach traceback of
+        chain: also detach tracebacks of the whole chain
+            (both ``__cause__`` and ``__context__`` links)
+
+    Returns:
+        snapshot of ``exc`` traceback
+
+    """
+    excs = error_chain(exc, context=True) if chain else (exc,)
+    for e in excs:
+        tb = e.__traceback__
+        if tb is None:
+            continue
+        snapshot = []
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            snapshot.append(
+                FrameSnapshot(code.co_name, code.co_filename, tb.tb_lineno)
+            )
+            tb = tb.tb_next
+        # re-raised exception traceback wraps previously detached frames
+        e.__dict__[_SNAPSHOT_ATTR] = (
+            *snapshot,
+            *e.__dict__.get(_SNAPSHOT_ATTR, ()),
+        )
+        e.__traceback__ = None
+    return traceback_snapshot(exc)
+
+
+def traceback_snapshot(exc: BaseException) -> t.Tuple[FrameSnapshot, ...]:
+    """Return traceback snapshot created by ``detach_traceback``."""
+    return t.cast(
+        "t.Tuple[FrameSnapshot, ...]",
+        exc.__dict__.get(_SNAPSHOT_ATTR, ()),
+    )
+
+
+def strip_frames(
+    exc: BaseException,
+    *,
+    chain: bool = True,
+) -> BaseException:
+    """
+    Drop ``izulu`` frames from traceback of exception in-place.
+
+    Less frames means less memory retained by exception
+    and cheaper traceback formatting.
+
+    Args:
+        exc: exception to strip traceback of
+        chain: also strip tracebacks of the whole chain
+            (both ``__cause__`` and ``__context__`` links)
+
+    Returns:
+        the same exception
+
+    """
+    excs = error_chain(exc, context=True) if chain else (exc,)
+    for e in excs:
+        tb = e.__traceback__
+        kept: t.List[types.TracebackType] = []
+        stripped = False
+        while tb is not None:
+            if _is_internal_frame(tb.tb_frame):
+                stripped = True
+            else:
+                kept.append(tb)
+            tb = tb.tb_next
+        if not stripped:
+            continue
+        for entry, nxt in zip(kept, kept[1:]):
+            entry.tb_next = nxt
+        if kept:
+            kept[-1].tb_next = None
+        e.__traceback__ = kept[0] if kept else None
+    return exc
+
+
+def _is_internal_frame(frame: types.FrameType) -> bool:
+    module: str = frame.f_globals.get("__name__", "")
+    return module == "izulu" or module.startswith("izulu.")
+
+
+def capture_context(exc: _T_EXC) -> _T_EXC:
+    """
+    Attach snapshot of current ``contextvars`` context to exception.
+
+    Capturing is cheap: context is copied without copying variables.
+    Already captured snapshot is kept.
+    Errors with ``__contextvars__`` are captured automatically
+    on initialization and on remapping.
+
+    Args:
+        exc: exception to attach snapshot to
+
+    Returns:
+        the same exception
+
+    """
+    exc.__dict__.setdefault(_CONTEXT_ATTR, contextvars.copy_context())
+    return exc
+
+
+def captured_context(exc: BaseException) -> t.Optional[contextvars.Context]:
+    """Return context snapshot attached to exception (if any)."""
+    return exc.__dict__.get(_CONTEXT_ATTR)
+
+
+def context_value(
+    exc: BaseException,
+    var: contextvars.ContextVar[t.Any],
+    default: t.Any = None,  # noqa: ANN401
+) -> t.Any:  # noqa: ANN401
+    """Return value of variable from context snapshot attached to exception."""
+    context = captured_context(exc)
+    if context is None:
+        return default
+    return context.get(var, default)
+
+
+def _context_details(exc: BaseException) -> t.Optional[t.Dict[str, t.Any]]:
+    variables = getattr(exc, "__contextvars__", None)
+    context = captured_context(exc)
+    if not variables or context is None:
+        return None
+    return {var.name: context[var] for var in variables if var in context}
+
+
+def _referents(obj: object) -> t.Iterable[object]:
+    if isinstance(obj, dict):
+        return itertools.chain.from_iterable(obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+        return obj
+    referents: t.List[object] = []
+    if hasattr(obj, "__dict__"):
+        referents.append(obj.__dict__)
+    for kls in type(obj).__mro__:
+        slots = kls.__dict__.get("__slots__", ())
+        slots = (slots,) if isinstance(slots, str) else slots
+        referents.extend(
+            getattr(obj, slot) for slot in slots if hasattr(obj, slot)
+        )
+    return referents
+
+
+def _deep_size(obj: object, seen: t.Set[int]) -> int:
+    if obj is None or id(obj) in seen or isinstance(obj, _SHARED):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, BaseException)):
+        # linked exceptions are accounted by ``chain``
+        return size
+    if isinstance(obj, types.MappingProxyType):
+        # underlying mapping is unreachable, so its copy is estimated
+        obj = dict(obj)
+        size += sys.getsizeof(obj)
+    return size + sum(_deep_size(item, seen) for item in _referents(obj))
+
+
+def _own_sizeof(exc: BaseException, seen: t.Set[int]) -> SizeDumpDict:
+    seen.add(id(exc))
+    kls = type(exc)
+    store = getattr(kls, "_Error__cls_store", None)
+    hints = store.inst_hints if store is not None else {}
+    data = vars(exc)
+    size: SizeDumpDict = dict(
+        total=0,
+        object=sys.getsizeof(exc) + sys.getsizeof(data),
+        kwargs=_deep_size(data.get("_Error__kwargs"), seen),
+        attributes=0,
+        factories=0,
+        extra=0,
+        args=_deep_size(exc.args, seen),
+        traceback=0,
+        chain=0,
+    )
+    for name, value in data.items():
+        if name == "_Error__kwargs":
+            continue
+        if name not in hints:
+            size["extra"] += _deep_size(value, seen)
+        elif isinstance(getattr(kls, name, None), _utils.Factory):
+            size["factories"] += _deep_size(value, seen)
+        else:
+            size["attributes"] += _deep_size(value, seen)
+    tb = exc.__traceback__
+    while tb is not None:
+        size["traceback"] += sys.getsizeof(tb)
+        if id(tb.tb_frame) not in seen:
+            seen.add(id(tb.tb_frame))
+            size["traceback"] += sys.getsizeof(tb.tb_frame)
+        tb = tb.tb_next
+    size["total"] = sum(size.values())  # type: ignore[arg-type]
+    return size
+
+
+def deep_sizeof(exc: BaseException) -> SizeDumpDict:
+    """
+    Return approximate memory retained by exception in bytes by parts.
+
+    Shared objects are accounted once (``kwargs`` first), objects shared
+    with the whole program (classes, functions, modules, frame locals)
+    are not accounted.  Linked exceptions are accounted in ``chain``
+    (the way Python prints tracebacks: causes or not suppressed contexts).
+
+    Args:
+        exc: exception to measure
+
+    Returns:
+        sizes of exception parts (and their ``total``)
+
+    """
+    seen: t.Set[int] = set()
+    size = _own_sizeof(exc, seen)
+    for linked in itertools.islice(error_chain(exc, context=True), 1, None):
+        size["chain"] += _own_sizeof(linked, seen)["total"]
+    size["total"] += size["chain"]
+    return size
+
 
 @t.overload
-def dump(exc: BaseException, /) -> ErrorDumpDict: ...
+def dump(
+    exc: BaseException,
+    /,
+    *,
+    profile: t.Union[str, DumpProfile, None] = None,
+) -> ErrorDumpDict: ...
 
 
 @t.overload
@@ -45,6 +965,7 @@ def dump(
     exc: BaseException,
     /,
     *excs: BaseException,
+    profile: t.Union[str, DumpProfile, None] = None,
 ) -> t.Tuple[ErrorDumpDict, ...]: ...
 
 
@@ -52,20 +973,479 @@ def dump(
     exc: BaseException,
     /,
     *excs: BaseException,
+    profile: t.Union[str, DumpProfile, None] = None,
 ) -> t.Union[ErrorDumpDict, t.Tuple[ErrorDumpDict, ...]]:
-    """Return single or tuple of dict representations."""
-    fields = None
-    if hasattr(exc, "_Error__cls_store"):
-        fields = exc.as_dict(wide=True)  # type: ignore[attr-defined]
-
-    dumped: ErrorDumpDict = dict(
-        type=exc.__class__.__name__,
-        reason=str(exc),
-        fields=fields,
-        details={},
-    )
+    """
+    Return single or tuple of dict representations.
+
+    Args:
+        exc: exception to dump
+        excs: more exceptions to dump
+        profile: ``DumpProfile`` or name of registered one
+            to project and bound fields with (see ``get_profile``)
+
+    """
+    if isinstance(profile, str):
+        profile = get_profile(profile)
+
+    is_izulu = hasattr(exc, "_Error__cls_store")
+    if profile is None:
+        fields = exc.as_dict(wide=True) if is_izulu else None  # type: ignore[attr-defined]
+        dumped: ErrorDumpDict = dict(
+            type=exc.__class__.__name__,
+            reason=str(exc),
+            fields=fields,
+            details=collect_details(exc),
+        )
+    else:
+        dumped = dict(
+            type=exc.__class__.__name__,
+            reason=profile.reason(exc),
+            fields=profile.fields(exc) if is_izulu else None,  # type: ignore[arg-type]
+            details=profile.provide_details(exc),
+        )
+    context = _context_details(exc)
+    if context is not None:
+        dumped["details"]["context"] = context
+    snapshot = traceback_snapshot(exc)
+    if snapshot:
+        dumped["details"]["traceback"] = [list(frame) for frame in snapshot]
 
     if excs:
-        return dumped, *(dump(e) for e in excs)
+        return dumped, *(dump(e, profile=profile) for e in excs)
 
     return dumped
+
+
+class Collector:
+    """
+    Accumulate failures in compact form and materialize them at once.
+
+    Records are grouped by error class. Deferred records (see
+    ``root.Error.defer()``) are stored as is, exceptions are stored
+    by reference. Records exceeding per-class cap are only counted
+    and represented with ``OmittedErrors`` placeholder on grouping.
+
+    Args:
+        cap: default max number of stored records per error class
+        caps: per-class caps (resolved through MRO, overrides ``cap``)
+
+    """
+
+    def __init__(
+        self,
+        *,
+        cap: t.Optional[int] = None,
+        caps: t.Optional[t.Mapping[type, int]] = None,
+    ) -> None:
+        self._cap = cap
+        self._caps = dict(caps or {})
+        self._limits: t.Dict[type, t.Optional[int]] = {}
+        self._records: t.Dict[type, t.List[_T_RECORD]] = {}
+        self._overflow: t.Dict[type, int] = {}
+
+    def __len__(self) -> int:
+        return sum(map(len, self._records.values()))
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
+
+    @property
+    def overflow(self) -> t.Dict[type, int]:
+        """Counters of records dropped due to caps."""
+        return self._overflow.copy()
+
+    def __get_limit(self, kls: type) -> t.Optional[int]:
+        if kls not in self._limits:
+            limit = self._cap
+            for base in kls.__mro__:
+                if base in self._caps:
+                    limit = self._caps[base]
+                    break
+            self._limits[kls] = limit
+        return self._limits[kls]
+
+    def add(self, record: _T_RECORD) -> None:
+        """Store exception or deferred error record."""
+        kls = type(record) if isinstance(record, BaseException) else record.kls
+        records = self._records.get(kls, ())
+        limit = self.__get_limit(kls)
+        if limit is not None and len(records) >= limit:
+            self._overflow[kls] = self._overflow.get(kls, 0) + 1
+            return
+        self._records.setdefault(kls, []).append(record)
+
+    def defer(
+        self,
+        kls: t.Type[root.Error],
+        **kwargs: t.Any,  # noqa: ANN401
+    ) -> None:
+        """Validate and store deferred record of the error."""
+        self.add(kls.defer(**kwargs))
+
+    @contextlib.contextmanager
+    def catch(
+        self,
+        *excs: t.Type[Exception],
+        remapper: t.Optional[t.Type[_reraise.ReraisingMixin]] = None,
+        remap_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> t.Generator[None, None, None]:
+        """
+        Collect occurred exception instead of raising it.
+
+        Exception is remapped the same way ``ReraisingMixin.reraise`` does
+        (when ``remapper`` is provided) and then stored.
+        Fatal exceptions are never collected.
+
+        Args:
+            excs: exception types to be collected (``Exception`` by default)
+            remapper: ``ReraisingMixin`` class to remap exceptions with
+            remap_kwargs: provide kwargs for remapped exception
+
+        """
+        exc_targets = excs or Exception
+        try:
+            yield
+        except exc_targets as e:
+            if _reraise.FatalMixin in e.__class__.__bases__:
+                raise
+            exc = e
+            if remapper is not None:
+                remapped = remapper.remap(exc=e, remap_kwargs=remap_kwargs)
+                if remapped is not None:
+                    remapped.__cause__ = e
+                    exc = remapped
+            self.add(exc)
+
+    def materialize(self) -> t.Dict[type, t.List[BaseException]]:
+        """Return stored errors grouped by class as exception instances."""
+        return {
+            kls: [_materialize(record) for record in records]
+            for kls, records in self._records.items()
+        }
+
+    def group(
+        self,
+        message: str = "Multiple errors occurred",
+        *,
+        nested: bool = True,
+    ) -> _T_GROUP:
+        """
+        Materialize all stored errors into exception group.
+
+        Args:
+            message: top level group message
+            nested: if ``True`` errors are grouped into subgroups by class
+
+        Raises:
+            RuntimeError: exception groups are not supported by Python
+
+        """
+        if _utils.EXCEPTION_GROUP is None:
+            raise RuntimeError("Exception groups require Python 3.11+")
+
+        groups: t.List[BaseException] = []
+        for kls, errors in self.__materialize_all().items():
+            omitted = self._overflow.get(kls, 0)
+            if omitted:
+                errors.append(OmittedErrors(kls, omitted))
+            if not nested:
+                groups.extend(errors)
+                continue
+            msg = f"{kls.__qualname__}: {len(errors) - bool(omitted)} error(s)"
+            if omitted:
+                msg += f" (+{omitted} omitted)"
+            groups.append(_utils.EXCEPTION_GROUP(msg, errors))
+
+        return t.cast("_T_GROUP", _utils.EXCEPTION_GROUP(message, groups))
+
+    def raise_if_any(self, message: str = "Multiple errors occurred") -> None:
+        """Raise exception group if any error was collected or dropped."""
+        if self._records or self._overflow:
+            raise self.group(message)
+
+    def summary(self) -> t.Dict[str, CollectedDumpDict]:
+        """Return ``dump``-compatible summary grouped by class name."""
+        return {
+            kls.__qualname__: dict(
+                count=len(errors) + self._overflow.get(kls, 0),
+                omitted=self._overflow.get(kls, 0),
+                errors=list(map(dump, errors)),
+            )
+            for kls, errors in self.__materialize_all().items()
+        }
+
+    def __materialize_all(self) -> t.Dict[type, t.List[BaseException]]:
+        materialized = self.materialize()
+        # classes with all records dropped due to caps have no errors
+        for kls in self._overflow:
+            materialized.setdefault(kls, [])
+        return materialized
+
+
+def _materialize(record: _T_RECORD) -> BaseException:
+    if isinstance(record, BaseException):
+        return record
+    return record.materialize()
+
+
+_T_SINK = t.Union[
+    t.Callable[[t.List[AggregatedDumpDict]], None],
+    str,
+    "os.PathLike[str]",
+]
+
+
+class _FingerprintPlan(t.NamedTuple):
+    prefix: str
+    fields: t.Tuple[str, ...]
+    values: t.Callable[[BaseException], t.Tuple[t.Any, ...]]
+
+
+def _no_values(exc: BaseException) -> t.Tuple[t.Any, ...]:  # noqa: ARG001
+    return ()
+
+
+def _field_values(
+    fields: t.Tuple[str, ...],
+    exc: BaseException,
+) -> t.Tuple[t.Any, ...]:
+    # template-only fields are not attributes
+    kwargs = exc._Error__kwargs  # type: ignore[attr-defined]  # noqa: SLF001
+    return tuple(getattr(exc, f, kwargs.get(f)) for f in fields)
+
+
+class _Bucket:
+    __slots__ = (
+        "counter",
+        "fingerprint",
+        "first_seen",
+        "last_seen",
+        "peeks",
+        "pick",
+        "samples",
+        "type",
+        "weight",
+    )
+
+    def __init__(self, fingerprint: str, kls: type, now: float) -> None:
+        self.fingerprint = fingerprint
+        self.type = kls.__name__
+        self.counter = itertools.count()  # ``next()`` is atomic
+        self.peeks = 0
+        self.first_seen = now
+        self.last_seen = now
+        self.samples: t.List[ErrorDumpDict] = []
+        self.pick = 0  # number of the next sampled occurrence
+        self.weight = 1.0  # reservoir sampling state
+
+
+def _random() -> float:
+    """Return uniform random number in the open interval (0, 1)."""
+    return random.random() or sys.float_info.min  # noqa: S311
+
+
+class Aggregator:
+    """
+    Aggregate error occurrences by fingerprint instead of logging each one.
+
+    Fingerprint is built from class qualified name, template and values of
+    selected fields (resolved once per class from its ``Store``).
+    Per fingerprint occurrences are counted, first and last timestamps and
+    a few samples are kept: the first occurrences and then occurrences
+    picked by reservoir sampling (so samples are uniform over all
+    occurrences). Samples are dumped when picked, so aggregator never
+    retains exceptions (with their tracebacks and field values) and
+    in the steady state recording is just counting.
+
+    Recording is lock-free for known fingerprints (the lock is taken only
+    for new fingerprints), so it's safe to record from multiple threads.
+    Occurrences recorded concurrently with ``flush`` may be lost.
+
+    Args:
+        fields: fields used in fingerprints (when declared by error class)
+        samples: max number of samples kept per fingerprint
+        sink: callable receiving flushed summaries or path of file
+            to append summaries to (as JSON lines)
+        interval: seconds between periodic flushes (see ``start``)
+        profile: ``DumpProfile`` (or its name) to dump samples with
+
+    """
+
+    def __init__(
+        self,
+        *,
+        fields: t.Iterable[str] = (),
+        samples: int = 5,
+        sink: t.Optional[_T_SINK] = None,
+        interval: float = 60.0,
+        profile: t.Union[str, DumpProfile, None] = None,
+    ) -> None:
+        self._fields = tuple(fields)
+        self._samples = samples
+        self._sink = sink
+        self._interval = interval
+        self._profile = profile
+        self._plans: t.Dict[type, _FingerprintPlan] = {}
+        self._buckets: t.Dict[t.Any, _Bucket] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __compile(self, kls: type) -> _FingerprintPlan:
+        name = f"{kls.__module__}.{kls.__qualname__}"
+        store = getattr(kls, "_Error__cls_store", None)
+        if store is None:
+            return _FingerprintPlan(name, (), _no_values)
+
+        template = kls.__template__  # type: ignore[attr-defined]
+        registered = store.registered.union(store.consts)
+        fields = tuple(f for f in self._fields if f in registered)
+        values: t.Callable[[BaseException], t.Tuple[t.Any, ...]]
+        if not fields:
+            values = _no_values
+        elif {*store.const_hints, *store.inst_hints}.issuperset(fields):
+            # all fields are attributes
+            getter = operator.attrgetter(*fields)
+            values = getter if len(fields) > 1 else lambda e: (getter(e),)
+        else:
+            values = functools.partial(_field_values, fields)
+        return _FingerprintPlan(f"{name}:{template}", fields, values)
+
+    def record(self, exc: BaseException) -> None:
+        """Record occurrence of exception."""
+        kls = type(exc)
+        plan = self._plans.get(kls)
+        if plan is None:
+            plan = self._plans[kls] = self.__compile(kls)
+        try:
+            values = plan.values(exc)
+        except AttributeError:  # missing fields
+            values = _field_values(plan.fields, exc)
+        try:
+            key = (kls, values)
+            bucket = self._buckets.get(key)
+        except TypeError:  # unhashable values
+            key = (kls, tuple(map(repr, values)))
+            bucket = self._buckets.get(key)
+        now = time.time()
+        if bucket is None:
+            bucket = self.__add_bucket(key, plan, values, now)
+        n = next(bucket.counter)
+        bucket.last_seen = now
+        if n >= bucket.pick and self._samples:
+            self.__sample(bucket, exc, n)
+
+    def __sample(self, bucket: _Bucket, exc: BaseException, n: int) -> None:
+        sample = dump(exc, profile=self._profile)
+        size = self._samples
+        if n < size:
+            bucket.samples.append(sample)
+            if n + 1 < size:
+                bucket.pick = n + 1
+                return
+        else:
+            slot = int(random.random() * size)  # noqa: S311
+            if slot < len(bucket.samples):
+                bucket.samples[slot] = sample
+        # reservoir sampling (Algorithm L) skipping to the next picked one
+        bucket.weight *= math.exp(math.log(_random()) / size)
+        skip = math.log(_random()) / math.log(1 - bucket.weight)
+        bucket.pick = n + 1 + int(skip)
+
+    def __add_bucket(
+        self,
+        key: t.Tuple[type, t.Tuple[t.Any, ...]],
+        plan: _FingerprintPlan,
+        values: t.Tuple[t.Any, ...],
+        now: float,
+    ) -> _Bucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                fingerprint = plan.prefix
+                if plan.fields:
+                    rendered = (
+                        f"{f}={v!r}" for f, v in zip(plan.fields, values)
+                    )
+                    fingerprint += ":" + ",".join(rendered)
+                bucket = _Bucket(fingerprint, key[0], now)
+                self._buckets[key] = bucket
+            return bucket
+
+    def summary(self) -> t.List[AggregatedDumpDict]:
+        """Return summaries of recorded occurrences (without resetting)."""
+        return [
+            self.__summarize(bucket) for bucket in list(self._buckets.values())
+        ]
+
+    def __summarize(self, bucket: _Bucket) -> AggregatedDumpDict:
+        samples = list(bucket.samples)
+        with self._lock:
+            # reading the counter consumes value, so reads are accounted
+            count = next(bucket.counter) - bucket.peeks
+            bucket.peeks += 1
+        return dict(
+            fingerprint=bucket.fingerprint,
+            type=bucket.type,
+            count=count,
+            first_seen=bucket.first_seen,
+            last_seen=bucket.last_seen,
+            samples=samples,
+        )
+
+    def flush(self) -> t.List[AggregatedDumpDict]:
+        """Reset aggregator and pass summaries to sink (if any)."""
+        with self._lock:
+            buckets, self._buckets = self._buckets, {}
+        summaries = [self.__summarize(bucket) for bucket in buckets.values()]
+        if summaries and self._sink is not None:
+            self.__write(summaries)
+        return summaries
+
+    def __write(self, summaries: t.List[AggregatedDumpDict]) -> None:
+        if callable(self._sink):
+            self._sink(summaries)
+            return
+        with open(self._sink, "a", encoding="utf-8") as f:  # type: ignore[arg-type]  # noqa: PTH123
+            f.writelines(json.dumps(x, default=str) + "\n" for x in summaries)
+
+    def start(self) -> None:
+        """Start background thread flushing every ``interval`` seconds."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self.__run,
+            name="izulu-aggregator",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background thread and flush the rest."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.__flush_safely()
+
+    def __flush_safely(self) -> None:
+        try:
+            self.flush()
+        except Exception:  # noqa: BLE001
+            _LOG.exception("Failed to flush aggregated errors")
+
+    def __enter__(self) -> Aggregator:  # noqa: PYI034
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+
+from izulu import root
+from tests import errors
+
+
+@pytest.mark.parametrize(
+    ("kls", "kwargs"),
+    [
+        (errors.RootError, dict()),
+        (errors.TemplateOnlyError, dict(name="John", age=42)),
+        (errors.MixedError, dict(name="John", note="...")),
+    ],
+)
+def test_defer(kls, kwargs):
+    spec = kls.defer(**kwargs)
+
+    assert isinstance(spec, root.ErrorSpec)
+    assert isinstance(spec, tuple)
+    assert spec == (kls, kwargs)
+    assert spec.kls is kls
+    assert spec.kwargs == kwargs
+
+
+@pytest.mark.parametrize(
+    ("kls", "kwargs"),
+    [
+        (errors.TemplateOnlyError, dict(name="John")),
+        (errors.RootError, dict(field="value")),
+        (errors.ClassVarsError, dict(age=0)),
+    ],
+)
+def test_defer_validation(kls, kwargs):
+    with pytest.raises(TypeError):
+        kls.defer(**kwargs)
+
+
+def test_defer_is_lazy():
+    m = mock.Mock(return_value=42)
+
+    class Err(errors.RootError):
+        __template__ = "{value}"
+
+        value: int = root.factory(default_factory=m)
+
+    spec = Err.defer()
+
+    m.assert_not_called()
+
+    err = spec.materialize()
+
+    m.assert_called_once_with()
+    assert str(err) == "42"
+
+
+def test_materialize():
+    spec = errors.MixedError.defer(name="John", note="...")
+
+    err = spec.materialize()
+
+    assert isinstance(err, errors.MixedError)
+    assert err.as_kwargs() == dict(name="John", note="...")
+    assert str(err) == "The John is 0 years old with ..."
+    assert spec.materialize() is not err
+
+
+def test_raise():
+    spec = errors.TemplateOnlyError.defer(name="John", age=42)
+
+    with pytest.raises(errors.TemplateOnlyError, match="The John is 42"):
+        spec.raise_()
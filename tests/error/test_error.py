@@ -218,7 +218,11 @@ def test_process_template(mock_format, kls, kwargs, expected_kwargs):
         mocked.return_value = root.Toggles.NONE
         kls(**kwargs)
 
-    mock_format.assert_called_once_with(kls.__template__, expected_kwargs)
+    mock_format.assert_called_once_with(
+        kls.__template__,
+        expected_kwargs,
+        None,
+    )
 
 
 def test_override_message():
@@ -1,8 +1,12 @@
+import pickle  # noqa: S403
+import threading
+import time
 import uuid
 from unittest import mock  # noqa: RUF100
 
 import pytest
 
+from izulu import _utils
 from izulu import root
 
 
@@ -18,3 +22,123 @@ def test_factory(flag):
 
     assert result is expected
     m.assert_called_once_with(*call_args[:flag])
+
+
+def test_factory_descriptor():
+    attr = root.factory(default_factory=int)
+    kls = type("Klass", tuple(), {"attr": attr})
+
+    assert kls.attr is attr
+    assert attr.attrname == "attr"
+
+
+def test_factory_without_name():
+    k = type("Klass", tuple(), {})()
+
+    with pytest.raises(TypeError, match="__set_name__"):
+        root.factory(default_factory=int).__get__(k)
+
+
+def test_factory_once_in_threads():
+    barrier = threading.Barrier(8)
+
+    def slow():
+        time.sleep(0.01)
+        return uuid.uuid4()
+
+    m = mock.Mock(side_effect=slow)
+    attr = root.factory(default_factory=m)
+    k = type("Klass", tuple(), {"attr": attr})()
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(k.attr)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    m.assert_called_once_with()
+    assert len(set(results)) == 1
+    assert vars(k) == dict(attr=results[0])
+    assert not _utils._FACTORY_LOCKS
+
+
+def test_factory_instances_not_blocked():
+    started = threading.Event()
+    release = threading.Event()
+
+    def factory(self):
+        if self.slow:
+            started.set()
+            release.wait(5)
+        return uuid.uuid4()
+
+    kls = type(
+        "Klass",
+        tuple(),
+        {"attr": root.factory(default_factory=factory, self=True)},
+    )
+    slow, fast = kls(), kls()
+    slow.slow, fast.slow = True, False
+    slow_reader = threading.Thread(target=lambda: slow.attr)
+    slow_reader.start()
+    started.wait(5)
+
+    fast_reader = threading.Thread(target=lambda: fast.attr)
+    fast_reader.start()
+    fast_reader.join(timeout=1)
+
+    assert not fast_reader.is_alive()
+    release.set()
+    slow_reader.join()
+    assert slow.attr != fast.attr
+
+
+def test_factory_reads_other_factory():
+    kls = type(
+        "Klass",
+        tuple(),
+        {
+            "first": root.factory(default_factory=lambda: 1),
+            "second": root.factory(
+                default_factory=lambda self: self.first + 1,
+                self=True,
+            ),
+        },
+    )
+
+    assert kls().second == 2  # noqa: PLR2004
+    assert not _utils._FACTORY_LOCKS
+
+
+def test_factory_failure_releases_lock():
+    kls = type(
+        "Klass", tuple(), {"attr": root.factory(default_factory=dict.pop)}
+    )
+    k = kls()
+
+    with pytest.raises(TypeError):
+        _ = k.attr
+
+    assert not vars(k)
+    assert not _utils._FACTORY_LOCKS
+
+
+class IdentifiedError(root.Error):
+    __template__ = "Error {id}"
+
+    id: uuid.UUID = root.factory(default_factory=uuid.uuid4)
+
+
+def test_factory_error_pickling():
+    err = IdentifiedError()
+
+    restored = pickle.loads(pickle.dumps(err))  # noqa: S301
+
+    assert restored.id == err.id
+    assert restored.as_dict() == err.as_dict() == dict(id=err.id)
+    assert str(restored) == str(err)
@@ -0,0 +1,184 @@
+import copy
+import dataclasses
+import pickle  # noqa: S403
+import sys
+import types
+import uuid
+
+import pytest
+
+from izulu import root
+
+
+class FrozenError(root.Error):
+    __template__ = "Failed {name} with {code}"
+    __frozen__ = True
+
+    name: str
+    code: int = 0
+    id: uuid.UUID = root.factory(default_factory=uuid.uuid4)
+
+
+class ItemsError(root.Error):
+    __template__ = "Failed items {items}"
+    __frozen__ = True
+
+    items: list
+
+
+class UnfrozenError(FrozenError):
+    __frozen__ = False
+
+
+class PlainError(root.Error):
+    __template__ = "Failed {name}"
+
+    name: str
+
+
+def raise_from(exc, cause):
+    raise exc from cause
+
+
+def test_setattr():
+    err = FrozenError(name="John")
+
+    with pytest.raises(dataclasses.FrozenInstanceError, match="'name'"):
+        err.name = "Jane"
+    with pytest.raises(dataclasses.FrozenInstanceError, match="'other'"):
+        err.other = 42
+    with pytest.raises(dataclasses.FrozenInstanceError, match="'args'"):
+        err.args = ("other",)
+
+    assert err.name == "John"
+
+
+def test_delattr():
+    err = FrozenError(name="John")
+
+    with pytest.raises(dataclasses.FrozenInstanceError, match="'name'"):
+        del err.name
+
+
+def test_exception_machinery():
+    err = FrozenError(name="John")
+    cause = ValueError("boom")
+
+    with pytest.raises(FrozenError) as exc_info:
+        raise_from(err, cause)
+    err.__suppress_context__ = False
+    err.detach_traceback()
+
+    assert exc_info.value.__cause__ is cause
+    assert err.__traceback__ is None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="no add_note()")
+def test_add_note():
+    err = FrozenError(name="John")
+
+    err.add_note("note")
+
+    assert err.__notes__ == ["note"]
+
+
+def test_as_kwargs():
+    err = FrozenError(name="John")
+
+    kwargs = err.as_kwargs()
+    kwargs["name"] = "Jane"
+
+    assert isinstance(kwargs, dict)
+    assert err.as_kwargs() == dict(name="John")
+
+
+def test_kwargs_view():
+    err = FrozenError(name="John")
+
+    kwargs = err.kwargs_view()
+
+    assert isinstance(kwargs, types.MappingProxyType)
+    assert kwargs == dict(name="John")
+    assert err.kwargs_view() == kwargs
+    with pytest.raises(TypeError):
+        kwargs["name"] = "Jane"  # type: ignore[index]
+
+
+@pytest.mark.parametrize("func", [copy.copy, copy.deepcopy])
+def test_copy_shared(func):
+    err = FrozenError(name="John", code=42)
+
+    assert func(err) is err
+
+
+@pytest.mark.parametrize("func", [copy.copy, copy.deepcopy])
+def test_copy_mutable_values(func):
+    err = ItemsError(items=[1, 2])
+
+    copied = func(err)
+
+    assert copied is not err
+    assert copied.items == err.items
+
+
+def test_eq_and_hash():
+    id_ = uuid.uuid4()
+    err = FrozenError(name="John", id=id_)
+    same = FrozenError(name="John", id=id_)
+
+    assert err == same
+    assert hash(err) == hash(same)
+    assert {err: 1}[same] == 1
+    assert err != FrozenError(name="John", code=1, id=id_)
+    assert err != FrozenError(name="John")
+    assert err != UnfrozenError(name="John", id=id_)
+
+
+def test_hash_cached():
+    err = FrozenError(name="John")
+
+    assert hash(err) == hash(err)
+    assert err.__dict__["_Error__hash"] == hash(err)
+
+
+def test_unhashable_values():
+    err = ItemsError(items=[1])
+
+    assert err == ItemsError(items=[1])
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(err)
+
+
+def test_unfrozen_subclass():
+    err = UnfrozenError(name="John")
+
+    err.name = "Jane"
+
+    assert err.name == "Jane"
+    assert err != UnfrozenError(name="Jane", id=err.id)
+    assert isinstance(err.as_kwargs(), dict)
+    assert copy.copy(err) is not err
+
+
+def test_plain_error():
+    err = PlainError(name="John")
+
+    err.name = "Jane"
+
+    assert err != PlainError(name="Jane")
+    assert isinstance(err.as_kwargs(), dict)
+    assert "__setattr__" not in PlainError.__dict__
+
+
+def test_pickle():
+    err = FrozenError(name="John")
+    with pytest.raises(FrozenError) as exc_info:
+        raise_from(err, None)
+    exc_info.value.detach_traceback()
+
+    restored = pickle.loads(pickle.dumps(err))  # noqa: S301
+
+    assert restored == err
+    assert restored.__izulu_traceback__ == err.__izulu_traceback__
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        restored.name = "Jane"
@@ -0,0 +1,68 @@
+import typing as t
+
+import pytest
+
+from izulu import root
+from tests import errors
+
+
+class BoundedError(errors.RootError):
+    __template__ = "Got {data} for {name}"
+    __limits__ = root.Limits(field=16, message=40, items=3)
+
+    data: t.Any
+    name: str
+
+
+def test_default_limits():
+    assert root.Error.__limits__ is None
+
+
+def test_limits_message():
+    err = BoundedError(data=list(range(10**6)), name="John")
+
+    assert str(err) == "Got [0, 1, 2, ...] for John"
+
+
+def test_limits_message_total():
+    err = BoundedError(data="a" * 100, name="b" * 100)
+
+    assert str(err) == "Got aaaaaaaaaaaaa... for bbbbbbbbbbbb..."
+
+
+def test_limits_repr():
+    err = BoundedError(data=list(range(10**6)), name="John" * 10)
+
+    assert repr(err) == (
+        f"{__name__}.BoundedError(data=[0, 1, 2, ...], name='JohnJ...hnJohn')"
+    )
+
+
+def test_limits_inherited():
+    kls = type("Err", (BoundedError,), {})
+
+    assert (
+        str(kls(data="a" * 100, name="John"))
+        == "Got aaaaaaaaaaaaa... for John"
+    )
+
+
+def test_no_limits():
+    kls = type("Err", (BoundedError,), {"__limits__": None})
+
+    err = kls(data=list(range(20)), name="John")
+
+    assert str(err) == f"Got {list(range(20))} for John"
+
+
+def test_limits_global(monkeypatch):
+    monkeypatch.setattr(root.Error, "__limits__", root.Limits(field=5))
+
+    err = errors.TemplateOnlyError(name="John" * 10, age=42)
+
+    assert str(err) == "The Jo... is 42 years old"
+
+
+def test_limits_frozen():
+    with pytest.raises(AttributeError):
+        BoundedError.__limits__.field = 100
@@ -0,0 +1,128 @@
+import copy
+import gc
+import pickle  # noqa: S403
+import reprlib
+
+import pytest
+
+from izulu import root
+from izulu import tools
+from tests import errors
+
+
+class Payload:
+    def __init__(self, data):
+        self.data = data
+
+    def __repr__(self):
+        return f"Payload({self.data!r})"
+
+
+class RefsError(errors.RootError):
+    __template__ = "Failed {row} with {body}"
+
+    row: Payload = root.weak()
+    body: str = root.summary()
+    note: str = root.weak(fallback=reprlib.repr)
+
+
+def _make_error(row, body=None, note=None):
+    return RefsError(row=row, body=body or list(range(100)), note=note or [])
+
+
+def test_store():
+    store = RefsError._Error__cls_store
+
+    assert set(store.refs) == {"row", "body", "note"}
+    assert store.defaults == frozenset()
+
+
+def test_missing_fields():
+    with pytest.raises(TypeError, match="Missing arguments"):
+        RefsError()
+
+
+def test_weak():
+    row = Payload("data")
+    err = _make_error(row)
+
+    assert err.row is row
+    assert err.as_dict()["row"] is row
+    assert err.as_kwargs()["row"] is row
+    assert err.kwargs_view()["row"] is row
+    assert str(err).startswith("Failed Payload('data') with ")
+
+
+def test_weak_dead():
+    err = _make_error(Payload("data"))
+    gc.collect()
+
+    assert err.row is root.DEAD_REFERENCE
+    assert err.as_dict()["row"] == "<dead reference>"
+    assert "row='<dead reference>'" in repr(err)
+    assert tools.dump(err)["fields"]["row"] == "<dead reference>"
+    assert str(err).startswith("Failed Payload('data') with ")
+
+
+def test_weak_fallback():
+    note = ["item"] * 100
+
+    err = _make_error(Payload("data"), note=note)
+
+    assert isinstance(err.note, root.Summary)
+    assert err.note == reprlib.repr(note)
+
+
+def test_weak_no_fallback():
+    class Err(errors.RootError):
+        value: list = root.weak()
+
+    value = [1, 2, 3]
+
+    assert Err(value=value).value is value
+
+
+def test_summary():
+    body = list(range(100))
+
+    err = _make_error(Payload("data"), body=body)
+
+    assert isinstance(err.body, root.Summary)
+    assert err.body == reprlib.repr(body)
+    assert err.as_kwargs()["body"] == reprlib.repr(body)
+    assert str(err).endswith(f"with {reprlib.repr(body)}")
+
+
+def test_summary_func():
+    class Err(errors.RootError):
+        __template__ = "Got {body} bytes"
+
+        body: str = root.summary(lambda v: str(len(v)))
+
+    err = Err(body=b"x" * 1000)
+
+    assert str(err) == "Got 1000 bytes"
+    assert err.body == "1000"
+
+
+def test_pickling():
+    row = Payload("data")
+    err = _make_error(row)
+
+    resurrected = pickle.loads(pickle.dumps(err))  # noqa: S301
+
+    assert resurrected.body == err.body
+    assert resurrected.note == err.note
+    assert resurrected.row is root.DEAD_REFERENCE
+    assert str(resurrected) == str(err)
+
+
+def test_copy():
+    row = Payload("data")
+    err = _make_error(row)
+
+    shallow = copy.copy(err)
+
+    assert shallow.row is row
+    assert shallow.body == err.body
+    assert str(shallow) == str(err)
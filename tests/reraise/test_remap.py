@@ -0,0 +1,188 @@
+import sys
+
+import pytest
+
+from izulu import _reraise
+from izulu import root
+from izulu import tools
+
+requires_groups = pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="exception groups require Python 3.11+",
+)
+
+
+class RemapError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Remapped"
+    __reraising__ = (
+        (KeyError, None),
+        ((ValueError, TypeError), _reraise.t_ext.Self),
+    )
+
+
+class GreedyError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Greedy"
+    __reraising__ = True
+
+
+class FatalError(_reraise.FatalMixin, Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("exc", "remapped"),
+    [
+        (ValueError(), True),
+        (TypeError(), True),
+        (KeyError(), False),
+        (LookupError(), False),
+        (RemapError(), False),
+        (FatalError(), False),
+    ],
+)
+@pytest.mark.parametrize("original_over_none", [True, False])
+def test_remap(exc, remapped, original_over_none):
+    result = RemapError.remap(exc, original_over_none=original_over_none)
+
+    if remapped:
+        assert type(result) is RemapError
+    elif original_over_none:
+        assert result is exc
+    else:
+        assert result is None
+
+
+def test_remap_greedy():
+    assert type(GreedyError.remap(KeyError())) is GreedyError
+    assert GreedyError.remap(FatalError()) is None
+
+
+def test_remap_many():
+    orig = ValueError()
+    items = [1, orig, KeyError(), None, "result", ValueError()]
+
+    result = RemapError.remap_many(items)
+
+    assert len(result) == len(items)
+    assert result[0::3] == [1, None]
+    assert result[2] is items[2]
+    assert result[4] == "result"
+    assert type(result[1]) is RemapError
+    assert type(result[5]) is RemapError
+    assert result[1] is not result[5]
+    assert result[1].__cause__ is orig
+
+
+def test_remap_many_resolves_once_per_type(monkeypatch):
+    calls = []
+    resolve = RemapError._ReraisingMixin__resolve
+
+    def fake_resolve(reraising, exc_type):
+        calls.append(exc_type)
+        return resolve(reraising, exc_type)
+
+    monkeypatch.setattr(RemapError, "_ReraisingMixin__resolve", fake_resolve)
+
+    RemapError.remap_many([ValueError(), KeyError(), ValueError(), 1] * 10)
+
+    assert calls == [ValueError, KeyError]
+
+
+def test_remap_many_reraising_override():
+    result = RemapError.remap_many(
+        [KeyError()],
+        reraising=((KeyError, _reraise.t_ext.Self),),
+    )
+
+    assert type(result[0]) is RemapError
+
+
+@requires_groups
+def test_remap_group():
+    leaf = ValueError()
+    untouched = KeyError()
+    nested = ExceptionGroup("nested", [TypeError(), untouched])  # noqa: F821
+    cause = RuntimeError()
+    group = ExceptionGroup("group", [leaf, nested])  # noqa: F821
+    group.__cause__ = cause
+
+    result = RemapError.remap_group(group)
+
+    assert result is not group
+    assert result.message == "group"
+    assert result.__cause__ is cause
+    remapped, new_nested = result.exceptions
+    assert type(remapped) is RemapError
+    assert remapped.__cause__ is leaf
+    assert new_nested.message == "nested"
+    assert type(new_nested.exceptions[0]) is RemapError
+    assert new_nested.exceptions[1] is untouched
+
+
+@requires_groups
+def test_remap_group_untouched():
+    group = ExceptionGroup("group", [KeyError(), LookupError()])  # noqa: F821
+
+    assert RemapError.remap_group(group) is group
+
+
+@requires_groups
+def test_remap_many_groups():
+    group = ExceptionGroup("group", [ValueError()])  # noqa: F821
+
+    (result,) = RemapError.remap_many([group])
+
+    assert type(result.exceptions[0]) is RemapError
+
+
+@pytest.mark.parametrize("compact", [None, 3])
+def test_remap_compact(compact):
+    excs = [ValueError(i) for i in range(10)]
+    for exc, cause in zip(excs, excs[1:]):
+        exc.__cause__ = cause
+
+    RemapError.remap(excs[0], compact=compact)
+
+    length = len(tuple(tools.error_chain(excs[0])))
+    assert length == (compact or len(excs))
+
+
+def test_remap_compact_not_remapped():
+    exc = KeyError()
+    exc.__cause__ = KeyError()
+
+    RemapError.remap(exc, compact=3)
+
+    assert exc.__cause__ is not None
+
+
+def test_reraise_compact():
+    cause = ValueError("root")
+    for i in range(10):
+        cause = _raise_in_reraise(ValueError(i), cause)
+
+    chain = tuple(tools.error_chain(cause))
+    assert len(chain) == 4  # noqa: PLR2004
+    assert str(chain[-1]) == "root"
+
+
+def _raise_in_reraise(exc, cause):
+    try:
+        with RemapError.reraise(compact=3):
+            raise exc from cause
+    except RemapError as e:
+        return e
+
+
+def test_reraise_detach():
+    orig = None
+    try:
+        with RemapError.reraise(detach=True):
+            orig = ValueError()
+            raise orig
+    except RemapError as e:
+        exc = e
+
+    assert exc.__cause__ is orig
+    assert orig.__traceback__ is None
+    assert tools.traceback_snapshot(orig)
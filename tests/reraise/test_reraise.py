@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+
+from izulu import _reraise
+from izulu import root
+from izulu import tools
+
+
+class RemapError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Remapped {value}"
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+    value: int
+
+
+def _frames(exc):
+    tb = exc.__traceback__
+    names = []
+    while tb is not None:
+        names.append(tb.tb_frame.f_globals["__name__"])
+        tb = tb.tb_next
+    return names
+
+
+def _fail(exc):
+    raise exc
+
+
+def test_reraise_context_manager():
+    orig = ValueError()
+
+    cm = RemapError.reraise(remap_kwargs=dict(value=1))
+    with pytest.raises(RemapError, match="Remapped 1") as exc_info, cm:
+        _fail(orig)
+
+    assert exc_info.value.__cause__ is orig
+
+
+def test_reraise_not_remapped():
+    orig = KeyError()
+
+    with pytest.raises(KeyError) as exc_info, RemapError.reraise():
+        _fail(orig)
+
+    assert exc_info.value is orig
+    assert "izulu._reraise" not in _frames(orig)
+
+
+def test_reraise_no_error():
+    with RemapError.reraise():
+        pass
+
+
+def test_reraise_base_exception():
+    with pytest.raises(KeyboardInterrupt), RemapError.reraise():
+        raise KeyboardInterrupt
+
+
+def test_reraise_decorator():
+    orig = ValueError()
+
+    @RemapError.reraise(remap_kwargs=dict(value=2))
+    def func(exc):
+        _fail(exc)
+
+    with pytest.raises(RemapError, match="Remapped 2") as exc_info:
+        func(orig)
+
+    assert exc_info.value.__cause__ is orig
+    assert func.__name__ == "func"
+
+
+def test_reraise_decorator_not_remapped():
+    @RemapError.reraise()
+    def func(value):
+        if value is None:
+            _fail(KeyError())
+        return value
+
+    assert func(42) == 42  # noqa: PLR2004
+    with pytest.raises(KeyError):
+        func(None)
+
+
+def test_async_reraise():
+    orig = ValueError()
+
+    async def func():
+        async with RemapError.async_reraise(remap_kwargs=dict(value=3)):
+            _fail(orig)
+
+    with pytest.raises(RemapError, match="Remapped 3") as exc_info:
+        asyncio.run(func())
+
+    assert exc_info.value.__cause__ is orig
+
+
+def test_async_reraise_decorator():
+    orig = ValueError()
+
+    @RemapError.async_reraise(remap_kwargs=dict(value=3))
+    async def func(exc):
+        await asyncio.sleep(0)
+        _fail(exc)
+
+    with pytest.raises(RemapError, match="Remapped 3") as exc_info:
+        asyncio.run(func(orig))
+
+    assert exc_info.value.__cause__ is orig
+    with pytest.raises(KeyError):
+        asyncio.run(func(KeyError()))
+
+
+@pytest.mark.parametrize("strip_frames", [True, False])
+def test_reraise_strip_frames(strip_frames):
+    @RemapError.reraise(remap_kwargs=dict(value=4), strip_frames=strip_frames)
+    def func(exc):
+        _fail(exc)
+
+    with pytest.raises(RemapError) as exc_info:
+        func(ValueError())
+
+    orig_frames = _frames(exc_info.value.__cause__)
+    assert ("izulu._reraise" in orig_frames) is not strip_frames
+    assert orig_frames[-1] == __name__
+    assert ("izulu._reraise" in _frames(exc_info.value)) is not strip_frames
+
+
+@pytest.mark.parametrize("strip_frames", [True, False])
+def test_reraise_context_strip_frames(strip_frames):
+    reraise = RemapError.reraise(
+        remap_kwargs=dict(value=6),
+        strip_frames=strip_frames,
+    )
+
+    with pytest.raises(RemapError) as exc_info, reraise:
+        _fail(ValueError())
+
+    assert ("izulu._reraise" in _frames(exc_info.value)) is not strip_frames
+
+
+@pytest.mark.parametrize("strip_frames", [True, False])
+def test_async_reraise_strip_frames(strip_frames):
+    async def func():
+        async with RemapError.async_reraise(
+            remap_kwargs=dict(value=7),
+            strip_frames=strip_frames,
+        ):
+            _fail(ValueError())
+
+    with pytest.raises(RemapError) as exc_info:
+        asyncio.run(func())
+
+    assert ("izulu._reraise" in _frames(exc_info.value)) is not strip_frames
+
+
+def test_strip_frames():
+    @RemapError.reraise(remap_kwargs=dict(value=5))
+    def func(exc):
+        _fail(exc)
+
+    with pytest.raises(RemapError) as exc_info:
+        func(ValueError())
+    exc = exc_info.value
+
+    assert tools.strip_frames(exc) is exc
+
+    assert "izulu._reraise" not in _frames(exc)
+    assert "izulu._reraise" not in _frames(exc.__cause__)
+    assert _frames(exc.__cause__) == [__name__, __name__]
+
+
+def test_strip_frames_no_chain():
+    @RemapError.reraise(remap_kwargs=dict(value=6))
+    def func(exc):
+        _fail(exc)
+
+    with pytest.raises(RemapError) as exc_info:
+        func(ValueError())
+    exc = exc_info.value
+
+    tools.strip_frames(exc, chain=False)
+
+    assert "izulu._reraise" in _frames(exc.__cause__)
+
+
+def test_strip_frames_not_raised():
+    exc = ValueError()
+
+    assert tools.strip_frames(exc) is exc
+    assert exc.__traceback__ is None
@@ -0,0 +1,177 @@
+import concurrent.futures as cf
+import pickle  # noqa: S403
+import threading
+import uuid
+from unittest import mock
+
+import pytest
+
+from izulu import _reraise
+from izulu import executors
+from izulu import root
+
+
+class TaskError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Task {task} failed"
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+    task: str
+    id: uuid.UUID = root.factory(default_factory=uuid.uuid4)
+
+
+class OtherError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Other failure of {task}"
+    __reraising__ = ((KeyError, _reraise.t_ext.Self),)
+
+    task: str
+
+
+class FrozenTaskError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Task {task} failed"
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+    __frozen__ = True
+
+    task: str
+
+
+class WeakError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Weak"
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+    obj: object = root.weak(fallback=repr)
+
+
+def fail(exc_type):
+    raise exc_type("boom")
+
+
+def succeed(value, *, scale=1):
+    return value * scale
+
+
+@pytest.fixture
+def threads():
+    with executors.RemappingExecutor(
+        cf.ThreadPoolExecutor(max_workers=2),
+        TaskError,
+        remap_kwargs=dict(task="import"),
+    ) as executor:
+        yield executor
+
+
+def test_result(threads):
+    assert threads.submit(succeed, 2, scale=3).result() == 6  # noqa: PLR2004
+    assert list(threads.map(succeed, [1, 2])) == [1, 2]
+
+
+def test_remapped_in_thread(threads):
+    future = threads.submit(fail, ValueError)
+
+    with pytest.raises(TaskError, match="Task import failed") as exc_info:
+        future.result()
+
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert exc_info.value.__suppress_context__
+
+
+def test_not_remapped(threads):
+    future = threads.submit(fail, KeyError)
+
+    with pytest.raises(KeyError):
+        future.result()
+
+
+def test_chain():
+    remapper = _reraise.chain(TaskError, OtherError)
+    with executors.RemappingExecutor(
+        cf.ThreadPoolExecutor(max_workers=1),
+        remapper,
+        remap_kwargs=dict(task="x"),
+    ) as executor:
+        future = executor.submit(fail, KeyError)
+
+        with pytest.raises(OtherError):
+            future.result()
+
+
+def test_cancel():
+    event = threading.Event()
+    with executors.RemappingExecutor(
+        cf.ThreadPoolExecutor(max_workers=1),
+        TaskError,
+    ) as executor:
+        running = executor.submit(event.wait)
+        pending = executor.submit(succeed, 1)
+
+        assert pending.cancel()
+        assert pending.cancelled()
+        assert not running.cancel()
+        event.set()
+        assert running.result() is True
+
+
+def test_cancel_notifies_waiters():
+    event = threading.Event()
+    with executors.RemappingExecutor(
+        cf.ThreadPoolExecutor(max_workers=1),
+        TaskError,
+    ) as executor:
+        executor.submit(event.wait)
+        pending = executor.submit(succeed, 1)
+
+        assert pending.cancel()
+        done, _ = cf.wait([pending], timeout=1)
+        event.set()
+
+    assert done == {pending}
+    assert list(cf.as_completed([pending], timeout=1)) == [pending]
+
+
+def test_transport_without_validation():
+    err = TaskError(task="import")
+    transport = executors._Remapped(err)
+
+    with mock.patch.object(TaskError, "__init__", side_effect=AssertionError):
+        restored = pickle.loads(pickle.dumps(transport)).error  # noqa: S301
+
+    assert type(restored) is TaskError
+    assert str(restored) == str(err)
+    assert restored.as_dict() == err.as_dict()
+    assert restored.id == err.id
+
+
+def test_transport_frozen():
+    err = FrozenTaskError(task="import")
+    hash(err)
+    transport = executors._Remapped(err)
+
+    restored = pickle.loads(pickle.dumps(transport)).error  # noqa: S301
+
+    assert "_Error__hash" not in restored.__dict__
+    assert restored == err
+    with pytest.raises(AttributeError):
+        restored.task = "export"
+
+
+def test_transport_fallback():
+    err = WeakError(obj=[1])
+    transport = executors._Remapped(err)
+
+    restored = pickle.loads(pickle.dumps(transport)).error  # noqa: S301
+
+    assert restored.as_dict() == dict(obj="[1]")
+
+
+def test_remapped_in_process():
+    with executors.RemappingExecutor(
+        cf.ProcessPoolExecutor(max_workers=1),
+        TaskError,
+        remap_kwargs=dict(task="import"),
+    ) as executor:
+        future = executor.submit(fail, ValueError)
+
+        with pytest.raises(TaskError, match="Task import failed") as exc_info:
+            future.result()
+
+    assert isinstance(exc_info.value.id, uuid.UUID)
+    assert "ValueError: boom" in str(exc_info.value.__cause__)
@@ -0,0 +1,178 @@
+import io
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from izulu import logs
+from izulu import tools
+from tests import errors
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("tests.izulu.logs")
+    logger.propagate = False
+    yield logger
+    logger.handlers.clear()
+
+
+def _error():
+    return errors.TemplateOnlyError(name="John", age=42)
+
+
+def _record(msg="message", exc=None):
+    exc_info = (type(exc), exc, None) if exc is not None else None
+    return logging.LogRecord("name", logging.ERROR, "", 0, msg, (), exc_info)
+
+
+def test_entry_from_record():
+    err = _error()
+    record = logging.LogRecord(
+        "name", logging.ERROR, "", 0, "%s-%d", ("a", 1), (type(err), err, None)
+    )
+
+    entry = logs.LogEntry.from_record(record)
+
+    assert entry.exc is err
+    assert entry.args == ("a", 1)
+    assert entry.message == "a-1"
+
+
+@pytest.mark.parametrize(
+    ("msg", "exc", "expected"),
+    [
+        ("message", None, False),
+        ("message", ValueError(), True),
+        (ValueError(), None, True),
+    ],
+)
+def test_error_of(msg, exc, expected):
+    record = _record(msg, exc)
+
+    assert (logs.error_of(record) is not None) is expected
+
+
+@pytest.mark.parametrize(
+    ("record", "izulu_only", "expected"),
+    [
+        (_record(), False, False),
+        (_record(exc=ValueError()), False, True),
+        (_record(exc=ValueError()), True, False),
+        (_record(exc=_error()), True, True),
+        (_record(_error()), True, True),
+    ],
+)
+def test_error_filter(record, izulu_only, expected):
+    assert logs.ErrorFilter(izulu_only=izulu_only).filter(record) is expected
+
+
+def test_error_filter_name():
+    assert not logs.ErrorFilter("other").filter(_record(exc=_error()))
+
+
+def _fail(age):
+    raise errors.TemplateOnlyError(name="John", age=age)
+
+
+def _log_failure(logger, age):
+    try:
+        _fail(age)
+    except errors.TemplateOnlyError:
+        logger.exception("failed %d", age)
+
+
+def test_writer_pipeline(logger):
+    stream = io.StringIO()
+    writer = logs.ErrorWriter(stream, batch_size=2, interval=0.01)
+    handler = logs.ErrorHandler(writer)
+    handler.addFilter(logs.ErrorFilter())
+    logger.addHandler(handler)
+
+    with writer:
+        logger.error("skipped")
+        for i in range(3):
+            _log_failure(logger, i)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == [
+        f"failed {i}" for i in range(3)
+    ]
+    assert lines[0]["level"] == "ERROR"
+    assert lines[0]["logger"] == logger.name
+    assert lines[2]["error"]["fields"] == dict(name="John", age=2)
+
+
+def test_writer_callable_sink_profile():
+    batches = []
+    profile = tools.DumpProfile("logs", include=frozenset({"age"}))
+    writer = logs.ErrorWriter(batches.append, profile=profile)
+
+    with writer:
+        writer.submit(logs.LogEntry.from_record(_record(exc=_error())))
+
+    (batch,) = batches
+    assert json.loads(batch[0])["error"]["fields"] == dict(age=42)
+
+
+def test_writer_policy_drop():
+    writer = logs.ErrorWriter(list, maxsize=2)
+    entry = logs.LogEntry.from_record(_record())
+
+    results = [writer.submit(entry) for _ in range(4)]
+
+    assert results == [True, True, False, False]
+    assert writer.dropped == 2  # noqa: PLR2004
+
+
+def test_writer_policy_sample():
+    batches = []
+    writer = logs.ErrorWriter(
+        batches.extend, maxsize=1, policy="sample", sample_every=2
+    )
+    entry = logs.LogEntry.from_record(_record())
+    assert writer.submit(entry)
+    assert not writer.submit(entry)
+
+    blocked = threading.Thread(target=writer.submit, args=(entry,))
+    blocked.start()
+    while writer.dropped < 2:  # noqa: PLR2004
+        time.sleep(0.001)
+    with writer:
+        blocked.join()
+
+    assert len(batches) == 2  # noqa: PLR2004
+    assert writer.dropped == 2  # noqa: PLR2004
+
+
+def test_writer_policy_block():
+    batches = []
+    writer = logs.ErrorWriter(batches.extend, maxsize=1, policy="block")
+    entry = logs.LogEntry.from_record(_record())
+    writer.submit(entry)
+
+    blocked = threading.Thread(target=writer.submit, args=(entry,))
+    blocked.start()
+    with writer:
+        blocked.join()
+
+    assert len(batches) == 2  # noqa: PLR2004
+    assert writer.dropped == 0
+
+
+def test_writer_sink_failure(capsys):
+    def _sink(lines):
+        raise RuntimeError(lines)
+
+    with logs.ErrorWriter(_sink) as writer:
+        writer.submit(logs.LogEntry.from_record(_record()))
+
+    assert writer.failed == 1
+    assert "RuntimeError" in capsys.readouterr().err
+
+
+def test_writer_unknown_policy():
+    with pytest.raises(ValueError, match="Unsupported policy"):
+        logs.ErrorWriter(list, policy="retry")
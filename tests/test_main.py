@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from izulu import __main__ as cli
+from izulu import _reraise
+from izulu import root
+from tests import errors
+
+
+class RulesError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = ((ValueError, None), (KeyError, None))
+
+
+class GreedyError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = True
+
+
+def _by_type(output):
+    return {row["type"]: row for row in json.loads(output)["classes"]}
+
+
+def test_sample_kwargs():
+    kwargs = cli.sample_kwargs(errors.DerivedError)
+
+    assert kwargs == dict(
+        name="sample", note="sample", surname="sample", box={}
+    )
+    errors.DerivedError(**kwargs)
+
+
+def test_discover():
+    classes = cli.discover("tests.errors")
+
+    assert errors.DerivedError in classes
+    assert RulesError not in classes
+    assert all(kls.__module__ == "tests.errors" for kls in classes)
+
+
+def test_profile_class():
+    report = cli.profile_class(errors.DerivedError, number=1, repeat=1)
+
+    assert report["type"] == "tests.errors.DerivedError"
+    assert report["init_ns"] > 0
+    assert report["render_ns"] > 0
+    assert set(report["factories"]) == {
+        "full_name",
+        "my_type",
+        "timestamp",
+        "updated_at",
+    }
+    assert report["rules"] is None
+    assert report["error"] is None
+
+
+def test_profile_class_rules():
+    rules = cli.profile_class(RulesError, number=1, repeat=1)
+    greedy = cli.profile_class(GreedyError, number=1, repeat=1)
+
+    assert rules["rules"] == 2  # noqa: PLR2004
+    assert greedy["rules"] is True
+
+
+def test_profile_class_error():
+    report = cli.profile_class(
+        errors.ComplexTemplateOnlyError,
+        number=1,
+        repeat=1,
+    )
+
+    assert report["init_ns"] is None
+    assert report["error"].startswith("ValueError: Failed to format")
+
+
+def test_main(capsys):
+    assert cli.main(["tests.errors", "--number", "1", "--repeat", "1"]) == 0
+
+    output = capsys.readouterr().out
+    assert json.loads(output)["module"] == "tests.errors"
+    rows = json.loads(output)["classes"]
+    assert rows[-1]["type"] == "tests.errors.ComplexTemplateOnlyError"
+    assert "tests.errors.MixedError" in _by_type(output)
+
+
+def test_main_output(tmp_path):
+    path = tmp_path / "report.json"
+
+    cli.main(
+        ["tests.test_main", "--number", "1", "--repeat", "1", "-o", str(path)]
+    )
+
+    assert set(_by_type(path.read_text())) == {
+        "tests.test_main.RulesError",
+        "tests.test_main.GreedyError",
+    }
+
+
+def test_main_unknown_module():
+    with pytest.raises(SystemExit):
+        cli.main(["tests.missing"])
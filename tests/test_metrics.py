@@ -0,0 +1,205 @@
+import collections
+import threading
+
+import pytest
+
+from izulu import _reraise
+from izulu import metrics
+from izulu import root
+from izulu import tools
+from tests import errors
+
+ROOT = "tests.errors.RootError"
+TEMPLATE = "tests.errors.TemplateOnlyError"
+
+
+class RemapError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = (((ValueError, KeyError), _reraise.t_ext.Self),)
+
+
+REMAP = f"{__name__}.RemapError"
+
+
+@pytest.fixture
+def enabled():
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+@pytest.fixture
+def timings(enabled):  # noqa: ARG001
+    metrics.enable(timings=True)
+
+
+def test_disabled_by_default():
+    init = root.Error.__init__
+    remap = _reraise.ReraisingMixin.__dict__["remap"]
+
+    errors.RootError()
+
+    assert not metrics.is_enabled()
+    assert metrics.snapshot()["errors"] == {}
+    assert root.Error.__init__ is init
+    assert _reraise.ReraisingMixin.__dict__["remap"] is remap
+
+
+def test_enable_disable():
+    init = root.Error.__init__
+    remap = _reraise.ReraisingMixin.__dict__["remap"]
+    suppressed = tools.suppress._suppressed
+
+    metrics.enable()
+    metrics.enable()
+    assert metrics.is_enabled()
+    assert root.Error.__init__ is not init
+
+    metrics.disable()
+    metrics.disable()
+    assert not metrics.is_enabled()
+    assert root.Error.__init__ is init
+    assert _reraise.ReraisingMixin.__dict__["remap"] is remap
+    assert tools.suppress._suppressed is suppressed
+    metrics.reset()
+
+
+@pytest.mark.usefixtures("enabled")
+def test_count_errors():
+    errors.RootError()
+    errors.RootError()
+    errors.TemplateOnlyError(name="John", age=42)
+    with pytest.raises(TypeError):
+        errors.TemplateOnlyError()
+
+    assert metrics.snapshot()["errors"] == {ROOT: 2, TEMPLATE: 1}
+
+
+@pytest.mark.usefixtures("enabled")
+def test_count_remaps():
+    RemapError.remap(ValueError())
+    RemapError.remap(TypeError())
+    with pytest.raises(RemapError), RemapError.reraise():
+        raise KeyError
+
+    assert metrics.snapshot()["remaps"] == {
+        ("builtins.ValueError", REMAP): 1,
+        ("builtins.KeyError", REMAP): 1,
+    }
+    assert metrics.snapshot()["errors"] == {REMAP: 2}
+
+
+@pytest.mark.usefixtures("enabled")
+def test_count_suppressed():
+    guard = tools.suppress(sink=collections.Counter())
+    for exc in (ValueError, KeyError, ValueError):
+        with guard:
+            raise exc
+
+    assert metrics.snapshot()["suppressed"] == {
+        "builtins.ValueError": 2,
+        "builtins.KeyError": 1,
+    }
+
+
+@pytest.mark.usefixtures("enabled")
+def test_no_timings():
+    errors.RootError()
+    RemapError.remap(ValueError())
+
+    assert metrics.snapshot()["init_seconds"] == {}
+    assert metrics.snapshot()["remap_seconds"] == {}
+
+
+@pytest.mark.usefixtures("timings")
+def test_timings():
+    errors.RootError()
+    errors.RootError()
+    RemapError.remap(ValueError())
+
+    snapshot = metrics.snapshot()
+    histogram = snapshot["init_seconds"][ROOT]
+    remap_histogram = snapshot["remap_seconds"]["builtins.ValueError", REMAP]
+
+    assert histogram["count"] == 2  # noqa: PLR2004
+    assert histogram["buckets"][float("inf")] == 2  # noqa: PLR2004
+    assert list(histogram["buckets"]) == list(metrics.BUCKETS)
+    assert histogram["sum"] > 0
+    assert remap_histogram["count"] == 1
+
+
+def _in_threads(func, n=4):
+    threads = [threading.Thread(target=func) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.usefixtures("timings")
+def test_threads():
+    def construct():
+        for _ in range(100):
+            errors.RootError()
+
+    _in_threads(construct)
+    errors.RootError()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["errors"] == {ROOT: 401}
+    assert snapshot["init_seconds"][ROOT]["count"] == 401  # noqa: PLR2004
+    # finished threads are merged once
+    assert metrics.snapshot() == snapshot
+
+
+@pytest.mark.usefixtures("enabled")
+def test_reset_threads():
+    _in_threads(errors.RootError)
+    errors.RootError()
+
+    metrics.reset()
+    errors.RootError()
+
+    assert metrics.snapshot()["errors"] == {ROOT: 1}
+
+
+@pytest.mark.usefixtures("enabled")
+def test_reset():
+    errors.RootError()
+
+    metrics.reset()
+
+    assert metrics.snapshot()["errors"] == {}
+
+
+@pytest.mark.usefixtures("enabled")
+def test_render_prometheus(tmp_path):
+    errors.RootError()
+    RemapError.remap(ValueError())
+    path = tmp_path / "izulu.prom"
+
+    text = metrics.render_prometheus(path)
+
+    assert path.read_text() == text
+    lines = text.splitlines()
+    assert "# TYPE izulu_errors_total counter" in lines
+    assert f'izulu_errors_total{{class="{ROOT}"}} 1' in lines
+    labels = f'source="builtins.ValueError",target="{REMAP}"'
+    assert f"izulu_remaps_total{{{labels}}} 1" in lines
+    assert "# TYPE izulu_init_seconds histogram" not in lines
+
+
+@pytest.mark.usefixtures("timings")
+def test_render_prometheus_histograms():
+    errors.RootError()
+
+    lines = metrics.render_prometheus().splitlines()
+
+    assert "# TYPE izulu_init_seconds histogram" in lines
+    assert f'izulu_init_seconds_bucket{{class="{ROOT}",le="+Inf"}} 1' in lines
+    assert f'izulu_init_seconds_count{{class="{ROOT}"}} 1' in lines
+
+
+def test_escape_labels():
+    assert metrics._escape('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
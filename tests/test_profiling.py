@@ -0,0 +1,183 @@
+import contextvars
+
+import pytest
+
+from izulu import _reraise
+from izulu import metrics
+from izulu import profiling
+from izulu import root
+from izulu import tools
+from tests import errors
+
+VAR = contextvars.ContextVar("var")
+
+
+class RemapError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Remapped {code}"
+    __reraising__ = (
+        (KeyError, None),
+        (ValueError, _reraise.t_ext.Self),
+    )
+    __contextvars__ = (VAR,)
+
+    code: int = 1
+
+
+@pytest.fixture
+def enabled():
+    profiling.reset()
+    profiling.enable()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_enable_disable():
+    init = root.Error.__init__
+    remap = _reraise.ReraisingMixin.__dict__["remap"]
+
+    profiling.enable()
+    profiling.enable()
+    assert profiling.is_enabled()
+    assert root.Error.__init__ is not init
+
+    profiling.disable()
+    profiling.disable()
+    assert not profiling.is_enabled()
+    assert root.Error.__init__ is init
+    assert _reraise.ReraisingMixin.__dict__["remap"] is remap
+
+
+def test_steps_restored():
+    steps = {name: root.Error.__dict__[name] for name in profiling._INIT_STEPS}
+    match = _reraise.ReraisingMixin.__dict__["_ReraisingMixin__match"]
+
+    profiling.enable()
+    assert (
+        root.Error.__dict__["_Error__finalize"]
+        is not steps["_Error__finalize"]
+    )
+    profiling.disable()
+
+    for name, step in steps.items():
+        assert root.Error.__dict__[name] is step
+    assert _reraise.ReraisingMixin.__dict__["_ReraisingMixin__match"] is match
+
+
+def test_not_combined_with_metrics():
+    metrics.enable()
+    try:
+        with pytest.raises(RuntimeError):
+            profiling.enable()
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+
+@pytest.mark.usefixtures("enabled")
+def test_metrics_not_combined_with_profiling():
+    with pytest.raises(RuntimeError):
+        metrics.enable()
+
+
+@pytest.mark.usefixtures("enabled")
+def test_profiled_init_behaviour():
+    err = errors.DerivedError(name="John", surname="Smith", note="n", box={})
+
+    assert str(err) == "The John Smith is 0 years old with n"
+    assert err.full_name == "John Smith"
+    assert err.as_kwargs() == dict(
+        name="John", surname="Smith", note="n", box={}
+    )
+    with pytest.raises(TypeError):
+        errors.TemplateOnlyError(name="John")
+
+
+@pytest.mark.usefixtures("enabled")
+def test_profiled_init_frozen():
+    kls = type("FrozenError", (errors.RootError,), {"__frozen__": True})
+
+    err = kls()
+
+    with pytest.raises(AttributeError):
+        err.name = "John"
+
+
+@pytest.mark.usefixtures("enabled")
+def test_profiled_init_context():
+    VAR.set("value")
+
+    err = RemapError()
+
+    assert tools.context_value(err, VAR) == "value"
+
+
+@pytest.mark.usefixtures("enabled")
+def test_profiled_remap_behaviour():
+    orig = ValueError()
+
+    remapped = RemapError.remap(orig, remap_kwargs=dict(code=2), detach=True)
+
+    assert str(remapped) == "Remapped 2"
+    assert RemapError.remap(KeyError()) is None
+    assert RemapError.remap(KeyError(), original_over_none=True).args == ()
+    assert RemapError.remap(TypeError(), reraising=True).code == 1
+    with pytest.raises(RemapError), RemapError.reraise():
+        raise ValueError
+
+
+@pytest.mark.usefixtures("enabled")
+def test_report_init():
+    for _ in range(3):
+        errors.TemplateOnlyError(name="John", age=42)
+
+    (row,) = profiling.report()
+
+    assert row["kind"] == "init"
+    assert row["type"] == "tests.errors.TemplateOnlyError"
+    assert row["count"] == 3  # noqa: PLR2004
+    assert tuple(row["phases"]) == profiling.INIT_PHASES
+    assert row["total_ns"] == sum(row["phases"].values())
+    assert row["mean_ns"] == row["total_ns"] / 3
+
+
+@pytest.mark.usefixtures("enabled")
+def test_report_remap():
+    RemapError.remap(ValueError())
+    RemapError.remap(KeyError())
+
+    rows = {row["kind"]: row for row in profiling.report()}
+
+    assert rows["remap"]["count"] == 2  # noqa: PLR2004
+    assert tuple(rows["remap"]["phases"]) == profiling.REMAP_PHASES
+    assert rows["remap"]["phases"]["construct"] > 0
+    assert rows["remap"]["phases"]["finalize"] > 0
+    assert all(rows["init"]["phases"].values())
+    assert rows["init"]["count"] == 1
+
+
+@pytest.mark.usefixtures("enabled")
+def test_report_sorted_limit():
+    for _ in range(100):
+        errors.MixedError(name="John", note="n")
+    errors.RootError()
+
+    rows = profiling.report(limit=1)
+
+    assert [row["type"] for row in rows] == ["tests.errors.MixedError"]
+
+
+@pytest.mark.usefixtures("enabled")
+def test_render_report():
+    errors.RootError()
+
+    (line,) = profiling.render_report().splitlines()
+
+    assert line.startswith("init  tests.errors.RootError")
+    assert "slowest: " in line
+
+
+def test_reset():
+    profiling.reset()
+
+    assert profiling.report() == []
@@ -4,6 +4,7 @@ import typing as t
 import pytest
 
 from izulu import _utils
+from izulu import root
 from tests import errors
 from tests import helpers as h
 
@@ -252,3 +253,96 @@ def test_split_cls_hints(kls, const_hints, inst_hints):
 )
 def test_get_cls_defaults(kls, attrs, expected):
     assert _utils.get_cls_defaults(kls, attrs) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "size", "expected"),
+    [
+        ("abcdef", None, "abcdef"),
+        ("abcdef", 6, "abcdef"),
+        ("abcdef", 5, "ab..."),
+        ("abcdef", 3, "abc"),
+        ("abcdef", 0, ""),
+    ],
+)
+def test_truncate(text, size, expected):
+    assert _utils.truncate(text, size) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "limits", "expected"),
+    [
+        ("a" * 20, root.Limits(field=10), "a" * 7 + "..."),
+        (list(range(10)), root.Limits(items=3), "[0, 1, 2, ...]"),
+        (
+            {"key": list(range(10))},
+            root.Limits(items=2, field=15),
+            "{'key': [0, ...",
+        ),
+        (42, root.Limits(field=1), "4"),
+        (12345, root.Limits(field=4), "1..."),
+        (dt, root.Limits(field=10), str(dt)[:7] + "..."),
+    ],
+)
+def test_bounded_str(value, limits, expected):
+    assert _utils.bounded_str(value, limits) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "limits", "expected"),
+    [
+        ("a" * 20, root.Limits(field=10), "'aa...aaa'"),
+        (list(range(10)), root.Limits(items=3), "[0, 1, 2, ...]"),
+        ([[[1]]], root.Limits(level=2), "[[[...]]]"),
+    ],
+)
+def test_bounded_repr(value, limits, expected):
+    assert _utils.bounded_repr(value, limits) == expected
+
+
+@pytest.mark.parametrize(
+    ("template", "kwargs", "limits", "expected"),
+    [
+        ("{a}", dict(a="a" * 20), root.Limits(), "a" * 20),
+        ("{a}", dict(a="a" * 20), root.Limits(field=5), "aa..."),
+        ("{a!r}", dict(a="a" * 20), root.Limits(field=7), "'a...a'"),
+        ("{a:>8}", dict(a="abc"), root.Limits(field=5), "     abc"),
+        ("{a:>8}", dict(a="a" * 10), root.Limits(field=5), "   aa..."),
+        ("{a:>8}", dict(a=123), root.Limits(field=5), "     123"),
+        ("{a:>12,}", dict(a=10**6), root.Limits(field=5), "   1,..."),
+        ("{a:.2f}", dict(a=12345.678), root.Limits(field=5), "12..."),
+        ("{a[1]}", dict(a=["x", "y" * 10]), root.Limits(field=4), "y..."),
+        ("{a.real}", dict(a=12345), root.Limits(field=4), "1..."),
+        (
+            "{a} {b}",
+            dict(a="a" * 5, b="b" * 5),
+            root.Limits(message=8),
+            "aaaaa...",
+        ),
+        (
+            "{a}",
+            dict(a=list(range(10**6))),
+            root.Limits(items=2),
+            "[0, 1, ...]",
+        ),
+    ],
+)
+def test_format_template_limits(template, kwargs, limits, expected):
+    assert _utils.format_template(template, kwargs, limits) == expected
+
+
+def test_format_template_limits_fail():
+    with pytest.raises(ValueError, match=r"a='a\.\.\.a'"):
+        _utils.format_template(
+            "{a} {b}",
+            dict(a="a" * 100),
+            root.Limits(field=7),
+        )
+
+
+def test_join_kwargs_limits():
+    kwargs = dict(a="a" * 100, b=list(range(100)))
+
+    result = _utils.join_kwargs(root.Limits(field=7, items=2), **kwargs)
+
+    assert result == "a='a...a', b=[0, ..."
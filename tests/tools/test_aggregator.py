@@ -0,0 +1,219 @@
+import gc
+import json
+import threading
+import weakref
+from unittest import mock
+
+import pytest
+
+from izulu import root
+from izulu import tools
+from tests import errors
+
+
+def _fingerprint(kls, suffix=""):
+    name = f"{kls.__module__}.{kls.__qualname__}"
+    if hasattr(kls, "__template__"):
+        name += f":{kls.__template__}"
+    return name + suffix
+
+
+def test_record_counts():
+    aggregator = tools.Aggregator()
+    for i in range(5):
+        aggregator.record(errors.TemplateOnlyError(name="John", age=i))
+    aggregator.record(ValueError("bad"))
+
+    summary = {s["fingerprint"]: s for s in aggregator.summary()}
+
+    assert len(aggregator) == 2  # noqa: PLR2004
+    izulu_summary = summary[_fingerprint(errors.TemplateOnlyError)]
+    assert izulu_summary["count"] == 5  # noqa: PLR2004
+    assert izulu_summary["type"] == "TemplateOnlyError"
+    assert izulu_summary["first_seen"] <= izulu_summary["last_seen"]
+    assert summary[_fingerprint(ValueError)]["count"] == 1
+
+
+def test_summary_keeps_counts():
+    aggregator = tools.Aggregator()
+    aggregator.record(ValueError())
+
+    assert aggregator.summary()[0]["count"] == 1
+    aggregator.record(ValueError())
+    assert aggregator.summary()[0]["count"] == 2  # noqa: PLR2004
+
+
+def test_record_fields():
+    aggregator = tools.Aggregator(fields=("name", "missing", "entity"))
+    aggregator.record(errors.MixedError(name="John", note=""))
+    aggregator.record(errors.MixedError(name="Jane", note=""))
+    aggregator.record(errors.MixedError(name="John", age=1, note=""))
+
+    summary = {s["fingerprint"]: s["count"] for s in aggregator.summary()}
+
+    prefix = _fingerprint(errors.MixedError)
+    assert summary == {
+        f"{prefix}:name='John',entity='The Entity'": 2,
+        f"{prefix}:name='Jane',entity='The Entity'": 1,
+    }
+
+
+def test_record_unhashable_fields():
+    aggregator = tools.Aggregator(fields=("box",))
+    kwargs = dict(name="John", surname="Smith", note="")
+    aggregator.record(errors.DerivedError(box={"a": 1}, **kwargs))
+    aggregator.record(errors.DerivedError(box={"a": 1}, **kwargs))
+
+    (summary,) = aggregator.summary()
+
+    assert summary["count"] == 2  # noqa: PLR2004
+    assert summary["fingerprint"].endswith(":box={'a': 1}")
+
+
+def test_samples_first():
+    aggregator = tools.Aggregator(samples=2)
+    for i in range(2):
+        aggregator.record(errors.TemplateOnlyError(name="John", age=i))
+
+    (summary,) = aggregator.summary()
+
+    assert [s["fields"]["age"] for s in summary["samples"]] == [0, 1]
+
+
+def test_samples_reservoir():
+    aggregator = tools.Aggregator(samples=2)
+    with mock.patch.object(tools, "dump", wraps=tools.dump) as dump:
+        for i in range(1000):
+            aggregator.record(errors.TemplateOnlyError(name="John", age=i))
+
+    (summary,) = aggregator.summary()
+
+    assert summary["count"] == 1000  # noqa: PLR2004
+    assert len(summary["samples"]) == 2  # noqa: PLR2004
+    # ~ samples * (1 + ln(count / samples)) dumps are expected
+    assert dump.call_count < 100  # noqa: PLR2004
+
+
+def test_samples_profile():
+    profile = tools.DumpProfile("aggregator", include=frozenset({"age"}))
+    aggregator = tools.Aggregator(samples=1, profile=profile)
+    aggregator.record(errors.TemplateOnlyError(name="John", age=1))
+
+    (summary,) = aggregator.summary()
+
+    assert summary["samples"][0]["fields"] == dict(age=1)
+
+
+def test_samples_not_retained():
+    aggregator = tools.Aggregator(samples=1)
+    err = errors.TemplateOnlyError(name="John", age=1)
+    ref = weakref.ref(err)
+    aggregator.record(err)
+
+    del err
+    gc.collect()
+
+    assert ref() is None
+    (summary,) = aggregator.summary()
+    assert summary["samples"][0]["fields"] == dict(name="John", age=1)
+
+
+def test_no_samples():
+    aggregator = tools.Aggregator(samples=0)
+    aggregator.record(ValueError())
+
+    (summary,) = aggregator.summary()
+
+    assert summary["count"] == 1
+    assert summary["type"] == "ValueError"
+    assert summary["samples"] == []
+
+
+def test_flush_resets():
+    received = []
+    aggregator = tools.Aggregator(sink=received.append)
+    aggregator.record(ValueError())
+
+    flushed = aggregator.flush()
+
+    assert received == [flushed]
+    assert len(aggregator) == 0
+    assert aggregator.flush() == []
+    assert received == [flushed]
+
+
+def test_flush_file(tmp_path):
+    path = tmp_path / "errors.jsonl"
+    aggregator = tools.Aggregator(sink=path)
+    aggregator.record(ValueError())
+    aggregator.flush()
+    aggregator.record(KeyError())
+    aggregator.flush()
+
+    lines = path.read_text().splitlines()
+
+    assert [json.loads(line)["type"] for line in lines] == [
+        "ValueError",
+        "KeyError",
+    ]
+
+
+def test_periodic_flush():
+    flushed = threading.Event()
+    aggregator = tools.Aggregator(
+        sink=lambda _: flushed.set(),
+        interval=0.01,
+    )
+
+    with aggregator:
+        aggregator.record(ValueError())
+        assert flushed.wait(5)
+
+
+def test_stop_flushes():
+    received = []
+    with tools.Aggregator(sink=received.extend, interval=60) as aggregator:
+        aggregator.record(ValueError())
+
+    assert [s["count"] for s in received] == [1]
+
+
+@pytest.mark.parametrize("n_threads", [8])
+def test_record_threads(n_threads):
+    per_thread = 1000
+    aggregator = tools.Aggregator(fields=("age",))
+    barrier = threading.Barrier(n_threads)
+
+    def _work(i):
+        barrier.wait()
+        for _ in range(per_thread):
+            aggregator.record(errors.TemplateOnlyError(name="n", age=i % 2))
+
+    threads = [
+        threading.Thread(target=_work, args=(i,)) for i in range(n_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counts = sorted(s["count"] for s in aggregator.summary())
+    assert counts == [n_threads // 2 * per_thread] * 2
+
+
+def test_record_missing_fields():
+    kls = type(
+        "Err",
+        (errors.AttributesOnlyError,),
+        {"__toggles__": root.Toggles.NONE},
+    )
+    aggregator = tools.Aggregator(fields=("name",))
+    aggregator.record(kls())
+    aggregator.record(kls(name="John"))
+
+    fingerprints = sorted(s["fingerprint"] for s in aggregator.summary())
+
+    assert fingerprints == [
+        _fingerprint(kls, ":name='John'"),
+        _fingerprint(kls, ":name=None"),
+    ]
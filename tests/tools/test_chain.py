@@ -0,0 +1,131 @@
+import sys
+from unittest import mock
+
+import pytest
+
+from izulu import tools
+from tests import errors
+
+requires_groups = pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="exception groups require Python 3.11+",
+)
+
+
+def _make_chain(*excs):
+    for exc, cause in zip(excs, excs[1:]):
+        exc.__cause__ = cause
+    return excs[0]
+
+
+def _make_context_chain():
+    exc = ValueError("second")
+    exc.__context__ = KeyError("first")
+    return exc
+
+
+def test_error_chain():
+    excs = (ValueError(), KeyError(), errors.RootError(), TypeError())
+    exc = _make_chain(*excs)
+
+    assert tuple(tools.error_chain(exc)) == excs
+
+
+def test_error_iter():
+    excs = (errors.RootError(), KeyError(), TypeError())
+
+    assert tuple(_make_chain(*excs)) == excs
+
+
+def test_error_chain_cycle():
+    excs = (ValueError(), KeyError(), TypeError())
+    exc = _make_chain(*excs)
+    excs[-1].__cause__ = excs[1]
+
+    assert tuple(tools.error_chain(exc)) == excs
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 3, 10])
+def test_error_chain_max_depth(depth):
+    excs = (ValueError(), KeyError(), TypeError())
+    exc = _make_chain(*excs)
+
+    assert tuple(tools.error_chain(exc, max_depth=depth)) == excs[: depth + 1]
+
+
+def test_error_chain_context():
+    exc = _make_context_chain()
+
+    assert len(tuple(tools.error_chain(exc))) == 1
+    assert [e.args for e in tools.error_chain(exc, context=True)] == [
+        ("second",),
+        ("first",),
+    ]
+
+
+def test_error_chain_suppressed_context():
+    exc = ValueError()
+    exc.__context__ = KeyError()
+    exc.__suppress_context__ = True
+
+    assert tuple(tools.error_chain(exc, context=True)) == (exc,)
+
+
+@requires_groups
+def test_error_chain_groups():
+    leaf_cause = KeyError()
+    leaf = _make_chain(ValueError(), leaf_cause)
+    other = TypeError()
+    group = ExceptionGroup("group", [leaf, other])  # noqa: F821
+    cause = RuntimeError()
+    group.__cause__ = cause
+
+    assert tuple(tools.error_chain(group)) == (group, cause)
+    assert tuple(tools.error_chain(group, groups=True)) == (
+        group,
+        cause,
+        leaf,
+        leaf_cause,
+        other,
+    )
+    assert tuple(tools.error_chain(group, groups=True, max_depth=1)) == (
+        group,
+        cause,
+        leaf,
+        other,
+    )
+
+
+def test_root_cause():
+    excs = (ValueError(), KeyError(), TypeError())
+    exc = _make_chain(*excs)
+
+    assert tools.root_cause(exc) is excs[-1]
+    assert tools.root_cause(exc, max_depth=1) is excs[1]
+    assert tools.root_cause(excs[-1]) is excs[-1]
+    assert tools.root_cause(_make_context_chain(), context=True).args == (
+        "first",
+    )
+
+
+def test_find_cause():
+    excs = (ValueError(), KeyError("first"), KeyError("second"))
+    exc = _make_chain(*excs)
+
+    assert tools.find_cause(exc, KeyError) is excs[1]
+    assert tools.find_cause(exc, (TypeError, LookupError)) is excs[1]
+    assert tools.find_cause(exc, TypeError) is None
+    assert tools.find_cause(exc, KeyError, max_depth=0) is None
+
+
+def test_find_cause_stops_early():
+    excs = (ValueError(), KeyError(), TypeError(), RuntimeError())
+    exc = _make_chain(*excs)
+
+    with mock.patch(
+        "izulu.tools._next_link",
+        side_effect=tools._next_link,
+    ) as next_link:
+        assert tools.find_cause(exc, KeyError) is excs[1]
+
+    next_link.assert_called_once_with(exc, context=False)
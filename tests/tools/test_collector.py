@@ -0,0 +1,224 @@
+import sys
+
+import pytest
+
+from izulu import _reraise
+from izulu import root
+from izulu import tools
+from tests import errors
+
+requires_groups = pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="exception groups require Python 3.11+",
+)
+
+
+class RemapError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Remapped"
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+
+class FatalError(_reraise.FatalMixin, Exception):
+    pass
+
+
+def test_add_groups_by_class():
+    collector = tools.Collector()
+    spec = errors.TemplateOnlyError.defer(name="John", age=42)
+    exc = ValueError("boom")
+
+    collector.add(spec)
+    collector.add(exc)
+    collector.defer(errors.TemplateOnlyError, name="Mary", age=7)
+
+    assert len(collector) == len((spec, exc, spec))
+    assert collector._records == {
+        errors.TemplateOnlyError: [
+            spec,
+            errors.TemplateOnlyError.defer(name="Mary", age=7),
+        ],
+        ValueError: [exc],
+    }
+
+
+def test_defer_validates():
+    collector = tools.Collector()
+
+    with pytest.raises(TypeError):
+        collector.defer(errors.TemplateOnlyError, name="John")
+
+    assert not collector
+
+
+def test_caps():
+    collector = tools.Collector(cap=2, caps={errors.RootError: 1})
+
+    for i in range(5):
+        collector.defer(errors.TemplateOnlyError, name="John", age=i)
+        collector.add(KeyError(i))
+
+    assert collector._records[errors.TemplateOnlyError] == [
+        errors.TemplateOnlyError.defer(name="John", age=0),
+    ]
+    assert [e.args for e in collector._records[KeyError]] == [(0,), (1,)]
+    assert collector.overflow == {errors.TemplateOnlyError: 4, KeyError: 3}
+
+
+def test_zero_cap():
+    collector = tools.Collector(caps={KeyError: 0})
+
+    collector.add(KeyError("dropped"))
+
+    assert not collector
+    assert len(collector) == 0
+    assert collector.overflow == {KeyError: 1}
+    assert collector.summary() == {
+        "KeyError": dict(count=1, omitted=1, errors=[]),
+    }
+
+
+@requires_groups
+def test_zero_cap_group():
+    collector = tools.Collector(caps={KeyError: 0})
+    collector.add(KeyError("dropped"))
+    collector.add(ValueError("stored"))
+
+    with pytest.raises(ExceptionGroup) as exc_info:  # noqa: F821
+        collector.raise_if_any()
+
+    value_group, key_group = exc_info.value.exceptions
+    assert value_group.message == "ValueError: 1 error(s)"
+    assert key_group.message == "KeyError: 0 error(s) (+1 omitted)"
+    (omitted,) = key_group.exceptions
+    assert isinstance(omitted, tools.OmittedErrors)
+    assert omitted.kls is KeyError
+    assert omitted.count == 1
+    assert str(omitted) == "1 KeyError error(s) omitted"
+
+
+@requires_groups
+def test_raise_if_any_only_dropped():
+    collector = tools.Collector(cap=0)
+    collector.add(KeyError("dropped"))
+    collector.add(KeyError("dropped"))
+
+    with pytest.raises(ExceptionGroup) as exc_info:  # noqa: F821
+        collector.raise_if_any()
+
+    (key_group,) = exc_info.value.exceptions
+    (omitted,) = key_group.exceptions
+    assert omitted.count == 2  # noqa: PLR2004
+
+
+def test_catch():
+    collector = tools.Collector()
+
+    for i in range(3):
+        with collector.catch(KeyError):
+            raise KeyError(i)
+
+    with pytest.raises(ValueError, match="boom"), collector.catch(KeyError):
+        raise ValueError("boom")
+
+    assert [e.args for e in collector._records[KeyError]] == [(0,), (1,), (2,)]
+
+
+def test_catch_remapper():
+    collector = tools.Collector()
+    orig = ValueError("boom")
+
+    with collector.catch(remapper=RemapError):
+        raise orig
+    with collector.catch(remapper=RemapError):
+        raise KeyError("not remapped")
+
+    (remapped,) = collector._records[RemapError]
+    assert remapped.__cause__ is orig
+    assert len(collector._records[KeyError]) == 1
+
+
+def test_catch_fatal():
+    collector = tools.Collector()
+
+    with pytest.raises(FatalError), collector.catch(remapper=RemapError):
+        raise FatalError
+
+    assert not collector
+
+
+def test_summary():
+    collector = tools.Collector(cap=1)
+    collector.defer(errors.TemplateOnlyError, name="John", age=42)
+    collector.defer(errors.TemplateOnlyError, name="Mary", age=7)
+
+    assert collector.summary() == {
+        "TemplateOnlyError": dict(
+            count=2,
+            omitted=1,
+            errors=[
+                dict(
+                    type="TemplateOnlyError",
+                    reason="The John is 42 years old",
+                    fields=dict(name="John", age=42),
+                    details={},
+                ),
+            ],
+        ),
+    }
+
+
+@requires_groups
+def test_group_nested():
+    collector = tools.Collector(cap=1)
+    collector.defer(errors.TemplateOnlyError, name="John", age=42)
+    collector.defer(errors.TemplateOnlyError, name="Mary", age=7)
+    collector.add(KeyError("key"))
+
+    group = collector.group("Validation failed")
+
+    assert group.message == "Validation failed"
+    tpl_group, key_group = group.exceptions
+    assert tpl_group.message == "TemplateOnlyError: 1 error(s) (+1 omitted)"
+    tpl_error, omitted = tpl_group.exceptions
+    assert str(tpl_error) == "The John is 42 years old"
+    assert str(omitted) == "1 TemplateOnlyError error(s) omitted"
+    assert key_group.message == "KeyError: 1 error(s)"
+
+
+@requires_groups
+def test_group_flat():
+    collector = tools.Collector()
+    collector.defer(errors.TemplateOnlyError, name="John", age=42)
+    collector.add(KeyError("key"))
+
+    group = collector.group(nested=False)
+
+    assert [type(e) for e in group.exceptions] == [
+        errors.TemplateOnlyError,
+        KeyError,
+    ]
+
+
+@requires_groups
+def test_group_flat_omitted():
+    collector = tools.Collector(cap=1)
+    collector.add(KeyError("stored"))
+    collector.add(KeyError("dropped"))
+
+    group = collector.group(nested=False)
+
+    assert [type(e) for e in group.exceptions] == [
+        KeyError,
+        tools.OmittedErrors,
+    ]
+
+
+@requires_groups
+def test_raise_if_any():
+    collector = tools.Collector()
+    collector.raise_if_any()
+
+    collector.add(KeyError("key"))
+
+    with pytest.raises(ExceptionGroup):  # noqa: F821
+        collector.raise_if_any()
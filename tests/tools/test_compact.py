@@ -0,0 +1,144 @@
+import gc
+import weakref
+
+import pytest
+
+from izulu import _reraise
+from izulu import root
+from izulu import tools
+
+
+def _make_chain(*excs):
+    for exc, cause in zip(excs, excs[1:]):
+        exc.__cause__ = cause
+        exc.__context__ = cause
+    return excs[0]
+
+
+class RetryError(_reraise.ReraisingMixin, root.Error):
+    __template__ = "Retry failed"
+    __reraising__ = ((ValueError, _reraise.t_ext.Self),)
+
+
+def _fail(exc, cause):
+    raise exc from cause
+
+
+def _retried(attempts):
+    err = None
+    for _ in range(attempts):
+        try:
+            with RetryError.reraise():
+                _fail(ValueError("timeout"), err)
+        except RetryError as e:  # noqa: PERF203
+            err = e
+    return err
+
+
+def _chain(exc):
+    return tuple(tools.error_chain(exc))
+
+
+def test_compacted_links():
+    inner = tools.CompactedLinks([KeyError(), KeyError()])
+
+    placeholder = tools.CompactedLinks([ValueError(), inner, KeyError()])
+
+    assert placeholder.count == 4  # noqa: PLR2004
+    assert placeholder.types == dict(ValueError=1, KeyError=3)
+    assert str(placeholder) == (
+        "4 chain link(s) compacted: ValueError x1, KeyError x3"
+    )
+
+
+def test_compact_chain_noop():
+    excs = (ValueError(), KeyError(), TypeError())
+    exc = _make_chain(*excs)
+
+    assert tools.compact_chain(exc, max_length=3) is exc
+    assert _chain(exc) == excs
+
+
+def test_compact_chain_collapse():
+    head = ValueError("head")
+    repeated = [KeyError("same") for _ in range(5)]
+    root = KeyError("same")
+    exc = _make_chain(head, *repeated, root)
+
+    tools.compact_chain(exc)
+
+    chain = _chain(exc)
+    assert chain[:2] == (head, repeated[0])
+    assert isinstance(chain[2], tools.CompactedLinks)
+    assert chain[2].types == dict(KeyError=4)
+    assert chain[3] is root
+    assert len(chain) == 4  # noqa: PLR2004
+    assert repeated[0].__context__ is chain[2]
+
+
+def test_compact_chain_collapse_retries():
+    exc = _retried(50)
+    links = _chain(exc)
+    assert len(links) == 100  # noqa: PLR2004
+
+    tools.compact_chain(exc)
+
+    chain = _chain(exc)
+    assert chain[:2] == links[:2]
+    assert isinstance(chain[2], tools.CompactedLinks)
+    assert chain[2].types == dict(RetryError=49, ValueError=48)
+    assert chain[3] is links[-1]
+    assert len(chain) == 4  # noqa: PLR2004
+
+
+def test_compact_chain_collapse_not_repeated():
+    excs = [KeyError("a"), ValueError("b"), KeyError("a"), KeyError("c")]
+    exc = _make_chain(*excs)
+
+    tools.compact_chain(exc)
+
+    assert _chain(exc) == tuple(excs)
+
+
+def test_compact_chain_collapse_disabled():
+    excs = [KeyError("same") for _ in range(5)]
+    exc = _make_chain(*excs)
+
+    tools.compact_chain(exc, collapse=False)
+
+    assert _chain(exc) == tuple(excs)
+
+
+@pytest.mark.parametrize("max_length", [3, 4, 10])
+def test_compact_chain_max_length(max_length):
+    excs = [ValueError(i) for i in range(50)]
+    exc = _make_chain(*excs)
+
+    tools.compact_chain(exc, max_length=max_length)
+
+    chain = _chain(exc)
+    assert len(chain) == max_length
+    assert chain[: max_length - 2] == tuple(excs[: max_length - 2])
+    assert chain[-2].count == len(excs) - max_length + 1
+    assert chain[-1] is excs[-1]
+
+
+def test_compact_chain_too_short():
+    with pytest.raises(ValueError, match="less than 3"):
+        tools.compact_chain(ValueError(), max_length=2)
+
+
+class LinkError(Exception):
+    pass
+
+
+def test_compact_chain_releases_links():
+    excs = [LinkError(i) for i in range(10)]
+    ref = weakref.ref(excs[5])
+    exc = _make_chain(*excs)
+    excs = None
+
+    tools.compact_chain(exc, max_length=3)
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,118 @@
+import asyncio
+import contextvars
+from unittest import mock
+
+from izulu import _reraise
+from izulu import root
+from izulu import tools
+from tests import errors
+
+REQUEST_ID = contextvars.ContextVar("request_id")
+TENANT = contextvars.ContextVar("tenant", default="public")
+
+
+class ContextError(errors.RootError):
+    __contextvars__ = (REQUEST_ID, TENANT)
+
+
+class RemapError(_reraise.ReraisingMixin, root.Error):
+    __reraising__ = True
+    __contextvars__ = (REQUEST_ID,)
+
+
+def _in_context(func, **values):
+    ctx = contextvars.copy_context()
+
+    def _run():
+        REQUEST_ID.set(values.get("request_id"))
+        return func()
+
+    return ctx.run(_run)
+
+
+def test_capture_disabled_by_default():
+    err = errors.RootError()
+
+    assert root.Error.__contextvars__ is None
+    assert tools.captured_context(err) is None
+    assert tools.context_value(err, REQUEST_ID, "none") == "none"
+
+
+def test_capture_on_init():
+    err = _in_context(ContextError, request_id="abc")
+
+    assert isinstance(tools.captured_context(err), contextvars.Context)
+    assert tools.context_value(err, REQUEST_ID) == "abc"
+    assert REQUEST_ID.get(None) is None
+
+
+def test_capture_unset_variable():
+    err = ContextError()
+
+    assert tools.context_value(err, REQUEST_ID, "none") == "none"
+    assert tools.context_value(err, TENANT) is None
+
+
+def test_capture_keeps_snapshot():
+    err = _in_context(ContextError, request_id="abc")
+
+    _in_context(lambda: tools.capture_context(err), request_id="xyz")
+
+    assert tools.context_value(err, REQUEST_ID) == "abc"
+
+
+def test_capture_builtin_exception():
+    exc = _in_context(
+        lambda: tools.capture_context(ValueError()), request_id=1
+    )
+
+    assert tools.context_value(exc, REQUEST_ID) == 1
+
+
+def test_capture_on_remap():
+    def _remap():
+        return RemapError.remap(ValueError())
+
+    err = _in_context(_remap, request_id="abc")
+
+    assert tools.context_value(err, REQUEST_ID) == "abc"
+
+
+def test_capture_on_remap_once():
+    def _remap():
+        with mock.patch.object(
+            contextvars, "copy_context", wraps=contextvars.copy_context
+        ) as copy_context:
+            err = RemapError.remap(ValueError())
+        copy_context.assert_called_once_with()
+        return err
+
+    _in_context(_remap, request_id="abc")
+
+
+def test_capture_async_task():
+    async def _handle(request_id):
+        REQUEST_ID.set(request_id)
+        await asyncio.sleep(0)
+        return ContextError()
+
+    async def _main():
+        return await asyncio.gather(_handle("a"), _handle("b"))
+
+    first, second = asyncio.run(_main())
+
+    assert tools.context_value(first, REQUEST_ID) == "a"
+    assert tools.context_value(second, REQUEST_ID) == "b"
+
+
+def test_dump_context():
+    err = _in_context(ContextError, request_id="abc")
+
+    details = tools.dump(err)["details"]
+
+    assert details["context"] == dict(request_id="abc")
+
+
+def test_dump_no_context():
+    assert "context" not in tools.dump(errors.RootError())["details"]
+    assert "context" not in tools.dump(ValueError())["details"]
@@ -0,0 +1,120 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from izulu import tools
+from tests import errors
+
+
+@pytest.fixture
+def register():
+    registered = []
+
+    def _register(kls, provider):
+        registered.append((kls, provider))
+        return tools.register_details(kls, provider)
+
+    yield _register
+    for kls, provider in registered:
+        tools.unregister_details(kls, provider)
+
+
+def test_no_providers():
+    err = ValueError("x")
+
+    assert tools.dump(err)["details"] == {}
+    assert tools.dump(errors.RootError())["details"] == {}
+    assert tools._DETAILS_ATTR not in err.__dict__
+
+
+def test_provider_is_lazy(register):
+    provider = register(errors.RootError, mock.Mock(return_value=dict(a=1)))
+
+    err = errors.RootError()
+    provider.assert_not_called()
+
+    assert tools.dump(err)["details"] == dict(a=1)
+    provider.assert_called_once_with(err)
+
+
+def test_provider_cached_on_instance(register):
+    provider = register(errors.RootError, mock.Mock(return_value=dict(a=1)))
+    err = errors.RootError()
+
+    tools.dump(err, err)
+    tools.dump(err)
+
+    provider.assert_called_once_with(err)
+
+
+def test_provider_mro(register):
+    register(errors.RootError, lambda _: dict(a=1, b=1))
+    register(errors.MixedError, lambda _: dict(b=2, c=2))
+    register(errors.DerivedError, lambda _: dict(c=3))
+
+    err = errors.MixedError(name="John", note="...")
+    derived = errors.DerivedError(name="John", surname="S", note="", box={})
+
+    assert tools.dump(errors.RootError())["details"] == dict(a=1, b=1)
+    assert tools.dump(err)["details"] == dict(a=1, b=2, c=2)
+    assert tools.dump(derived)["details"] == dict(a=1, b=2, c=3)
+
+
+def test_provider_builtin_exception(register):
+    register(LookupError, lambda _: dict(kind="lookup"))
+
+    assert tools.dump(KeyError("x"))["details"] == dict(kind="lookup")
+    assert tools.dump(ValueError("x"))["details"] == {}
+
+
+def test_provider_registered_later(register):
+    tools.dump(errors.RootError())
+
+    register(errors.RootError, lambda _: dict(a=1))
+
+    assert tools.dump(errors.RootError())["details"] == dict(a=1)
+
+
+def test_details_not_shared(register):
+    register(errors.RootError, lambda _: dict(a=1))
+    err = errors.RootError()
+
+    tools.dump(err)["details"]["a"] = 2
+
+    assert tools.collect_details(err) == dict(a=1)
+
+
+def test_details_with_profile(register):
+    register(errors.RootError, lambda _: dict(a=1, host="db"))
+    profile = tools.DumpProfile(
+        "details",
+        redact=frozenset({"host"}),
+        details=lambda _: dict(b=2),
+    )
+
+    dumped = tools.dump(errors.RootError(), profile=profile)
+
+    assert dumped["details"] == dict(a=1, host=tools.REDACTED, b=2)
+
+
+def test_unregister_unknown():
+    tools.unregister_details(errors.RootError, lambda _: {})
+
+
+def test_details_threads(register):
+    register(errors.RootError, lambda _: dict(thread=threading.get_ident()))
+    err = errors.RootError()
+    results = []
+
+    def worker():
+        results.append(tools.collect_details(err))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # all threads get the first stored result
+    assert len({result["thread"] for result in results}) == 1
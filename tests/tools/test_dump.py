@@ -0,0 +1,129 @@
+import pytest
+
+from izulu import root
+from izulu import tools
+from tests import errors
+
+
+@pytest.fixture
+def mixed():
+    return errors.MixedError(name="John" * 10, age=42, note="n")
+
+
+def test_dump_no_profile(mixed):
+    assert tools.dump(mixed)["fields"] == mixed.as_dict(wide=True)
+
+
+def test_dump_profile_all_fields(mixed):
+    profile = tools.DumpProfile("all")
+
+    dumped = tools.dump(mixed, profile=profile)
+
+    assert dumped["fields"] == mixed.as_dict(wide=True)
+    assert dumped["reason"] == str(mixed)
+    assert dumped["details"] == {}
+
+
+def test_dump_profile_include(mixed):
+    profile = tools.DumpProfile("inc", include={"name", "entity"})
+
+    dumped = tools.dump(mixed, profile=profile)
+
+    assert dumped["fields"] == dict(name="John" * 10, entity="The Entity")
+
+
+def test_dump_profile_exclude(mixed):
+    profile = tools.DumpProfile("exc", exclude={"timestamp", "my_type"})
+
+    dumped = tools.dump(mixed, profile=profile)
+
+    assert dumped["fields"] == dict(
+        name="John" * 10,
+        age=42,
+        note="n",
+        entity="The Entity",
+    )
+
+
+def test_dump_profile_redact(mixed):
+    profile = tools.DumpProfile(
+        "redact",
+        include={"name", "age"},
+        redact={"name", "host"},
+        details=lambda e: dict(host="db", kind=type(e).__name__),
+    )
+
+    dumped = tools.dump(mixed, profile=profile)
+
+    assert dumped["fields"] == dict(name=tools.REDACTED, age=42)
+    assert dumped["details"] == dict(host=tools.REDACTED, kind="MixedError")
+
+
+def test_dump_profile_limits():
+    profile = tools.DumpProfile(
+        "bounded",
+        limits=root.Limits(field=10, message=12, items=2),
+    )
+    err = errors.DerivedError(
+        name="John",
+        surname="Smith" * 10,
+        note="n",
+        box=dict(a=1, b=2, c=3),
+    )
+
+    dumped = tools.dump(err, profile=profile)
+
+    assert dumped["reason"] == "The John ..."
+    assert dumped["fields"]["age"] == 0
+    assert dumped["fields"]["surname"] == "SmithSm..."
+    assert dumped["fields"]["box"] == "{'a': 1..."
+    assert dumped["fields"]["location"] == "(50.3, ..."
+    assert dumped["fields"]["entity"] == "The Entity"
+
+
+def test_dump_profile_missing_fields():
+    kls = type(
+        "Err",
+        (errors.AttributesWithStaticDefaultsError,),
+        {"__toggles__": root.Toggles.NONE},
+    )
+    profile = tools.DumpProfile("all")
+
+    dumped = tools.dump(kls(), profile=profile)
+
+    assert dumped["fields"] == dict(age=0)
+
+
+def test_dump_profile_compiled_once(mixed):
+    profile = tools.DumpProfile("once", include={"name"})
+
+    tools.dump(mixed, mixed, profile=profile)
+    plan = profile.compile(errors.MixedError)
+
+    assert plan is profile.compile(errors.MixedError)
+    assert [f[0] for f in plan.fields] == ["name"]
+    assert plan.consts == {}
+
+
+def test_dump_profile_builtin_exception():
+    profile = tools.DumpProfile("bounded", limits=root.Limits(message=5))
+
+    dumped = tools.dump(ValueError("long message"), profile=profile)
+
+    assert dumped["fields"] is None
+    assert dumped["reason"] == "lo..."
+
+
+def test_dump_profile_by_name(mixed):
+    profile = tools.register_profile(tools.DumpProfile("test-name", {"age"}))
+
+    dumped = tools.dump(mixed, ValueError(), profile="test-name")
+
+    assert tools.get_profile("test-name") is profile
+    assert dumped[0]["fields"] == dict(age=42)
+    assert dumped[1]["fields"] is None
+
+
+def test_dump_profile_unknown():
+    with pytest.raises(ValueError, match="Unknown dump profile"):
+        tools.dump(ValueError(), profile="missing")
@@ -0,0 +1,86 @@
+import sys
+
+from izulu import tools
+from tests import errors
+
+
+class PayloadError(errors.RootError):
+    __template__ = "Payload of {size} items"
+
+    size: int
+    payload: list
+
+
+def _fail():
+    raise ValueError("x" * 1000)
+
+
+def _raise_with_cause():
+    try:
+        _fail()
+    except ValueError as e:
+        raise errors.MixedError(name="John", note="...") from e
+
+
+def _catch(func):
+    try:
+        func()
+    except Exception as e:  # noqa: BLE001
+        return e
+    raise AssertionError
+
+
+def test_parts_sum_up_to_total():
+    size = tools.deep_sizeof(errors.MixedError(name="John", note="..."))
+
+    assert size["total"] == sum(v for k, v in size.items() if k != "total")
+    assert size["object"] > 0
+    assert size["kwargs"] > 0
+    assert size["args"] > 0
+    assert size["traceback"] == 0
+    assert size["chain"] == 0
+
+
+def test_kwargs_are_deep():
+    payload = ["item"] * 1000
+
+    size = tools.deep_sizeof(PayloadError(size=1000, payload=payload))
+
+    assert size["kwargs"] >= sys.getsizeof(payload)
+    # attributes share objects with kwargs, so they are accounted once
+    assert size["attributes"] == 0
+
+
+def test_factories():
+    err = errors.AttributesWithDynamicDefaultsError(name="John")
+
+    assert tools.deep_sizeof(err)["factories"] > 0
+
+
+def test_extra():
+    err = errors.RootError()
+    before = tools.deep_sizeof(err)["extra"]
+    provider = tools.register_details(errors.RootError, lambda _: dict(a=1))
+
+    try:
+        tools.collect_details(err)
+    finally:
+        tools.unregister_details(errors.RootError, provider)
+
+    assert tools.deep_sizeof(err)["extra"] > before
+
+
+def test_traceback_and_chain():
+    err = _catch(_raise_with_cause)
+
+    size = tools.deep_sizeof(err)
+
+    assert size["traceback"] > 0
+    assert size["chain"] > 1000  # noqa: PLR2004
+
+
+def test_builtin_exception():
+    size = tools.deep_sizeof(ValueError("boom"))
+
+    assert size["kwargs"] == 0
+    assert size["total"] > 0
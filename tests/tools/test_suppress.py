@@ -0,0 +1,187 @@
+import asyncio
+import collections
+import inspect
+import threading
+from unittest import mock
+
+import pytest
+
+from izulu import tools
+
+LOGGER = "izulu.tools"
+
+
+def _run(guard, excs):
+    for exc in excs:
+        with guard:
+            raise exc
+
+
+def _messages(caplog):
+    return [r.getMessage() for r in caplog.records if r.name == LOGGER]
+
+
+def test_suppress(caplog):
+    with tools.suppress():
+        raise ValueError("bad")
+
+    assert _messages(caplog) == ["Error suppressed: bad"]
+
+
+def test_suppress_not_matched():
+    with pytest.raises(KeyError), tools.suppress(ValueError):
+        raise KeyError
+
+
+def test_suppress_exclude():
+    with pytest.raises(KeyError), tools.suppress(exclude=KeyError):
+        raise KeyError
+
+
+def test_suppress_no_exception(caplog):
+    with tools.suppress():
+        pass
+
+    assert _messages(caplog) == []
+
+
+def test_suppress_sampling(caplog):
+    guard = tools.suppress(first=2, every=3, interval=3600)
+
+    _run(guard, [ValueError(i) for i in range(10)])
+
+    assert _messages(caplog) == [
+        "Error suppressed: 0",
+        "Error suppressed: 1",
+        "Error suppressed (occurrence #5): 4",
+        "Error suppressed (occurrence #8): 7",
+    ]
+    assert guard.counts == {"": 10}
+
+    caplog.clear()
+    guard.flush()
+
+    assert _messages(caplog) == ["Errors suppressed without logging: 6 (all)"]
+
+
+def test_suppress_every_only(caplog):
+    guard = tools.suppress(every=3, interval=3600)
+
+    _run(guard, [ValueError(i) for i in range(7)])
+
+    assert _messages(caplog) == [
+        "Error suppressed (occurrence #3): 2",
+        "Error suppressed (occurrence #6): 5",
+    ]
+
+
+def test_suppress_first_only(caplog):
+    guard = tools.suppress(first=1, interval=3600)
+
+    _run(guard, [ValueError(i) for i in range(5)])
+
+    assert _messages(caplog) == ["Error suppressed: 0"]
+
+
+@pytest.mark.parametrize(
+    ("dedup", "expected"),
+    [
+        ("type", {"ValueError": 3, "KeyError": 1}),
+        (
+            "fingerprint",
+            {"ValueError: a": 2, "ValueError: b": 1, "KeyError: 'a'": 1},
+        ),
+    ],
+)
+def test_suppress_dedup(caplog, dedup, expected):
+    guard = tools.suppress(first=1, dedup=dedup, interval=3600)
+
+    _run(
+        guard,
+        [ValueError("a"), ValueError("b"), KeyError("a"), ValueError("a")],
+    )
+
+    assert guard.counts == expected
+    assert len(_messages(caplog)) == len(expected)
+
+
+def test_suppress_summary_interval(caplog):
+    guard = tools.suppress(first=1, dedup="type", interval=10)
+
+    with mock.patch("time.monotonic", return_value=guard._summarized_at + 5):
+        _run(guard, [ValueError(), ValueError()])
+    with mock.patch("time.monotonic", return_value=guard._summarized_at + 11):
+        _run(guard, [ValueError()])
+
+    assert _messages(caplog) == [
+        "Error suppressed: ",
+        "Errors suppressed without logging: 2 (ValueError)",
+    ]
+
+
+def test_suppress_sink(caplog):
+    sink = collections.Counter()
+    guard = tools.suppress(sink=sink)
+
+    _run(guard, [ValueError(), KeyError(), ValueError()])
+
+    assert sink == {"ValueError": 2, "KeyError": 1}
+    assert _messages(caplog) == []
+
+
+def test_suppress_threads():
+    guard = tools.suppress(dedup="type", first=0)
+
+    def worker():
+        for _ in range(1000):
+            with guard:
+                raise ValueError
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert guard.counts == {"ValueError": 4000}
+
+
+def test_suppress_decorator(caplog):
+    @tools.suppress(ValueError, exclude=TypeError)
+    def func(exc=None):
+        if exc is not None:
+            raise exc
+        return 42
+
+    assert func() == 42  # noqa: PLR2004
+    assert func(ValueError("bad")) is None
+    with pytest.raises(TypeError):
+        func(TypeError())
+    with pytest.raises(KeyError):
+        func(KeyError())
+    assert func.__name__ == "func"
+    assert _messages(caplog) == ["Error suppressed: bad"]
+
+
+def test_suppress_async_decorator(caplog):
+    @tools.suppress(ValueError, exclude=TypeError)
+    async def func(exc=None):
+        await asyncio.sleep(0)
+        if exc is not None:
+            raise exc
+        return 42
+
+    assert inspect.iscoroutinefunction(func)
+    assert asyncio.run(func()) == 42  # noqa: PLR2004
+    assert asyncio.run(func(ValueError("bad"))) is None
+    with pytest.raises(TypeError):
+        asyncio.run(func(TypeError()))
+    with pytest.raises(KeyError):
+        asyncio.run(func(KeyError()))
+    assert func.__name__ == "func"
+    assert _messages(caplog) == ["Error suppressed: bad"]
+
+
+def test_suppress_unknown_dedup():
+    with pytest.raises(ValueError, match="Unsupported dedup"):
+        tools.suppress(dedup="message")
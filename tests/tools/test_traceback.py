@@ -0,0 +1,113 @@
+import gc
+import pickle  # noqa: S403
+
+from izulu import tools
+from tests import errors
+
+
+class PayloadError(Exception):
+    pass
+
+
+class Payload:
+    pass
+
+
+def _fail(exc, payload):  # noqa: ARG001
+    raise exc
+
+
+def _raise(exc, payload, cause):
+    if cause is None:
+        _fail(exc, payload)
+    try:
+        _fail(cause, payload)
+    except Exception as e:
+        raise exc from e
+
+
+def _catch(exc, payload=None, cause=None):
+    try:
+        _raise(exc, payload, cause)
+    except Exception as e:  # noqa: BLE001
+        return e
+
+
+def test_detach_traceback():
+    exc = _catch(PayloadError())
+
+    snapshot = tools.detach_traceback(exc)
+
+    assert exc.__traceback__ is None
+    assert tools.traceback_snapshot(exc) == snapshot
+    assert [frame.name for frame in snapshot] == ["_catch", "_raise", "_fail"]
+    assert all(frame.filename == __file__ for frame in snapshot)
+    assert all(isinstance(frame.lineno, int) for frame in snapshot)
+
+
+def test_detach_traceback_chain():
+    exc = _catch(PayloadError(), cause=KeyError())
+    cause = exc.__cause__
+
+    tools.detach_traceback(exc)
+
+    assert cause.__traceback__ is None
+    assert [f.name for f in tools.traceback_snapshot(cause)] == [
+        "_raise",
+        "_fail",
+    ]
+
+
+def test_detach_traceback_no_chain():
+    exc = _catch(PayloadError(), cause=KeyError())
+
+    tools.detach_traceback(exc, chain=False)
+
+    assert exc.__cause__.__traceback__ is not None
+
+
+def test_detach_traceback_not_raised():
+    exc = PayloadError()
+
+    assert tools.detach_traceback(exc) == ()
+    assert tools.traceback_snapshot(exc) == ()
+
+
+def test_detach_traceback_releases_frames():
+    payload = Payload()
+    exc = _catch(PayloadError(), payload=payload)
+    payload_id = id(payload)
+    del payload
+
+    tools.detach_traceback(exc)
+    gc.collect()
+
+    assert all(id(obj) != payload_id for obj in gc.get_objects())
+
+
+def test_error_detach_traceback():
+    err = _catch(errors.TemplateOnlyError(name="John", age=42))
+
+    snapshot = err.detach_traceback()
+
+    assert err.__traceback__ is None
+    assert snapshot == tools.traceback_snapshot(err)
+
+
+def test_snapshot_pickling():
+    err = _catch(errors.TemplateOnlyError(name="John", age=42))
+    snapshot = err.detach_traceback()
+
+    resurrected = pickle.loads(pickle.dumps(err))  # noqa: S301
+
+    assert tools.traceback_snapshot(resurrected) == snapshot
+    assert str(resurrected) == str(err)
+
+
+def test_snapshot_dump():
+    err = _catch(errors.TemplateOnlyError(name="John", age=42))
+    snapshot = err.detach_traceback()
+
+    dumped = tools.dump(err)
+
+    assert dumped["details"] == dict(traceback=[list(f) for f in snapshot])